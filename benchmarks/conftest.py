@@ -0,0 +1,43 @@
+"""Benchmark suite of MongoEngine, run with pytest-benchmark::
+
+    pytest benchmarks/ --benchmark-json=benchmarks.json
+
+The benchmarks run against mongomock by default, so that they measure the
+time spent in MongoEngine rather than in the server and work offline. Pass
+``--live`` to run them against a MongoDB server instead (``--host`` defaults
+to localhost).
+"""
+
+import pytest
+
+from mongoengine import connect, disconnect
+
+BENCHMARK_DB = "mongoengine_benchmark_test"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("mongoengine benchmarks")
+    group.addoption(
+        "--live",
+        action="store_true",
+        default=False,
+        help="Run the benchmarks against a MongoDB server rather than mongomock",
+    )
+    group.addoption(
+        "--host",
+        default="mongodb://localhost:27017",
+        help="URI of the MongoDB server used with --live",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def connection(request):
+    if request.config.getoption("--live"):
+        client = connect(db=BENCHMARK_DB, host=request.config.getoption("--host"))
+    else:
+        mongomock = pytest.importorskip("mongomock")
+        client = connect(db=BENCHMARK_DB, mongo_client_class=mongomock.MongoClient)
+    client.drop_database(BENCHMARK_DB)
+    yield client
+    client.drop_database(BENCHMARK_DB)
+    disconnect()
@@ -1,8 +1,8 @@
-from timeit import repeat
+import pytest
 
-import mongoengine
 from mongoengine import (
     BooleanField,
+    DateTimeField,
     Document,
     EmailField,
     EmbeddedDocument,
@@ -11,126 +11,140 @@ from mongoengine import (
     ListField,
     StringField,
 )
+from mongoengine.base import EmbeddedDocumentList
 
-mongoengine.connect(db="mongoengine_benchmark_test", w=1)
 
+class Book(Document):
+    name = StringField()
+    pages = IntField()
+    tags = ListField(StringField())
+    is_published = BooleanField()
+    author_email = EmailField()
 
-def timeit(f, n=10000):
-    return min(repeat(f, repeat=3, number=n)) / float(n)
 
+class Contact(EmbeddedDocument):
+    name = StringField()
+    title = StringField()
+    address = StringField()
 
-def test_basic():
-    class Book(Document):
-        name = StringField()
-        pages = IntField()
-        tags = ListField(StringField())
-        is_published = BooleanField()
-        author_email = EmailField()
 
-    Book.drop_collection()
+class Company(Document):
+    name = StringField()
+    founded = DateTimeField()
+    contacts = ListField(EmbeddedDocumentField(Contact))
 
-    def init_book():
-        return Book(
-            name="Always be closing",
-            pages=100,
-            tags=["self-help", "sales"],
-            is_published=True,
-            author_email="alec@example.com",
-        )
 
-    print("Doc initialization: %.3fus" % (timeit(init_book, 1000) * 10**6))
+def init_book():
+    return Book(
+        name="Always be closing",
+        pages=100,
+        tags=["self-help", "sales"],
+        is_published=True,
+        author_email="alec@example.com",
+    )
 
-    b = init_book()
-    print("Doc getattr: %.3fus" % (timeit(lambda: b.name, 10000) * 10**6))
 
-    print(
-        "Doc setattr: %.3fus"
-        % (timeit(lambda: setattr(b, "name", "New name"), 10000) * 10**6)  # noqa B010
+def init_company():
+    return Company(
+        name="MongoDB, Inc.",
+        contacts=[
+            Contact(name="Contact %d" % x, title="CEO", address="Address %d" % x)
+            for x in range(1000)
+        ],
     )
 
-    print("Doc to mongo: %.3fus" % (timeit(b.to_mongo, 1000) * 10**6))
 
-    print("Doc validation: %.3fus" % (timeit(b.validate, 1000) * 10**6))
+@pytest.fixture
+def book():
+    Book.drop_collection()
+    return init_book().save()
+
+
+@pytest.fixture
+def company():
+    Company.drop_collection()
+    return init_company().save()
+
+
+def test_init(benchmark):
+    benchmark(init_book)
+
+
+def test_getattr(benchmark, book):
+    benchmark(lambda: book.name)
+
+
+def test_setattr(benchmark, book):
+    benchmark(setattr, book, "name", "New name")
+
+
+def test_to_mongo(benchmark, book):
+    benchmark(book.to_mongo)
+
+
+def test_validate(benchmark, book):
+    benchmark(book.validate)
+
 
+def test_to_json(benchmark, book):
+    benchmark(book.to_json)
+
+
+def test_delta(benchmark, book):
+    book.name = "New name"
+    book.tags.append("classic")
+    benchmark(book._delta)
+
+
+def test_save(benchmark, book):
     def save_book():
-        b._mark_as_changed("name")
-        b._mark_as_changed("tags")
-        b.save()
+        book._mark_as_changed("name")
+        book._mark_as_changed("tags")
+        book.save()
+
+    benchmark(save_book)
 
-    print("Save to database: %.3fus" % (timeit(save_book, 100) * 10**6))
 
-    son = b.to_mongo()
-    print("Load from SON: %.3fus" % (timeit(lambda: Book._from_son(son), 1000) * 10**6))
+def test_load_from_database(benchmark, book):
+    benchmark(lambda: Book.objects[0])
 
-    print("Load from database: %.3fus" % (timeit(lambda: Book.objects[0], 100) * 10**6))
+
+def test_init_save_delete(benchmark):
+    Book.drop_collection()
 
     def create_and_delete_book():
-        b = init_book()
-        b.save()
-        b.delete()
+        init_book().save().delete()
 
-    print(
-        "Init + save to database + delete: %.3fms"
-        % (timeit(create_and_delete_book, 10) * 10**3)
-    )
+    benchmark(create_and_delete_book)
 
 
-def test_big_doc():
-    class Contact(EmbeddedDocument):
-        name = StringField()
-        title = StringField()
-        address = StringField()
+def test_big_doc_to_mongo(benchmark, company):
+    benchmark(company.to_mongo)
 
-    class Company(Document):
-        name = StringField()
-        contacts = ListField(EmbeddedDocumentField(Contact))
 
-    Company.drop_collection()
+def test_big_doc_validate(benchmark, company):
+    benchmark(company.validate)
 
-    def init_company():
-        return Company(
-            name="MongoDB, Inc.",
-            contacts=[
-                Contact(name="Contact %d" % x, title="CEO", address="Address %d" % x)
-                for x in range(1000)
-            ],
-        )
 
-    company = init_company()
-    print("Big doc to mongo: %.3fms" % (timeit(company.to_mongo, 100) * 10**3))
+def test_big_doc_to_json(benchmark, company):
+    benchmark(company.to_json)
 
-    print("Big doc validation: %.3fms" % (timeit(company.validate, 1000) * 10**3))
 
-    company.save()
+def test_big_doc_delta(benchmark, company):
+    company.contacts[500].title = "CTO"
+    company.contacts.append(Contact(name="New contact"))
+    benchmark(company._delta)
 
+
+def test_big_doc_save(benchmark, company):
     def save_company():
         company._mark_as_changed("name")
         company._mark_as_changed("contacts")
         company.save()
 
-    print("Save to database: %.3fms" % (timeit(save_company, 100) * 10**3))
-
-    son = company.to_mongo()
-    print(
-        "Load from SON: %.3fms" % (timeit(lambda: Company._from_son(son), 100) * 10**3)
-    )
-
-    print(
-        "Load from database: %.3fms" % (timeit(lambda: Company.objects[0], 100) * 10**3)
-    )
-
-    def create_and_delete_company():
-        c = init_company()
-        c.save()
-        c.delete()
-
-    print(
-        "Init + save to database + delete: %.3fms"
-        % (timeit(create_and_delete_company, 10) * 10**3)
-    )
+    benchmark(save_company)
 
 
-if __name__ == "__main__":
-    test_basic()
-    print("-" * 100)
-    test_big_doc()
+def test_big_doc_embedded_list_get(benchmark):
+    contacts = EmbeddedDocumentList(init_company().contacts, None, "contacts")
+    benchmark(lambda: [contacts.get(name="Contact %d" % x) for x in range(0, 1000, 10)])
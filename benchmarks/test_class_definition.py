@@ -0,0 +1,58 @@
+"""Time spent defining the Document classes of a large synthetic schema,
+i.e. the import time of the modules defining them.
+"""
+
+from mongoengine import (
+    DateTimeField,
+    Document,
+    EmbeddedDocument,
+    EmbeddedDocumentField,
+    FloatField,
+    IntField,
+    ListField,
+    PointField,
+    ReferenceField,
+    StringField,
+)
+
+MODELS = 500
+
+
+def define_schema():
+    models = []
+    for idx in range(MODELS):
+        address = type(EmbeddedDocument)(
+            "Address%d" % idx,
+            (EmbeddedDocument,),
+            {"__module__": __name__, "city": StringField(), "location": PointField()},
+        )
+        attrs = {
+            "__module__": __name__,
+            "name": StringField(required=True, max_length=100),
+            "slug": StringField(unique=True),
+            "count": IntField(default=0),
+            "score": FloatField(),
+            "created": DateTimeField(),
+            "tags": ListField(StringField()),
+            "address": EmbeddedDocumentField(address),
+            "meta": {"indexes": ["name", ("count", "-created")]},
+        }
+        if models:
+            attrs["parent"] = ReferenceField(models[-1])
+        models.append(type(Document)("Model%d" % idx, (Document,), attrs))
+    return models
+
+
+def test_define_schema(benchmark):
+    benchmark.pedantic(define_schema, rounds=5, warmup_rounds=1)
+
+
+def test_build_index_specs(benchmark):
+    models = define_schema()
+
+    def build():
+        for model in models:
+            model._meta.pop("index_specs", None)
+            model._meta["index_specs"]
+
+    benchmark(build)
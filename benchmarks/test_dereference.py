@@ -0,0 +1,61 @@
+import pytest
+
+from mongoengine import (
+    Document,
+    GenericReferenceField,
+    ListField,
+    ReferenceField,
+    StringField,
+)
+
+
+class Writer(Document):
+    name = StringField()
+
+
+class Novel(Document):
+    title = StringField()
+    author = ReferenceField(Writer)
+    reviewers = ListField(ReferenceField(Writer))
+    related = ListField(GenericReferenceField())
+
+
+@pytest.fixture(scope="module")
+def novels():
+    Writer.drop_collection()
+    Novel.drop_collection()
+    writers = Writer.objects.insert([Writer(name="Writer %d" % x) for x in range(100)])
+    Novel.objects.insert(
+        [
+            Novel(
+                title="Novel %d" % x,
+                author=writers[x],
+                reviewers=writers[:10],
+                related=writers[x:][:5],
+            )
+            for x in range(100)
+        ]
+    )
+    yield
+    Writer.drop_collection()
+    Novel.drop_collection()
+
+
+def test_lazy_reference_per_document(benchmark, novels):
+    benchmark(lambda: [novel.author.name for novel in Novel.objects])
+
+
+def test_select_related(benchmark, novels):
+    benchmark(lambda: [novel.author.name for novel in Novel.objects.select_related()])
+
+
+def test_list_of_references(benchmark, novels):
+    benchmark(lambda: [novel.reviewers[0].name for novel in Novel.objects])
+
+
+def test_list_of_generic_references(benchmark, novels):
+    benchmark(lambda: [novel.related[0].name for novel in Novel.objects])
+
+
+def test_no_dereference(benchmark, novels):
+    benchmark(lambda: [novel.reviewers for novel in Novel.objects.no_dereference()])
@@ -0,0 +1,152 @@
+"""Conversion of the raw documents returned by pymongo into Documents, which
+dominates the iteration over large querysets.
+"""
+
+import datetime
+
+import pytest
+from bson import ObjectId
+
+from mongoengine import (
+    ArrayField,
+    DateTimeField,
+    DictField,
+    Document,
+    DynamicDocument,
+    EmbeddedDocument,
+    EmbeddedDocumentField,
+    FloatField,
+    IntField,
+    ListField,
+    StringField,
+    VectorField,
+)
+
+
+class Flat(Document):
+    name = StringField()
+    email = StringField()
+    age = IntField()
+    score = FloatField()
+    created = DateTimeField()
+
+
+class Address(EmbeddedDocument):
+    street = StringField()
+    city = StringField()
+    zip_code = StringField()
+
+
+class Profile(EmbeddedDocument):
+    bio = StringField()
+    address = EmbeddedDocumentField(Address)
+    links = DictField()
+
+
+class Nested(Document):
+    name = StringField()
+    profile = EmbeddedDocumentField(Profile)
+
+
+class ListHeavy(Document):
+    name = StringField()
+    scores = ListField(IntField())
+    tags = ListField(StringField())
+    addresses = ListField(EmbeddedDocumentField(Address))
+
+
+class Dynamic(DynamicDocument):
+    name = StringField()
+
+
+class SeriesList(Document):
+    samples = ListField(FloatField())
+
+
+class SeriesArray(Document):
+    samples = ArrayField("d")
+
+
+class SeriesBinary(Document):
+    samples = ArrayField("d", binary=True)
+
+
+class EmbeddingList(Document):
+    embedding = ListField(FloatField())
+
+
+class EmbeddingVector(Document):
+    embedding = VectorField("float32", dim=768)
+
+
+@pytest.fixture(scope="module")
+def sons():
+    address = {"street": "5th Avenue", "city": "New York", "zip_code": "10001"}
+    return {
+        Flat: {
+            "_id": ObjectId(),
+            "name": "Ross",
+            "email": "ross@example.com",
+            "age": 42,
+            "score": 4.2,
+            "created": datetime.datetime(2020, 1, 1),
+        },
+        Nested: {
+            "_id": ObjectId(),
+            "name": "Ross",
+            "profile": {
+                "bio": "Paleontologist",
+                "address": address,
+                "links": {"home": "https://example.com", "blog": "https://blog"},
+            },
+        },
+        ListHeavy: {
+            "_id": ObjectId(),
+            "name": "Ross",
+            "scores": list(range(1000)),
+            "tags": ["tag%d" % idx for idx in range(100)],
+            "addresses": [dict(address, zip_code=str(idx)) for idx in range(100)],
+        },
+        Dynamic: dict(
+            {"_id": ObjectId(), "name": "Ross"},
+            **{"field%d" % idx: idx for idx in range(20)},
+        ),
+    }
+
+
+@pytest.mark.parametrize(
+    "document", [Flat, Nested, ListHeavy, Dynamic], ids=lambda cls: cls.__name__
+)
+def test_from_son(benchmark, sons, document):
+    benchmark(document._from_son, sons[document])
+
+
+@pytest.mark.parametrize(
+    "document", [Flat, Nested, ListHeavy, Dynamic], ids=lambda cls: cls.__name__
+)
+def test_from_son_and_access(benchmark, sons, document):
+    # Includes reading back every field of the loaded document
+    def load():
+        doc = document._from_son(sons[document])
+        return [doc[name] for name in doc]
+
+    benchmark(load)
+
+
+@pytest.mark.parametrize(
+    "document",
+    [SeriesList, SeriesArray, SeriesBinary],
+    ids=lambda cls: cls.__name__,
+)
+def test_from_son_time_series(benchmark, document):
+    # 10k samples, read back through the field
+    son = document(samples=[x / 7 for x in range(10000)]).to_mongo()
+    benchmark(lambda: document._from_son(son).samples[-1])
+
+
+@pytest.mark.parametrize(
+    "document", [EmbeddingList, EmbeddingVector], ids=lambda cls: cls.__name__
+)
+def test_from_son_embedding(benchmark, document):
+    son = document(embedding=[x / 768 for x in range(768)]).to_mongo()
+    benchmark(lambda: document._from_son(son).embedding[-1])
@@ -1,156 +1,88 @@
-import timeit
+import pytest
 
+from mongoengine import DictField, Document
+from mongoengine.connection import get_db
 
-def main():
-    setup = """
-from pymongo import MongoClient
+DOCS = 1000
 
-connection = MongoClient(w=1)
-connection.drop_database('mongoengine_benchmark_test')
-"""
 
-    stmt = """
-db = connection.mongoengine_benchmark_test
-noddy = db.noddy
+class Noddy(Document):
+    fields = DictField()
 
-for i in range(10000):
-    example = {'fields': {}}
-    for j in range(20):
-        example['fields']["key"+str(j)] = "value "+str(j)
 
-    noddy.insert_one(example)
+def example_fields():
+    return {"key" + str(j): "value " + str(j) for j in range(20)}
 
-myNoddys = noddy.find()
-[n for n in myNoddys]  # iterate
-"""
 
-    print("-" * 100)
-    print('PyMongo: Creating 10000 dictionaries (write_concern={"w": 1}).')
-    t = timeit.Timer(stmt=stmt, setup=setup)
-    print(f"{t.timeit(1)}s")
+@pytest.fixture(autouse=True)
+def drop_collections():
+    Noddy.drop_collection()
+    get_db().drop_collection("noddy_pymongo")
 
-    stmt = """
-from pymongo import WriteConcern
 
-db = connection.mongoengine_benchmark_test
-noddy = db.noddy.with_options(write_concern=WriteConcern(w=0))
+def run(benchmark, insert):
+    def insert_and_iterate():
+        insert()
+        return list(Noddy.objects)
 
-for i in range(10000):
-    example = {'fields': {}}
-    for j in range(20):
-        example['fields']["key"+str(j)] = "value "+str(j)
+    benchmark.pedantic(insert_and_iterate, setup=Noddy.drop_collection, rounds=5)
 
-    noddy.insert_one(example)
 
-myNoddys = noddy.find()
-[n for n in myNoddys]  # iterate
-"""
+def test_pymongo(benchmark):
+    collection = get_db().noddy_pymongo
 
-    print("-" * 100)
-    print('PyMongo: Creating 10000 dictionaries (write_concern={"w": 0}).')
-    t = timeit.Timer(stmt=stmt, setup=setup)
-    print(f"{t.timeit(1)}s")
+    def insert_and_iterate():
+        for _ in range(DOCS):
+            collection.insert_one({"fields": example_fields()})
+        return list(collection.find())
 
-    setup = """
-from pymongo import MongoClient
+    def clear():
+        collection.delete_many({})
 
-connection = MongoClient()
-connection.drop_database('mongoengine_benchmark_test')
-connection.close()
+    benchmark.pedantic(insert_and_iterate, setup=clear, rounds=5)
 
-from mongoengine import Document, DictField, connect
-connect("mongoengine_benchmark_test", w=1)
 
-class Noddy(Document):
-    fields = DictField()
-"""
-
-    stmt = """
-for i in range(10000):
-    noddy = Noddy()
-    for j in range(20):
-        noddy.fields["key"+str(j)] = "value "+str(j)
-    noddy.save()
-
-myNoddys = Noddy.objects()
-[n for n in myNoddys]  # iterate
-"""
-
-    print("-" * 100)
-    print('MongoEngine: Creating 10000 dictionaries (write_concern={"w": 1}).')
-    t = timeit.Timer(stmt=stmt, setup=setup)
-    print(f"{t.timeit(1)}s")
-
-    stmt = """
-for i in range(10000):
-    noddy = Noddy()
-    fields = {}
-    for j in range(20):
-        fields["key"+str(j)] = "value "+str(j)
-    noddy.fields = fields
-    noddy.save()
-
-myNoddys = Noddy.objects()
-[n for n in myNoddys]  # iterate
-"""
-
-    print("-" * 100)
-    print("MongoEngine: Creating 10000 dictionaries (using a single field assignment).")
-    t = timeit.Timer(stmt=stmt, setup=setup)
-    print(f"{t.timeit(1)}s")
-
-    stmt = """
-for i in range(10000):
-    noddy = Noddy()
-    for j in range(20):
-        noddy.fields["key"+str(j)] = "value "+str(j)
-    noddy.save(write_concern={"w": 0})
-
-myNoddys = Noddy.objects()
-[n for n in myNoddys] # iterate
-"""
-
-    print("-" * 100)
-    print('MongoEngine: Creating 10000 dictionaries (write_concern={"w": 0}).')
-    t = timeit.Timer(stmt=stmt, setup=setup)
-    print(f"{t.timeit(1)}s")
-
-    stmt = """
-for i in range(10000):
-    noddy = Noddy()
-    for j in range(20):
-        noddy.fields["key"+str(j)] = "value "+str(j)
-    noddy.save(write_concern={"w": 0}, validate=False)
-
-myNoddys = Noddy.objects()
-[n for n in myNoddys] # iterate
-"""
-
-    print("-" * 100)
-    print(
-        'MongoEngine: Creating 10000 dictionaries (write_concern={"w": 0}, validate=False).'
-    )
-    t = timeit.Timer(stmt=stmt, setup=setup)
-    print(f"{t.timeit(1)}s")
-
-    stmt = """
-for i in range(10000):
-    noddy = Noddy()
-    for j in range(20):
-        noddy.fields["key"+str(j)] = "value "+str(j)
-    noddy.save(force_insert=True, write_concern={"w": 0}, validate=False)
-
-myNoddys = Noddy.objects()
-[n for n in myNoddys] # iterate
-"""
-
-    print("-" * 100)
-    print(
-        'MongoEngine: Creating 10000 dictionaries (force_insert=True, write_concern={"w": 0}, validate=False).'
-    )
-    t = timeit.Timer(stmt=stmt, setup=setup)
-    print(f"{t.timeit(1)}s")
-
-
-if __name__ == "__main__":
-    main()
+def test_save_item_by_item(benchmark):
+    def insert():
+        for _ in range(DOCS):
+            noddy = Noddy()
+            for key, value in example_fields().items():
+                noddy.fields[key] = value
+            noddy.save()
+
+    run(benchmark, insert)
+
+
+def test_save_single_assignment(benchmark):
+    def insert():
+        for _ in range(DOCS):
+            noddy = Noddy()
+            noddy.fields = example_fields()
+            noddy.save()
+
+    run(benchmark, insert)
+
+
+def test_save_unacknowledged(benchmark):
+    def insert():
+        for _ in range(DOCS):
+            Noddy(fields=example_fields()).save(write_concern={"w": 0})
+
+    run(benchmark, insert)
+
+
+def test_save_force_insert_no_validation(benchmark):
+    def insert():
+        for _ in range(DOCS):
+            Noddy(fields=example_fields()).save(
+                force_insert=True, write_concern={"w": 0}, validate=False
+            )
+
+    run(benchmark, insert)
+
+
+def test_bulk_insert(benchmark):
+    def insert():
+        Noddy.objects.insert([Noddy(fields=example_fields()) for _ in range(DOCS)])
+
+    run(benchmark, insert)
@@ -0,0 +1,83 @@
+import datetime
+
+import pytest
+
+from mongoengine import (
+    DateTimeField,
+    Document,
+    IntField,
+    ListField,
+    Q,
+    StringField,
+)
+from mongoengine.queryset import transform
+
+
+class Article(Document):
+    title = StringField(db_field="t")
+    author = StringField()
+    published = DateTimeField()
+    rating = IntField()
+    tags = ListField(StringField())
+    meta = {"allow_inheritance": True}
+
+
+@pytest.fixture(scope="module")
+def articles():
+    Article.drop_collection()
+    Article.objects.insert(
+        [
+            Article(
+                title="Article %d" % idx,
+                author="Ross" if idx % 2 else "Rachel",
+                published=datetime.datetime(2020, 1, 1) + datetime.timedelta(days=idx),
+                rating=idx % 5,
+                tags=["mongodb", "python", "tag%d" % idx],
+            )
+            for idx in range(1000)
+        ],
+        load_bulk=False,
+    )
+    yield
+    Article.drop_collection()
+
+
+def test_iterate(benchmark, articles):
+    benchmark(lambda: list(Article.objects))
+
+
+def test_iterate_only(benchmark, articles):
+    benchmark(lambda: list(Article.objects.only("title", "rating")))
+
+
+def test_iterate_as_pymongo(benchmark, articles):
+    benchmark(lambda: list(Article.objects.as_pymongo()))
+
+
+def test_iterate_no_dereference(benchmark, articles):
+    benchmark(lambda: list(Article.objects.no_dereference()))
+
+
+def test_transform_query_simple(benchmark):
+    benchmark(transform.query, Article, author="Ross", rating__gte=3)
+
+
+def test_transform_query_complex(benchmark):
+    benchmark(
+        transform.query,
+        Article,
+        title__icontains="mongo",
+        tags__in=["python", "mongodb"],
+        published__lt=datetime.datetime(2021, 1, 1),
+        rating__not__lte=2,
+        author__ne="Joey",
+    )
+
+
+def test_compile_q_combination(benchmark):
+    def compile_query():
+        return Article.objects(
+            (Q(author="Ross") | Q(author="Rachel")) & Q(rating__gte=3)
+        )._query
+
+    benchmark(compile_query)
@@ -0,0 +1,40 @@
+from mongoengine import (
+    DateTimeField,
+    Document,
+    IntField,
+    ListField,
+    StringField,
+)
+
+
+class Post(Document):
+    title = StringField()
+    author = StringField()
+    published = DateTimeField()
+    rating = IntField()
+    tags = ListField(StringField())
+    meta = {"allow_inheritance": True}
+
+
+def chain():
+    return (
+        Post.objects.filter(author="Ross")
+        .filter(tags="mongodb")
+        .exclude("tags")
+        .order_by("-published")
+        .skip(20)
+        .limit(10)
+    )
+
+
+def test_clone(benchmark):
+    qs = Post.objects.filter(author="Ross").order_by("-published").limit(10)
+    benchmark(qs.clone)
+
+
+def test_clone_chain(benchmark):
+    benchmark(chain)
+
+
+def test_clone_chain_and_compile(benchmark):
+    benchmark(lambda: chain()._query)
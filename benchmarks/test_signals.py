@@ -0,0 +1,60 @@
+"""Overhead of the signals sent on documents creation and save, with and
+without receivers connected.
+"""
+
+import pytest
+
+from mongoengine import Document, IntField, StringField, signals
+
+
+class Untracked(Document):
+    name = StringField()
+    age = IntField()
+
+
+class Tracked(Document):
+    name = StringField()
+    age = IntField()
+
+
+def receiver(sender, document, **kwargs):
+    pass
+
+
+@pytest.fixture(scope="module", autouse=True)
+def receivers():
+    pytest.importorskip("blinker")
+    for signal in (signals.pre_init, signals.post_init):
+        signal.connect(receiver, sender=Tracked)
+    for signal in (signals.pre_save, signals.post_save):
+        signal.connect(receiver, sender=Tracked)
+    yield
+    for signal in (
+        signals.pre_init,
+        signals.post_init,
+        signals.pre_save,
+        signals.post_save,
+    ):
+        signal.disconnect(receiver, sender=Tracked)
+
+
+@pytest.mark.parametrize("document", [Untracked, Tracked], ids=lambda cls: cls.__name__)
+def test_init(benchmark, document):
+    benchmark(document, name="Ross", age=42)
+
+
+@pytest.mark.parametrize("document", [Untracked, Tracked], ids=lambda cls: cls.__name__)
+def test_from_son(benchmark, document):
+    benchmark(document._from_son, {"_id": 1, "name": "Ross", "age": 42})
+
+
+@pytest.mark.parametrize("document", [Untracked, Tracked], ids=lambda cls: cls.__name__)
+def test_save(benchmark, document):
+    document.drop_collection()
+    doc = document(name="Ross", age=42).save()
+
+    def save():
+        doc._mark_as_changed("age")
+        doc.save()
+
+    benchmark(save)
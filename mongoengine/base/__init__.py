@@ -17,6 +17,7 @@ __all__ = (
     # datastructures
     "BaseDict",
     "BaseList",
+    "BaseArray",
     "EmbeddedDocumentList",
     "LazyReference",
     # document
@@ -26,6 +26,10 @@ UPDATE_OPERATORS = {
 
 _document_registry = {}
 
+# Bumped whenever the registry changes so that caches depending on the set of
+# known Document classes (e.g. resolved field paths) can be invalidated.
+_document_registry_generation = [0]
+
 
 class _DocumentRegistry:
     """Wrapper for the document registry (providing a singleton pattern).
@@ -54,6 +58,11 @@ class _DocumentRegistry:
             """.strip() % name)
         return doc
 
+    @staticmethod
+    def generation():
+        """Return a counter that changes whenever a class is (un)registered"""
+        return _document_registry_generation[0]
+
     @staticmethod
     def register(DocCls):
         ExistingDocCls = _document_registry.get(DocCls._class_name)
@@ -71,10 +80,12 @@ class _DocumentRegistry:
                 stacklevel=4,
             )
         _document_registry[DocCls._class_name] = DocCls
+        _document_registry_generation[0] += 1
 
     @staticmethod
     def unregister(doc_cls_name):
         _document_registry.pop(doc_cls_name)
+        _document_registry_generation[0] += 1
 
 
 def _get_documents_by_db(connection_alias, default_connection_alias):
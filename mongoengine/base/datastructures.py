@@ -1,7 +1,14 @@
+import array
+import datetime
+import decimal
+import itertools
+import uuid
 import weakref
+from functools import partial
 
-from bson import DBRef
+from bson import DBRef, ObjectId
 
+from mongoengine import instrumentation
 from mongoengine.common import _import_class
 from mongoengine.errors import DoesNotExist, MultipleObjectsReturned
 
@@ -9,6 +16,7 @@ __all__ = (
     "BaseDict",
     "StrictDict",
     "BaseList",
+    "BaseArray",
     "EmbeddedDocumentList",
     "LazyReference",
 )
@@ -190,7 +198,93 @@ class BaseList(list):
                 self._instance._mark_as_changed(self._name)
 
 
+class BaseArray(array.array):
+    """An array of scalars so we can watch any changes. Any change marks the
+    whole array as changed.
+    """
+
+    _instance = None
+    _name = None
+
+    def __new__(cls, typecode, initializer=(), instance=None, name=None):
+        self = super().__new__(cls, typecode, initializer)
+
+        BaseDocument = _import_class("BaseDocument")
+
+        if isinstance(instance, BaseDocument):
+            if isinstance(instance, weakref.ProxyTypes):
+                self._instance = instance
+            else:
+                self._instance = weakref.proxy(instance)
+
+        self._name = name
+        return self
+
+    def __reduce_ex__(self, protocol):
+        # Pickled as a plain array, without the weak reference to the document
+        return array.array(self.typecode, self).__reduce_ex__(protocol)
+
+    __setitem__ = mark_as_changed_wrapper(array.array.__setitem__)
+    __delitem__ = mark_as_changed_wrapper(array.array.__delitem__)
+    __iadd__ = mark_as_changed_wrapper(array.array.__iadd__)
+    __imul__ = mark_as_changed_wrapper(array.array.__imul__)
+    append = mark_as_changed_wrapper(array.array.append)
+    extend = mark_as_changed_wrapper(array.array.extend)
+    insert = mark_as_changed_wrapper(array.array.insert)
+    pop = mark_as_changed_wrapper(array.array.pop)
+    remove = mark_as_changed_wrapper(array.array.remove)
+    reverse = mark_as_changed_wrapper(array.array.reverse)
+    byteswap = mark_as_changed_wrapper(array.array.byteswap)
+    frombytes = mark_as_changed_wrapper(array.array.frombytes)
+    fromlist = mark_as_changed_wrapper(array.array.fromlist)
+    fromfile = mark_as_changed_wrapper(array.array.fromfile)
+
+    def _mark_as_changed(self, key=None):
+        if hasattr(self._instance, "_mark_as_changed"):
+            self._instance._mark_as_changed(self._name)
+
+
+# Types of the values looked up with the indexes of EmbeddedDocumentList,
+# whose hash is consistent with their equality
+_INDEXABLE_TYPES = frozenset(
+    (
+        str,
+        int,
+        float,
+        bool,
+        bytes,
+        type(None),
+        ObjectId,
+        uuid.UUID,
+        datetime.datetime,
+        datetime.date,
+        decimal.Decimal,
+    )
+)
+
+
 class EmbeddedDocumentList(BaseList):
+    # {field name: version}, the version of a field name being renewed each
+    # time a field of that name changes in an embedded document, so that the
+    # indexes built on that name before are rebuilt
+    _field_versions = {}
+    _new_field_version = itertools.count(1).__next__
+
+    # {key: (field version, positions by value, positions by str(value),
+    #        other positions)}
+    _indexes = None
+
+    @classmethod
+    def _field_changed(cls, key):
+        """Invalidate the indexes on ``key`` of all the lists, one of their
+        embedded documents having changed that field.
+        """
+        cls._field_versions[key.split(".", 1)[0]] = cls._new_field_version()
+
+    def _mark_as_changed(self, key=None):
+        self._indexes = None
+        super()._mark_as_changed(key)
+
     @classmethod
     def __match_all(cls, embedded_doc, kwargs):
         """Return True if a given embedded doc matches all the filter
@@ -202,12 +296,66 @@ class EmbeddedDocumentList(BaseList):
                 return False
         return True
 
-    @classmethod
-    def __only_matches(cls, embedded_docs, kwargs):
-        """Return embedded docs that match the filter kwargs."""
+    def __index(self, key):
+        """Return the index of the items on ``key``, built on first use.
+
+        Only the values of fields are indexed, the items for which ``key``
+        is something else (e.g. a property) always being candidates.
+        """
+        if self._indexes is None:
+            self._indexes = {}
+        version = self._field_versions.get(key, 0)
+        index = self._indexes.get(key)
+        if index is not None and index[0] == version:
+            return index[1:]
+
+        by_value, by_str, others = {}, {}, []
+        for position, item in enumerate(list.__iter__(self)):
+            value = getattr(item, key)
+            if type(value) not in _INDEXABLE_TYPES or key not in item._data:
+                others.append(position)
+                continue
+            try:
+                by_value.setdefault(value, []).append(position)
+            except TypeError:  # e.g. signaling NaN decimals
+                others.append(position)
+                continue
+            if type(value) is not str:
+                by_str.setdefault(str(value), []).append(position)
+
+        self._indexes[key] = (version, by_value, by_str, others)
+        return by_value, by_str, others
+
+    def __candidates(self, kwargs):
+        """Return the positions of the items which may match the filter
+        kwargs, in order, using the index of the first value it can use.
+        """
+        for key, expected_value in kwargs.items():
+            if type(expected_value) not in _INDEXABLE_TYPES:
+                continue
+            by_value, by_str, others = self.__index(key)
+            try:
+                positions = by_value.get(expected_value, [])
+            except TypeError:
+                continue
+            if isinstance(expected_value, str) and expected_value in by_str:
+                positions = positions + by_str[expected_value]
+            if others:
+                positions = positions + others
+            return sorted(set(positions)) if positions else positions
+        return range(len(self))
+
+    def __iter_matches(self, kwargs):
+        """Yield the positions of the embedded docs that match the filter
+        kwargs.
+        """
         if not kwargs:
-            return embedded_docs
-        return [doc for doc in embedded_docs if cls.__match_all(doc, kwargs)]
+            yield from range(len(self))
+            return
+        item = partial(list.__getitem__, self)
+        for position in self.__candidates(kwargs):
+            if self.__match_all(item(position), kwargs):
+                yield position
 
     def filter(self, **kwargs):
         """
@@ -217,6 +365,10 @@ class EmbeddedDocumentList(BaseList):
         This method only supports simple comparison (e.g. .filter(name='John Doe'))
         and does not support operators like __gte, __lte, __icontains like queryset.filter does
 
+        The items are looked up with an index of the list on the first keyword,
+        built on first use and dropped when the list changes or when one of
+        the embedded documents changes the field of that keyword.
+
         :param kwargs: The keyword arguments corresponding to the fields to
          filter on. *Multiple arguments are treated as if they are ANDed
          together.*
@@ -226,7 +378,8 @@ class EmbeddedDocumentList(BaseList):
         Raises ``AttributeError`` if a given keyword is not a valid field for
         the embedded document class.
         """
-        values = self.__only_matches(self, kwargs)
+        item = partial(list.__getitem__, self)
+        values = [item(position) for position in self.__iter_matches(kwargs)]
         return EmbeddedDocumentList(values, self._instance, self._name)
 
     def exclude(self, **kwargs):
@@ -243,8 +396,12 @@ class EmbeddedDocumentList(BaseList):
         Raises ``AttributeError`` if a given keyword is not a valid field for
         the embedded document class.
         """
-        exclude = self.__only_matches(self, kwargs)
-        values = [item for item in self if item not in exclude]
+        exclude = set(self.__iter_matches(kwargs))
+        values = [
+            item
+            for position, item in enumerate(list.__iter__(self))
+            if position not in exclude
+        ]
         return EmbeddedDocumentList(values, self._instance, self._name)
 
     def count(self):
@@ -269,15 +426,14 @@ class EmbeddedDocumentList(BaseList):
         document returns no results. ``MultipleObjectsReturned`` if more
         than one result is returned.
         """
-        values = self.__only_matches(self, kwargs)
-        if len(values) == 0:
+        matches = self.__iter_matches(kwargs)
+        position = next(matches, None)
+        if position is None:
             raise DoesNotExist("%s matching query does not exist." % self._name)
-        elif len(values) > 1:
-            raise MultipleObjectsReturned(
-                "%d items returned, instead of 1" % len(values)
-            )
+        if next(matches, None) is not None:
+            raise MultipleObjectsReturned("2 or more items returned, instead of 1")
 
-        return values[0]
+        return list.__getitem__(self, position)
 
     def first(self):
         """Return the first embedded document in the list, or ``None``
@@ -436,15 +592,21 @@ class StrictDict:
 
 
 class LazyReference(DBRef):
-    __slots__ = ("_cached_doc", "passthrough", "document_type")
+    # _path is the path of the field the reference was read from, when known
+    __slots__ = ("_cached_doc", "passthrough", "document_type", "_path")
 
     def fetch(self, force=False):
         if not self._cached_doc or force:
             self._cached_doc = self.document_type.objects.get(pk=self.pk)
+            instrumentation.lazy_dereference(self._field_path())
             if not self._cached_doc:
                 raise DoesNotExist("Trying to dereference unknown document %s" % (self))
         return self._cached_doc
 
+    def _field_path(self):
+        """Return the path reported to the lazy dereference detectors."""
+        return self._path or "LazyReference(%s)" % self.document_type._class_name
+
     @property
     def pk(self):
         return self.id
@@ -453,6 +615,7 @@ class LazyReference(DBRef):
         self.document_type = document_type
         self._cached_doc = cached_doc
         self.passthrough = passthrough
+        self._path = None
         super().__init__(self.document_type._get_collection_name(), pk)
 
     def __getitem__(self, name):
@@ -1,7 +1,6 @@
 import copy
 import numbers
 import warnings
-from functools import partial
 
 import pymongo
 from bson import SON, DBRef, ObjectId, json_util
@@ -15,7 +14,7 @@ from mongoengine.base.datastructures import (
     LazyReference,
     StrictDict,
 )
-from mongoengine.base.fields import ComplexBaseField
+from mongoengine.base.fields import BaseField, ComplexBaseField
 from mongoengine.common import _import_class
 from mongoengine.errors import (
     FieldDoesNotExist,
@@ -30,6 +29,9 @@ __all__ = ("BaseDocument", "NON_FIELD_ERRORS")
 
 NON_FIELD_ERRORS = "__all__"
 
+# Maximum number of resolved field paths memoized per Document class
+LOOKUP_FIELD_CACHE_SIZE = 1000
+
 try:
     GEOHAYSTACK = pymongo.GEOHAYSTACK
 except AttributeError:
@@ -62,6 +64,8 @@ class BaseDocument:
     _dynamic_lock = True
     STRICT = False
 
+    _lookup_field_cache = None
+
     def __init__(self, *args, **values):
         """
         Initialise a document or an embedded document.
@@ -86,7 +90,8 @@ class BaseDocument:
 
         _created = values.pop("_created", True)
 
-        signals.pre_init.send(self.__class__, document=self, values=values)
+        if signals.pre_init.has_receivers_for(self.__class__):
+            signals.pre_init.send(self.__class__, document=self, values=values)
 
         # Check if there are undefined fields supplied to the constructor,
         # if so raise an Exception.
@@ -133,9 +138,6 @@ class BaseDocument:
                     # For strict Document
                     self._data[key] = value
 
-        # Set any get_<field>_display methods
-        self.__set_field_display()
-
         if self._dynamic:
             self._dynamic_lock = False
             for key, value in dynamic_data.items():
@@ -145,7 +147,8 @@ class BaseDocument:
         self._initialised = True
         self._created = _created
 
-        signals.post_init.send(self.__class__, document=self)
+        if signals.post_init.has_receivers_for(self.__class__):
+            signals.post_init.send(self.__class__, document=self)
 
     def __delattr__(self, *args, **kwargs):
         """Handle deletions of fields"""
@@ -881,6 +884,33 @@ class BaseDocument:
         index_specs = merge_index_specs(index_specs, unique_indices)
         return index_specs
 
+    @classmethod
+    def _check_index_fields(cls, meta_indexes):
+        """Resolve the fields the given index specs and the embedded documents
+        refer to, without building the index specs.
+        """
+        for spec in meta_indexes:
+            if isinstance(spec, str):
+                keys = [spec]
+            elif isinstance(spec, dict):
+                keys = spec["fields"]
+            else:
+                keys = spec
+            for key in keys:
+                # If inherited spec continue
+                if isinstance(key, (list, tuple)):
+                    continue
+                if key.startswith(("+", "-", "*", "$", "#", "(", ")")):
+                    key = key[1:]
+                parts = key.split(".")
+                if parts not in (["pk"], ["id"], ["_id"]):
+                    cls._lookup_field(parts)
+
+        EmbeddedDocumentField = _import_class("EmbeddedDocumentField")
+        for field in cls._fields.values():
+            if isinstance(field, EmbeddedDocumentField):
+                field.document_type
+
     @classmethod
     def _build_index_spec(cls, spec):
         """Build a PyMongo index spec from a MongoEngine index spec."""
@@ -1096,6 +1126,37 @@ class BaseDocument:
             [<mongoengine.fields.EmbeddedDocumentListField at 0x1119ec250>,
              'doesnt_exist']
 
+        """
+        if not isinstance(parts, (list, tuple)):
+            parts = [parts]
+
+        # Resolved paths are memoized per class (not inherited by subclasses)
+        # and dropped whenever the document registry changes, since the
+        # resolution may depend on subclasses or on lazily resolved
+        # embedded document types.
+        generation = _DocumentRegistry.generation()
+        cache = cls.__dict__.get("_lookup_field_cache")
+        if cache is None or cache[0] != generation:
+            cache = (generation, {})
+            cls._lookup_field_cache = cache
+        memo = cache[1]
+
+        key = tuple(parts)
+        fields = memo.get(key)
+        if fields is None:
+            fields = tuple(cls._resolve_field_path(parts))
+            if len(memo) >= LOOKUP_FIELD_CACHE_SIZE:
+                # Evict the oldest entry
+                memo.pop(next(iter(memo)), None)
+            memo[key] = fields
+
+        # Return a fresh list as callers are free to modify it
+        return list(fields)
+
+    @classmethod
+    def _resolve_field_path(cls, parts):
+        """Walk the document's fields to resolve the path to a given field.
+        Uncached version of :meth:`_lookup_field`, which should be used instead.
         """
         # TODO this method is WAY too complicated. Simplify it.
         # TODO don't think returning a string for embedded non-existent fields is desired
@@ -1103,9 +1164,6 @@ class BaseDocument:
         ListField = _import_class("ListField")
         DynamicField = _import_class("DynamicField")
 
-        if not isinstance(parts, (list, tuple)):
-            parts = [parts]
-
         fields = []
         field = None
 
@@ -1201,20 +1259,10 @@ class BaseDocument:
         parts = [f.db_field for f in cls._lookup_field(parts)]
         return ".".join(parts)
 
-    def __set_field_display(self):
-        """For each field that specifies choices, create a
-        get_<field>_display method.
+    def _get_field_display(self, field):
+        """Return the display value for a choice field, the
+        get_<field>_display methods set by the metaclass.
         """
-        fields_with_choices = [(n, f) for n, f in self._fields.items() if f.choices]
-        for attr_name, field in fields_with_choices:
-            setattr(
-                self,
-                "get_%s_display" % attr_name,
-                partial(self.__get_field_display, field=field),
-            )
-
-    def __get_field_display(self, field):
-        """Return the display value for a choice field"""
         value = getattr(self, field.name)
         if field.choices and isinstance(field.choices[0], (list, tuple)):
             if value is None:
@@ -1229,3 +1277,170 @@ class BaseDocument:
                 [str(dict(field.choices).get(val, val)) for val in values or []]
             )
         return value
+
+
+def _inherited(cls, name):
+    """Return the class and the value of the attribute ``name`` inherited by
+    ``cls``, skipping the specialised constructors.
+    """
+    for klass in cls.__mro__:
+        value = klass.__dict__.get(name)
+        if value is not None and not getattr(value, "_specialised", False):
+            return klass, value
+    return None, None
+
+
+def _can_specialise_init(cls):
+    """Return True if the constructor of ``cls`` may be specialised, i.e.
+    if the class neither is dynamic nor defines or inherits its own
+    ``__init__`` or ``__setattr__``.
+    """
+    if cls._dynamic:
+        return False
+    EmbeddedDocument = _import_class("EmbeddedDocument")
+    _, init = _inherited(cls, "__init__")
+    _, setattr_ = _inherited(cls, "__setattr__")
+    return (
+        init in (BaseDocument.__init__, EmbeddedDocument.__init__)
+        and setattr_ is BaseDocument.__setattr__
+    )
+
+
+def _lazy_specialised_init(cls):
+    """Return a constructor for ``cls`` replacing itself with the constructor
+    specialised for the class on its first call, so that the classes which
+    are never instantiated don't pay for it.
+    """
+
+    def __init__(self, *args, **values):
+        init = cls.__init__ = _specialised_init(cls)
+        init(self, *args, **values)
+
+    __init__._specialised = True
+    return __init__
+
+
+_INIT_TEMPLATE = """
+def __init__(self, *args, **values):
+    if type(self) is not cls:
+        return fallback(self, *args, **values)
+    _setattr(self, "_initialised", False)
+    _setattr(self, "_created", True)
+    if args:
+        raise TypeError(
+            "Instantiating a document with positional arguments is not "
+            "supported. Please use `field_name=value` keyword arguments."
+        )
+    auto_convert = values.pop("__auto_convert", True)
+    _created = values.pop("_created", True)
+    if pre_init.has_receivers_for(cls):
+        pre_init.send(cls, document=self, values=values)
+    if values%(check_undefined)s:
+        undefined_fields = values.keys() - allowed_keys
+        if undefined_fields:
+            raise FieldDoesNotExist(
+                'The fields "%%s" do not exist on the document "%%s"'
+                %% (undefined_fields, cls._class_name)
+            )
+    data = new_data()
+    _setattr(self, "_data", data)
+    _setattr(self, "_dynamic_fields", SON())
+%(defaults)s
+    if "_cls" not in values:
+        _setattr(self, "_cls", cls._class_name)
+    for key, value in values.items():
+        if key in setters:
+            if auto_convert and value is not None and key in converters:
+                value = converters[key](value)
+            _setattr(self, key, value)
+        elif key in ("id", "pk", "_cls"):
+            setattr(self, key, value)
+        else:
+            data[key] = value
+    _setattr(self, "_initialised", True)
+    _setattr(self, "_created", _created)
+    if post_init.has_receivers_for(cls):
+        post_init.send(cls, document=self)
+%(tail)s
+"""
+
+
+def _specialised_init(cls):
+    """Generate the constructor of ``cls``, equivalent to
+    :meth:`BaseDocument.__init__` for the documents which can't be dynamic
+    and whose ``__setattr__`` has no effect while they are initialised, but
+    with the field names, defaults and conversions resolved once.
+    """
+    EmbeddedDocument = _import_class("EmbeddedDocument")
+    FileField = _import_class("FileField")
+    _, fallback = _inherited(cls, "__init__")
+
+    namespace = {
+        "cls": cls,
+        "fallback": fallback,
+        "_setattr": object.__setattr__,
+        "pre_init": signals.pre_init,
+        "post_init": signals.post_init,
+        "FieldDoesNotExist": FieldDoesNotExist,
+        "SON": SON,
+        "allowed_keys": frozenset(
+            list(cls._fields) + ["id", "pk", "_cls", "_text_score"]
+        ),
+        "setters": frozenset(cls._fields),
+        "converters": {
+            name: field.to_python
+            for name, field in cls._fields.items()
+            if not isinstance(field, FileField)
+        },
+        "new_data": (
+            StrictDict.create(allowed_keys=cls._fields_ordered) if cls.STRICT else dict
+        ),
+    }
+
+    # The fields not given a value are set to their default: plain fields
+    # directly in the data, the others through their descriptor
+    defaults = []
+    for idx, (name, field) in enumerate(cls._fields.items()):
+        plain = (
+            type(field).__get__ is BaseField.__get__
+            and type(field).__set__ is BaseField.__set__
+        )
+        default = field.default
+        if not plain:
+            line = "_setattr(self, %r, getattr(self, %r, None))" % (name, name)
+        elif field.null or default is None:
+            line = "data[%r] = None" % name
+        elif callable(default):
+            namespace["default_%d" % idx] = default
+            line = "set_default(self, %r, default_%d())" % (name, idx)
+        elif isinstance(default, (EmbeddedDocument, list, tuple)):
+            line = "_setattr(self, %r, None)" % name
+        else:
+            namespace["default_%d" % idx] = default
+            line = "data[%r] = default_%d" % (name, idx)
+        defaults.append("    if %r not in values:\n        %s" % (name, line))
+
+    def set_default(document, name, value):
+        if isinstance(value, (EmbeddedDocument, list, tuple)):
+            object.__setattr__(document, name, value)
+        else:
+            document._data[name] = value
+
+    namespace["set_default"] = set_default
+
+    tail = ""
+    if fallback is EmbeddedDocument.__init__:
+        tail = '    _setattr(self, "_instance", None)\n'
+        tail += '    _setattr(self, "_changed_fields", [])'
+
+    source = _INIT_TEMPLATE % {
+        "check_undefined": "" if cls._meta.get("strict", True) else " and _created",
+        "defaults": "\n".join(defaults),
+        "tail": tail,
+    }
+    exec(compile(source, "<%s.__init__>" % cls.__name__, "exec"), namespace)
+    init = namespace["__init__"]
+    init.__qualname__ = "%s.__init__" % cls.__qualname__
+    init.__doc__ = BaseDocument.__init__.__doc__
+    init._specialised = True
+    return init
@@ -6,6 +6,7 @@ import weakref
 import pymongo
 from bson import SON, DBRef, ObjectId
 
+from mongoengine import instrumentation
 from mongoengine.base.common import UPDATE_OPERATORS
 from mongoengine.base.datastructures import (
     BaseDict,
@@ -117,17 +118,18 @@ class BaseField:
                 '("\\0"), and they must not start with a dollar sign ("$").'
             )
 
-        # Detect and report conflicts between metadata and base properties.
-        conflicts = set(dir(self)) & set(kwargs)
-        if conflicts:
-            raise TypeError(
-                "%s already has attribute(s): %s"
-                % (self.__class__.__name__, ", ".join(conflicts))
-            )
+        if kwargs:
+            # Detect and report conflicts between metadata and base properties.
+            conflicts = set(dir(self)) & set(kwargs)
+            if conflicts:
+                raise TypeError(
+                    "%s already has attribute(s): %s"
+                    % (self.__class__.__name__, ", ".join(conflicts))
+                )
 
-        # Assign metadata to the instance
-        # This efficient method is available because no __slots__ are defined.
-        self.__dict__.update(kwargs)
+            # Assign metadata to the instance
+            # This efficient method is available because no __slots__ are defined.
+            self.__dict__.update(kwargs)
 
         # Adjust the appropriate creation counter, and save our local copy.
         if self.db_field == "_id":
@@ -328,6 +330,8 @@ class ComplexBaseField(BaseField):
             instance=instance,
             name=name,
         )
+        if getattr(_dereference, "reference_map", None):
+            instrumentation.lazy_dereference(f"{instance._class_name}.{name}")
         return documents
 
     def __set__(self, instance, value):
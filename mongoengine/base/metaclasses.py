@@ -1,7 +1,13 @@
 import itertools
 import warnings
+from functools import partialmethod
 
 from mongoengine.base.common import _DocumentRegistry
+from mongoengine.base.document import (
+    BaseDocument,
+    _can_specialise_init,
+    _lazy_specialised_init,
+)
 from mongoengine.base.fields import (
     BaseField,
     ComplexBaseField,
@@ -216,6 +222,19 @@ class DocumentMetaclass(type):
                 msg = "%s is a document method and not a valid field name" % field.name
                 raise InvalidDocumentError(msg)
 
+            # Set the get_<field>_display methods of the fields with choices
+            display_name = "get_%s_display" % field.name
+            if field.choices and display_name not in attrs:
+                setattr(
+                    new_class,
+                    display_name,
+                    partialmethod(BaseDocument._get_field_display, field=field),
+                )
+
+        # Documents get a constructor generated for their fields
+        if _can_specialise_init(new_class):
+            new_class.__init__ = _lazy_specialised_init(new_class)
+
         return new_class
 
     @classmethod
@@ -365,8 +384,15 @@ class TopLevelDocumentMetaclass(DocumentMetaclass):
 
         meta = new_class._meta
 
-        # Set index specifications
-        meta["index_specs"] = new_class._build_index_specs(meta["indexes"])
+        # The index specifications are built on first use (see
+        # MetaDict.__missing__), unless unique_with is used: building them
+        # marks the fields it refers to as required. The fields they refer
+        # to are checked right away.
+        meta._document = new_class
+        if any(field.unique_with for field in new_class._fields.values()):
+            meta["index_specs"]
+        else:
+            new_class._check_index_fields(meta["indexes"])
 
         # If collection is a callable - call it and set the value
         collection = meta.get("collection")
@@ -374,7 +400,7 @@ class TopLevelDocumentMetaclass(DocumentMetaclass):
             new_class._meta["collection"] = collection(new_class)
 
         # Provide a default queryset unless exists or one has been set
-        if "objects" not in dir(new_class):
+        if not any("objects" in klass.__dict__ for klass in new_class.__mro__):
             new_class.objects = QuerySetManager()
 
         # Validate the fields and set primary key if needed
@@ -406,6 +432,10 @@ class TopLevelDocumentMetaclass(DocumentMetaclass):
             # the first field).
             new_class._fields_ordered = (id_name,) + new_class._fields_ordered
 
+            # Field paths resolved while checking the indexes predate the
+            # automatic id field, drop them.
+            new_class._lookup_field_cache = None
+
         # Merge in exceptions with parent hierarchy.
         exceptions_to_merge = (DoesNotExist, MultipleObjectsReturned)
         module = attrs.get("__module__")
@@ -449,18 +479,27 @@ class TopLevelDocumentMetaclass(DocumentMetaclass):
 
 class MetaDict(dict):
     """Custom dictionary for meta classes.
-    Handles the merging of set indexes
+    Handles the merging of set indexes, and builds the index specifications
+    of the document class on first access.
     """
 
     _merge_options = ("indexes",)
+    _document = None
 
     def merge(self, new_options):
         for k, v in new_options.items():
             if k in self._merge_options:
                 self[k] = self.get(k, []) + v
-            else:
+            elif k != "index_specs":  # specific to each document class
                 self[k] = v
 
+    def __missing__(self, key):
+        if key != "index_specs" or self._document is None:
+            raise KeyError(key)
+        index_specs = self._document._build_index_specs(self["indexes"])
+        self["index_specs"] = index_specs
+        return index_specs
+
 
 class BasesTuple(tuple):
     """Special class to handle introspection of bases tuple in __new__"""
@@ -16,8 +16,10 @@ def _import_class(cls_name):
     :func:`~mongoengine.common._import_class` can then directly retrieve the
     class from the :data:`mongoengine.common._class_registry_cache`.
     """
-    if cls_name in _class_registry_cache:
-        return _class_registry_cache.get(cls_name)
+    try:
+        return _class_registry_cache[cls_name]
+    except KeyError:
+        pass
 
     doc_classes = (
         "Document",
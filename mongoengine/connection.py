@@ -1,9 +1,11 @@
 import collections
+import os
 import threading
 import warnings
 
 from pymongo import MongoClient, ReadPreference, uri_parser
 from pymongo.common import _UUID_REPRESENTATIONS
+from pymongo.read_preferences import SecondaryPreferred
 
 try:
     from pymongo.database_shared import _check_name
@@ -17,18 +19,24 @@ except ImportError:
     DriverInfo = None
 
 import mongoengine
+from mongoengine import instrumentation
 from mongoengine.pymongo_support import PYMONGO_VERSION
 
 __all__ = [
     "DEFAULT_CONNECTION_NAME",
     "DEFAULT_DATABASE_NAME",
     "ConnectionFailure",
+    "ReadReplicaRouter",
+    "Router",
     "connect",
     "disconnect",
     "disconnect_all",
     "get_connection",
     "get_db",
+    "get_router",
     "register_connection",
+    "set_router",
+    "warm_up",
 ]
 
 
@@ -40,6 +48,7 @@ DEFAULT_PORT = 27017
 _connection_settings = {}
 _connections = {}
 _dbs = {}
+_router = None
 
 
 READ_PREFERENCE = ReadPreference.PRIMARY
@@ -327,6 +336,15 @@ def get_connection(alias=DEFAULT_CONNECTION_NAME, reconnect=False):
             msg = 'Connection with alias "%s" has not been defined' % alias
         raise ConnectionFailure(msg)
 
+    return _open_connection(alias)
+
+
+def _open_connection(alias, **client_options):
+    """Create (or share) the client of a registered alias. The
+    ``client_options`` are passed to the new client on top of the settings of
+    the alias.
+    """
+
     def _clean_settings(settings_dict):
         if PYMONGO_VERSION < (4,):
             irrelevant_fields_set = {
@@ -356,6 +374,7 @@ def get_connection(alias=DEFAULT_CONNECTION_NAME, reconnect=False):
     # alias and remove the database name and authentication info (we don't
     # care about them at this point).
     conn_settings = _clean_settings(raw_conn_settings)
+    conn_settings.update(client_options)
     if DriverInfo is not None:
         conn_settings.setdefault(
             "driver", DriverInfo("MongoEngine", mongoengine.__version__)
@@ -367,9 +386,22 @@ def get_connection(alias=DEFAULT_CONNECTION_NAME, reconnect=False):
     else:
         mongo_client_class = MongoClient
 
+    # Let query_counter count the commands sent through the client
+    if issubclass(mongo_client_class, MongoClient):
+        conn_settings["event_listeners"] = list(
+            conn_settings.get("event_listeners") or ()
+        ) + [instrumentation.command_counters]
+
     # Re-use existing connection if one is suitable.
     existing_connection = _find_existing_connection(raw_conn_settings)
     if existing_connection:
+        if client_options:
+            warnings.warn(
+                "The client of the alias %r is shared with another alias "
+                "using the same settings, the options %s are ignored"
+                % (alias, ", ".join(sorted(client_options))),
+                stacklevel=3,
+            )
         connection = existing_connection
     else:
         connection = _create_connection(
@@ -483,6 +515,123 @@ _get_connection = get_connection
 _get_db = get_db
 
 
+class Router:
+    """Base class of the database routers.
+
+    A router decides, per operation, which connection alias and which read
+    preference the queries of a document class use. It is either set
+    globally with :func:`set_router` or per document class with the
+    ``db_router`` meta option (a router class or instance).
+
+    Every method may return ``None`` to keep the default behaviour. The
+    ``operation`` passed is one of ``"find"``, ``"count"``, ``"aggregate"``
+    for the reads and ``"insert"``, ``"save"``, ``"update"``, ``"delete"``
+    for the writes. ``"map_reduce"`` is a read when the output is inline and
+    a write otherwise. The operations run within a session aren't routed.
+    """
+
+    def db_for_read(self, document, operation):
+        """Return the alias of the connection to read from."""
+        return None
+
+    def db_for_write(self, document, operation):
+        """Return the alias of the connection to write to."""
+        return None
+
+    def read_preference(self, document, operation):
+        """Return the read preference of the reads."""
+        return None
+
+
+class ReadReplicaRouter(Router):
+    """Send the reads to the secondaries, and the writes to the primary.
+
+    :param read_alias: (optional) the alias of the connection to read from,
+        e.g. a connection to the analytics nodes of the replica set. The
+        connection of the document is used by default.
+    :param read_preference: (optional) the read preference of the reads,
+        :class:`~pymongo.read_preferences.SecondaryPreferred` by default
+    :param max_staleness: (optional) the maximum replication lag, in seconds,
+        of the secondaries to read from (at least 90 seconds). Lagging
+        secondaries are skipped and the reads go to the primary when no
+        secondary is fresh enough.
+    :param operations: (optional) the read operations to route, all of them
+        by default. E.g. ``("aggregate",)`` to only offload the aggregations.
+    """
+
+    def __init__(
+        self, read_alias=None, read_preference=None, max_staleness=None, operations=None
+    ):
+        if read_preference is not None and max_staleness is not None:
+            raise ValueError(
+                "max_staleness can't be used along with an explicit read_preference"
+            )
+        if read_preference is None:
+            read_preference = SecondaryPreferred(max_staleness=max_staleness or -1)
+        self.read_alias = read_alias
+        self._read_preference = read_preference
+        self.operations = operations
+
+    def _routed(self, operation):
+        return self.operations is None or operation in self.operations
+
+    def db_for_read(self, document, operation):
+        if self._routed(operation):
+            return self.read_alias
+
+    def read_preference(self, document, operation):
+        if self._routed(operation):
+            return self._read_preference
+
+
+def set_router(router):
+    """Set the router used by the document classes that don't define their
+    own ``db_router``. Pass ``None`` to remove it.
+    """
+    global _router
+    _router = router() if isinstance(router, type) else router
+
+
+def get_router(document):
+    """Return the router of the given document class, if any."""
+    if "db_router" not in document._meta:
+        return _router
+    router = document._meta["db_router"]
+    if isinstance(router, type):
+        # Instantiated once per class defining it
+        router = router()
+        document._meta["db_router"] = router
+    return router
+
+
+def _route(document, collection, operation, write=False):
+    """Return the collection an operation on the given document class should
+    run against, according to its router.
+
+    The operations run within a session (e.g. in a transaction) aren't
+    routed, as they must use the client of the session and, in a
+    transaction, read from the primary.
+    """
+    router = get_router(document)
+    if router is None or _get_session() is not None:
+        return collection
+
+    if write:
+        alias = router.db_for_write(document, operation)
+        read_preference = None
+    else:
+        alias = router.db_for_read(document, operation)
+        read_preference = router.read_preference(document, operation)
+
+    if alias is not None and alias != document._meta.get(
+        "db_alias", DEFAULT_CONNECTION_NAME
+    ):
+        collection = get_db(alias)[collection.name]
+    if read_preference is not None:
+        collection = collection.with_options(read_preference=read_preference)
+    return collection
+
+
 class _LocalSessions(threading.local):
     def __init__(self):
         self.sessions = collections.deque()
@@ -515,3 +664,62 @@ def _get_session():
 
 def _clear_session():
     return _local_sessions.clear_current()
+
+
+def warm_up(aliases=None, min_pool_size=None):
+    """Connect and select a server for the given aliases, and create the
+    indexes of their document classes, so that this cost isn't paid by the
+    first requests served. Typically called from the ``post_fork`` hook of a
+    pre-fork server, as the clients aren't shared with the forked processes.
+
+    :param aliases: (optional) the alias or aliases to warm up, all the
+        registered connections by default
+    :param min_pool_size: (optional) the ``minPoolSize`` of the clients
+        created, so that the driver keeps that many connections open. It
+        doesn't apply to the aliases already connected, nor to the aliases
+        sharing the client of another alias with the same settings (a
+        warning is emitted then)
+    """
+    from mongoengine import Document
+    from mongoengine.base.common import _get_documents_by_db
+
+    if aliases is None:
+        aliases = list(_connection_settings)
+    elif isinstance(aliases, str):
+        aliases = [aliases]
+
+    for alias in aliases:
+        if (
+            min_pool_size is not None
+            and alias in _connection_settings
+            and alias not in _connections
+        ):
+            _open_connection(alias, minPoolSize=min_pool_size)
+        # Blocks until a server is selected and a connection is pooled
+        get_db(alias).command("ping")
+
+        for doc_cls in _get_documents_by_db(alias, DEFAULT_CONNECTION_NAME):
+            if issubclass(doc_cls, Document) and not doc_cls._meta.get("abstract"):
+                doc_cls._get_collection()
+                # _get_collection() only creates them with auto_create_index
+                if not doc_cls._meta.get("auto_create_index", True):
+                    doc_cls.ensure_indexes()
+
+
+def _reset_after_fork():
+    """Forget the clients inherited from the parent process, which can't be
+    used safely in a forked one. They are created again on first use.
+    """
+    from mongoengine import Document
+    from mongoengine.base.common import _document_registry
+
+    _connections.clear()
+    _dbs.clear()
+    _local_sessions.clear_all()
+    for doc_cls in _document_registry.values():
+        if issubclass(doc_cls, Document):
+            doc_cls._disconnect()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -7,17 +7,17 @@ from pymongo.errors import ConnectionFailure, OperationFailure
 from pymongo.read_concern import ReadConcern
 from pymongo.write_concern import WriteConcern
 
+from mongoengine import instrumentation
 from mongoengine.base.fields import _no_dereference_for_fields
 from mongoengine.common import _import_class
 from mongoengine.connection import (
     DEFAULT_CONNECTION_NAME,
     _clear_session,
-    _get_session,
     _set_session,
     get_connection,
     get_db,
 )
-from mongoengine.pymongo_support import count_documents
+from mongoengine.errors import OperationError
 
 __all__ = (
     "switch_db",
@@ -25,10 +25,12 @@ __all__ = (
     "no_dereference",
     "no_sub_classes",
     "query_counter",
+    "lazy_dereference_detector",
     "set_write_concern",
     "set_read_write_concern",
     "no_dereferencing_active_for_class",
     "run_in_transaction",
+    "defer_cached_reference_sync",
 )
 
 
@@ -36,6 +38,9 @@ class MyThreadLocals(threading.local):
     def __init__(self):
         # {DocCls: count} keeping track of classes with an active no_dereference context
         self.no_dereferencing_class = {}
+        # {CachedReferenceField: {referenced id: {path: value}}} while in a
+        # defer_cached_reference_sync context
+        self.cached_reference_updates = None
 
 
 thread_locals = MyThreadLocals()
@@ -56,6 +61,9 @@ def _unregister_no_dereferencing_for_class(cls):
         thread_locals.no_dereferencing_class.pop(cls)
 
 
+_missing = object()
+
+
 class switch_db:
     """switch_db alias context manager.
 
@@ -84,16 +92,24 @@ class switch_db:
         self.collection = cls._get_collection()
         self.db_alias = db_alias
         self.ori_db_alias = cls._meta.get("db_alias", DEFAULT_CONNECTION_NAME)
+        self.ori_meta_router = cls._meta.get("db_router", _missing)
 
     def __enter__(self):
-        """Change the db_alias and clear the cached collection."""
+        """Change the db_alias, bypass the router and clear the cached
+        collection.
+        """
         self.cls._meta["db_alias"] = self.db_alias
+        self.cls._meta["db_router"] = None
         self.cls._collection = None
         return self.cls
 
     def __exit__(self, t, value, traceback):
-        """Reset the db_alias and collection."""
+        """Reset the db_alias, router and collection."""
         self.cls._meta["db_alias"] = self.ori_db_alias
+        if self.ori_meta_router is _missing:
+            del self.cls._meta["db_router"]
+        else:
+            self.cls._meta["db_router"] = self.ori_meta_router
         self.cls._collection = self.collection
 
 
@@ -202,11 +218,11 @@ class no_sub_classes:
 
 class query_counter:
     """Query_counter context manager to get the number of queries.
-    This works by updating the `profiling_level` of the database so that all queries get logged,
-    resetting the db.system.profile collection at the beginning of the context and counting the new entries.
+    This works by listening to the commands sent to the database by the
+    client (through PyMongo's command monitoring), in the current thread.
 
-    This was designed for debugging purpose. In fact it is a global counter so queries issued by other threads/processes
-    can interfere with it
+    Queries issued by other threads or processes are not counted, nor are
+    the commands of clients that were not created by MongoEngine.
 
     Usage:
 
@@ -229,33 +245,28 @@ class query_counter:
     - Some queries are ignored by default by the counter (killcursors, db.system.indexes)
     """
 
+    # Commands that are not counted
+    ignored_commands = ("killCursors", "endSessions")
+
     def __init__(self, alias=DEFAULT_CONNECTION_NAME):
         self.db = get_db(alias=alias)
-        self.initial_profiling_level = None
-        self._ctx_query_counter = 0  # number of queries issued by the context
-
-        self._ignored_query = {
-            "ns": {"$ne": "%s.system.indexes" % self.db.name},
-            "op": {"$ne": "killcursors"},  # MONGODB < 3.2
-            "command.killCursors": {"$exists": False},  # MONGODB >= 3.2
-        }
+        self.commands = []  # the commands counted, as sent to the server
 
-    def _turn_on_profiling(self):
-        profile_update_res = self.db.command({"profile": 0}, session=_get_session())
-        self.initial_profiling_level = profile_update_res["was"]
-
-        self.db.system.profile.drop()
-        self.db.command({"profile": 2}, session=_get_session())
-
-    def _resets_profiling(self):
-        self.db.command({"profile": self.initial_profiling_level})
+    def _command_started(self, event):
+        if (
+            event.database_name != self.db.name
+            or event.command_name in self.ignored_commands
+            or event.command.get(event.command_name) == "system.indexes"
+        ):
+            return
+        self.commands.append(event.command)
 
     def __enter__(self):
-        self._turn_on_profiling()
+        instrumentation.command_counters.active().append(self)
         return self
 
     def __exit__(self, t, value, traceback):
-        self._resets_profiling()
+        instrumentation.command_counters.active().remove(self)
 
     def __eq__(self, value):
         counter = self._get_count()
@@ -284,18 +295,56 @@ class query_counter:
         return "%s" % self._get_count()
 
     def _get_count(self):
-        """Get the number of queries by counting the current number of entries in db.system.profile
-        and substracting the queries issued by this context. In fact everytime this is called, 1 query is
-        issued so we need to balance that
-        """
-        count = (
-            count_documents(self.db.system.profile, self._ignored_query)
-            - self._ctx_query_counter
-        )
-        self._ctx_query_counter += (
-            1  # Account for the query we just issued to gather the information
+        """Get the number of queries sent since entering the context."""
+        return len(self.commands)
+
+
+class lazy_dereference_detector:
+    """Context manager detecting the "N+1 queries" caused by references
+    dereferenced lazily, one document at a time: when the references held
+    by the same field get dereferenced for more than ``threshold`` documents
+    within the context, a warning is logged (along with the stack of the
+    code accessing the field), or an
+    :class:`~mongoengine.errors.OperationError` is raised if
+    ``raise_error`` is set.
+
+    Usage:
+
+    .. code-block:: python
+
+        with lazy_dereference_detector(threshold=5):
+            for book in Book.objects:
+                print(book.author.name)  # one query per book
+
+    Such references are better loaded for all the documents at once, with
+    :meth:`~mongoengine.queryset.QuerySet.select_related`.
+    """
+
+    def __init__(self, threshold=10, raise_error=False):
+        self.threshold = threshold
+        self.raise_error = raise_error
+        self.counts = {}  # number of lazy dereferences per field path
+
+    def __enter__(self):
+        instrumentation.active_detectors().append(self)
+        return self
+
+    def __exit__(self, t, value, traceback):
+        instrumentation.active_detectors().remove(self)
+
+    def _dereferenced(self, path):
+        count = self.counts[path] = self.counts.get(path, 0) + 1
+        if count != self.threshold + 1:
+            return
+
+        msg = (
+            "The references of %s were dereferenced one document at a time, "
+            "more than %d times. Consider loading them for all the documents "
+            "at once with select_related()" % (path, self.threshold)
         )
-        return count
+        if self.raise_error:
+            raise OperationError(msg)
+        logging.warning(msg, stack_info=True)
 
 
 @contextmanager
@@ -378,3 +427,36 @@ def run_in_transaction(
                 _commit_with_retry(session)
             finally:
                 _clear_session()
+
+
+@contextmanager
+def defer_cached_reference_sync():
+    """Coalesce the updates of the :class:`~mongoengine.fields.CachedReferenceField`
+    caches (``auto_sync``) of the documents saved within the context: they are
+    sent on exit, with one ``bulk_write`` per field and a single update per
+    referenced document however many times it was saved.
+
+    Example ::
+
+        with defer_cached_reference_sync():
+            for person in Person.objects(country="FR"):
+                person.tp = "pj"
+                person.save()
+
+    The updates are only sent when the context exits normally: if an
+    exception is raised within it (e.g. aborting a transaction), the pending
+    updates are dropped, and the caches can be refreshed later with
+    :meth:`~mongoengine.fields.CachedReferenceField.sync_all`.
+    """
+    if thread_locals.cached_reference_updates is not None:
+        # Flushed by the outermost context
+        yield
+        return
+
+    updates = thread_locals.cached_reference_updates = {}
+    try:
+        yield
+    finally:
+        thread_locals.cached_reference_updates = None
+    for field, field_updates in updates.items():
+        field._sync(field_updates)
@@ -1,5 +1,8 @@
+from time import perf_counter
+
 from bson import SON, DBRef
 
+from mongoengine import instrumentation
 from mongoengine.base import (
     BaseDict,
     BaseList,
@@ -99,7 +102,19 @@ class DeReference:
                         items = _get_items_from_dict(items)
 
         self.reference_map = self._find_references(items)
-        self.object_map = self._fetch_objects(doc_type=doc_type)
+        if instrumentation._listeners:
+            start = perf_counter()
+            self.object_map = self._fetch_objects(doc_type=doc_type)
+            instrumentation.publish(
+                "dereference",
+                type(instance) if instance is not None else None,
+                None,
+                perf_counter() - start,
+                docs_returned=len(self.object_map),
+                dereferences=sum(len(refs) for refs in self.reference_map.values()),
+            )
+        else:
+            self.object_map = self._fetch_objects(doc_type=doc_type)
         return self._attach_objects(items, 0, instance, name)
 
     def _find_references(self, items, depth=0):
@@ -1,11 +1,13 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 import pymongo
 from bson.dbref import DBRef
 from pymongo.read_preferences import ReadPreference
 
-from mongoengine import signals
+from mongoengine import instrumentation, signals
 from mongoengine.base import (
+    BaseArray,
     BaseDict,
     BaseDocument,
     BaseList,
@@ -14,11 +16,13 @@ from mongoengine.base import (
     TopLevelDocumentMetaclass,
     _DocumentRegistry,
 )
+from mongoengine.base.common import _document_registry
 from mongoengine.base.utils import NonOrderedList
 from mongoengine.common import _import_class
 from mongoengine.connection import (
     DEFAULT_CONNECTION_NAME,
     _get_session,
+    _route,
     get_db,
 )
 from mongoengine.context_managers import (
@@ -48,9 +52,14 @@ __all__ = (
     "InvalidCollectionError",
     "NotUniqueError",
     "MapReduceDocument",
+    "sync_indexes",
 )
 
 
+def _document_target(document):
+    return type(document), document._get_collection_name(), None
+
+
 def includes_cls(fields):
     """Helper function used for ensuring and comparing indexes."""
     first_field = None
@@ -96,6 +105,11 @@ class EmbeddedDocument(BaseDocument, metaclass=DocumentMetaclass):
         self._instance = None
         self._changed_fields = []
 
+    def _mark_as_changed(self, key):
+        # The indexes on that field of the lists holding it may be stale
+        EmbeddedDocumentList._field_changed(key)
+        super()._mark_as_changed(key)
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
             return self._data == other._data
@@ -357,6 +371,7 @@ class Document(BaseDocument, metaclass=TopLevelDocumentMetaclass):
 
         return True
 
+    @instrumentation.instrumented("save", _document_target)
     def save(
         self,
         force_insert=False,
@@ -421,7 +436,8 @@ class Document(BaseDocument, metaclass=TopLevelDocumentMetaclass):
         if self._meta.get("abstract"):
             raise InvalidDocumentError("Cannot save an abstract document.")
 
-        signals.pre_save.send(self.__class__, document=self, **signal_kwargs)
+        if signals.pre_save.has_receivers_for(self.__class__):
+            signals.pre_save.send(self.__class__, document=self, **signal_kwargs)
 
         if validate:
             self.validate(clean=clean)
@@ -432,9 +448,10 @@ class Document(BaseDocument, metaclass=TopLevelDocumentMetaclass):
         doc_id = self.to_mongo(fields=[self._meta["id_field"]])
         created = "_id" not in doc_id or self._created or force_insert
 
-        signals.pre_save_post_validation.send(
-            self.__class__, document=self, created=created, **signal_kwargs
-        )
+        if signals.pre_save_post_validation.has_receivers_for(self.__class__):
+            signals.pre_save_post_validation.send(
+                self.__class__, document=self, created=created, **signal_kwargs
+            )
         # it might be refreshed by the pre_save_post_validation hook, e.g., for etag generation
         doc = self.to_mongo()
 
@@ -490,9 +507,10 @@ class Document(BaseDocument, metaclass=TopLevelDocumentMetaclass):
         if created or id_field not in self._meta.get("shard_key", []):
             self[id_field] = self._fields[id_field].to_python(object_id)
 
-        signals.post_save.send(
-            self.__class__, document=self, created=created, **signal_kwargs
-        )
+        if signals.post_save.has_receivers_for(self.__class__):
+            signals.post_save.send(
+                self.__class__, document=self, created=created, **signal_kwargs
+            )
 
         self._clear_changed_fields()
         self._created = False
@@ -504,7 +522,7 @@ class Document(BaseDocument, metaclass=TopLevelDocumentMetaclass):
 
         Helper method, should only be used inside save().
         """
-        collection = self._get_collection()
+        collection = self._get_write_collection("save")
         with set_write_concern(collection, write_concern) as wc_collection:
             if force_insert:
                 return wc_collection.insert_one(doc, session=_get_session()).inserted_id
@@ -562,7 +580,7 @@ class Document(BaseDocument, metaclass=TopLevelDocumentMetaclass):
 
         Helper method, should only be used inside save().
         """
-        collection = self._get_collection()
+        collection = self._get_write_collection("save")
         object_id = doc["_id"]
         created = False
 
@@ -628,8 +646,21 @@ class Document(BaseDocument, metaclass=TopLevelDocumentMetaclass):
         if not hasattr(self, "__objects"):
             queryset_class = self._meta.get("queryset_class", QuerySet)
             self.__objects = queryset_class(self.__class__, self._get_collection())
+            if "_get_collection" in self.__dict__:
+                # Switched with switch_db or switch_collection, don't route
+                self.__objects._routing = False
         return self.__objects
 
+    def _get_write_collection(self, operation):
+        """Return the collection the document should be written to, routed
+        by the router of the document class unless the database or the
+        collection of this instance were switched.
+        """
+        collection = self._get_collection()
+        if "_get_collection" in self.__dict__:
+            return collection
+        return _route(self.__class__, collection, operation, write=True)
+
     @property
     def _object_key(self):
         """Return a query dict that can be used to fetch this document.
@@ -671,6 +702,7 @@ class Document(BaseDocument, metaclass=TopLevelDocumentMetaclass):
         # Need to add shard key to query, or you get an error
         return self._qs.filter(**self._object_key).update_one(**kwargs)
 
+    @instrumentation.instrumented("delete", _document_target)
     def delete(self, signal_kwargs=None, **write_concern):
         """Delete the :class:`~mongoengine.Document` from the database. This
         will only take effect if the document has been previously saved.
@@ -684,7 +716,8 @@ class Document(BaseDocument, metaclass=TopLevelDocumentMetaclass):
             will force an fsync on the primary server.
         """
         signal_kwargs = signal_kwargs or {}
-        signals.pre_delete.send(self.__class__, document=self, **signal_kwargs)
+        if signals.pre_delete.has_receivers_for(self.__class__):
+            signals.pre_delete.send(self.__class__, document=self, **signal_kwargs)
 
         # Delete FileFields separately
         FileField = _import_class("FileField")
@@ -699,7 +732,8 @@ class Document(BaseDocument, metaclass=TopLevelDocumentMetaclass):
         except pymongo.errors.OperationFailure as err:
             message = "Could not delete document (%s)" % err.args
             raise OperationError(message)
-        signals.post_delete.send(self.__class__, document=self, **signal_kwargs)
+        if signals.post_delete.has_receivers_for(self.__class__):
+            signals.post_delete.send(self.__class__, document=self, **signal_kwargs)
 
     def switch_db(self, db_alias, keep_created=True):
         """
@@ -768,6 +802,7 @@ class Document(BaseDocument, metaclass=TopLevelDocumentMetaclass):
         DeReference()([self], max_depth + 1)
         return self
 
+    @instrumentation.instrumented("reload", _document_target)
     def reload(self, *fields, **kwargs):
         """Reloads all attributes from the database.
 
@@ -832,6 +867,8 @@ class Document(BaseDocument, metaclass=TopLevelDocumentMetaclass):
         elif isinstance(value, BaseList):
             value = [self._reload(key, v) for v in value]
             value = BaseList(value, self, key)
+        elif isinstance(value, BaseArray):
+            value = BaseArray(value.typecode, value, self, key)
         elif isinstance(value, (EmbeddedDocument, DynamicEmbeddedDocument)):
             value._instance = None
             value._changed_fields = []
@@ -921,10 +958,20 @@ class Document(BaseDocument, metaclass=TopLevelDocumentMetaclass):
                   `auto_create_index` to False in the documents meta data
         """
         background = cls._meta.get("index_background", False)
+        collection = cls._get_collection()
+        for fields, opts in cls._get_index_definitions():
+            collection.create_index(
+                fields, background=background, session=_get_session(), **opts
+            )
+
+    @classmethod
+    def _get_index_definitions(cls):
+        """Return the fields and the options of the indexes defined in the
+        meta data of this Document class, as ``(fields, options)`` tuples.
+        """
         index_opts = cls._meta.get("index_opts") or {}
         index_cls = cls._meta.get("index_cls", True)
-
-        collection = cls._get_collection()
+        definitions = []
 
         # determine if an index which we are creating includes
         # _cls as its first field; if so, we can avoid creating
@@ -947,21 +994,18 @@ class Document(BaseDocument, metaclass=TopLevelDocumentMetaclass):
                 if "cls" in opts:
                     del opts["cls"]
 
-                collection.create_index(
-                    fields, background=background, session=_get_session(), **opts
-                )
+                definitions.append((fields, opts))
 
         # If _cls is being used (for polymorphism), it needs an index,
         # only if another index doesn't begin with _cls
         if index_cls and not cls_indexed and cls._meta.get("allow_inheritance"):
             # we shouldn't pass 'cls' to the collection.ensureIndex options
             # because of https://jira.mongodb.org/browse/SERVER-769
-            if "cls" in index_opts:
-                del index_opts["cls"]
+            opts = index_opts.copy()
+            opts.pop("cls", None)
+            definitions.append(([("_cls", 1)], opts))
 
-            collection.create_index(
-                "_cls", background=background, session=_get_session(), **index_opts
-            )
+        return definitions
 
     @classmethod
     def list_indexes(cls):
@@ -1158,3 +1202,85 @@ class MapReduceDocument:
             self._key_object = self._document.objects.with_id(self.key)
             return self._key_object
         return self._key_object
+
+
+def _sync_collection_indexes(collection, definitions, background, dry_run):
+    """Create the indexes of ``definitions`` missing from ``collection`` with
+    a single ``createIndexes`` command, and return their names.
+    """
+    existing_names = set()
+    existing_keys = []
+    for info in collection.list_indexes(session=_get_session()):
+        existing_names.add(info["name"])
+        existing_keys.append(list(info["key"].items()))
+
+    missing = []
+    for fields, opts in definitions:
+        model = pymongo.IndexModel(fields, background=background, **opts)
+        name = model.document["name"]
+        if name in existing_names or list(fields) in existing_keys:
+            continue
+        existing_names.add(name)
+        missing.append(model)
+
+    if missing and not dry_run:
+        collection.create_indexes(missing, session=_get_session())
+    return [model.document["name"] for model in missing]
+
+
+def _get_collection_without_indexes(doc_cls):
+    """Return the collection of ``doc_cls`` like ``_get_collection()`` does,
+    but without ensuring its indexes one by one when ``auto_create_index``
+    is on.
+    """
+    collection = getattr(doc_cls, "_collection", None)
+    if collection is not None:
+        return collection
+    if doc_cls._meta.get("max_size") or doc_cls._meta.get("max_documents"):
+        return doc_cls._get_capped_collection()
+    if doc_cls._meta.get("timeseries"):
+        return doc_cls._get_timeseries_collection()
+    return doc_cls._get_db()[doc_cls._get_collection_name()]
+
+
+def sync_indexes(document_classes=None, background=True, dry_run=False, workers=None):
+    """Create the indexes missing from the collections of the given Document
+    classes, e.g. when deploying or starting a service with
+    ``auto_create_index`` turned off.
+
+    The existing indexes of each collection are listed with a single
+    ``listIndexes`` command, and the missing ones are created with a single
+    ``createIndexes`` command.
+
+    :param document_classes: (optional) the Document classes whose indexes
+        should be synced, all the registered ones by default
+    :param background: build the indexes in the background (ignored by
+        MongoDB 4.2+, which never blocks the collection while building them)
+    :param dry_run: only return the names of the missing indexes, without
+        creating them
+    :param workers: (optional) the number of collections synced concurrently
+    :return: a dict mapping the full name of each collection to the names of
+        the indexes that were (or would be) created
+    """
+    if document_classes is None:
+        document_classes = list(_document_registry.values())
+
+    collections = {}
+    for doc_cls in document_classes:
+        if not issubclass(doc_cls, Document) or doc_cls._meta.get("abstract"):
+            continue
+        collection = _get_collection_without_indexes(doc_cls)
+        _, definitions = collections.setdefault(collection.full_name, (collection, []))
+        definitions.extend(doc_cls._get_index_definitions())
+
+    def sync(item):
+        collection, definitions = item
+        return _sync_collection_indexes(collection, definitions, background, dry_run)
+
+    items = list(collections.values())
+    if workers and len(items) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(sync, items))
+    else:
+        results = [sync(item) for item in items]
+    return dict(zip(collections, results))
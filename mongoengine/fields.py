@@ -1,20 +1,27 @@
+import array
 import datetime
 import decimal
 import inspect
 import itertools
+import logging
+import os
 import re
 import socket
+import sys
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from inspect import isclass
-from io import BytesIO
+from io import SEEK_CUR, SEEK_END, SEEK_SET, BytesIO, RawIOBase
 from operator import itemgetter
 
 import gridfs
 import pymongo
 from bson import SON, Binary, DBRef, ObjectId
 from bson.decimal128 import Decimal128, create_decimal128_context
-from pymongo import ReturnDocument
+from pymongo import ReturnDocument, UpdateMany
 
 try:
     import dateutil
@@ -23,7 +30,9 @@ except ImportError:
 else:
     import dateutil.parser
 
+from mongoengine import instrumentation
 from mongoengine.base import (
+    BaseArray,
     BaseDocument,
     BaseField,
     ComplexBaseField,
@@ -39,6 +48,7 @@ from mongoengine.connection import (
     _get_session,
     get_db,
 )
+from mongoengine.context_managers import thread_locals
 from mongoengine.document import Document, EmbeddedDocument
 from mongoengine.errors import (
     DoesNotExist,
@@ -79,6 +89,7 @@ __all__ = (
     "DynamicField",
     "ListField",
     "SortedListField",
+    "ArrayField",
     "EmbeddedDocumentListField",
     "DictField",
     "MapField",
@@ -88,8 +99,10 @@ __all__ = (
     "GenericLazyReferenceField",
     "GenericReferenceField",
     "BinaryField",
+    "VectorField",
     "GridFSError",
     "GridFSProxy",
+    "GridFSReader",
     "FileField",
     "ImageGridFsProxy",
     "ImproperlyConfigured",
@@ -1017,6 +1030,139 @@ class SortedListField(ListField):
         return sorted(value, reverse=self._order_reverse)
 
 
+class ArrayField(BaseField):
+    """A list of numbers of the same type, held in a compact
+    :class:`array.array` rather than a list of Python objects, e.g. for
+    time series or measurements::
+
+        class Series(Document):
+            samples = ArrayField("d")
+
+    The values are stored as a regular array by default, or as a single
+    binary blob with ``binary=True``, which is much faster to load and
+    smaller on disk but can't be queried element-wise. As arrays support the
+    buffer protocol, ``numpy.frombuffer(series.samples)`` gives a NumPy view
+    of the values without copying them.
+
+    Any change to the array marks the whole field as changed.
+
+    .. note::
+        The size of the items of some type codes depends on the platform
+        (e.g. "l"), prefer the ones with a fixed size (e.g. "i", "q", "f",
+        "d") with ``binary=True``.
+    """
+
+    TYPECODES = "bBhHiIlLqQfd"
+
+    def __init__(self, typecode="d", *, binary=False, max_length=None, **kwargs):
+        """
+        :param typecode: the :mod:`array` type code of the items, e.g. "d"
+            for floats or "q" for 64-bit integers
+        :param binary: whether to store the array as a binary blob rather than
+            as an array
+        :param max_length: maximum number of items in the array
+        :param kwargs: Keyword arguments passed into the parent :class:`~mongoengine.BaseField`
+        """
+        if typecode not in self.TYPECODES:
+            raise ValueError(
+                "Invalid typecode %r, expected one of %r" % (typecode, self.TYPECODES)
+            )
+        self.typecode = typecode
+        self.binary = binary
+        self.max_length = max_length
+        kwargs.setdefault("default", partial(array.array, typecode))
+        super().__init__(**kwargs)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            # Document class being used rather than a document object
+            return self
+
+        # Convert the value so we can watch for any changes on it
+        value = instance._data.get(self.name)
+        if value is not None and not isinstance(value, BaseArray):
+            array_value = self.to_python(value)
+            # Values which can't be converted are left to validate()
+            if (
+                isinstance(array_value, array.array)
+                and array_value.typecode == self.typecode
+            ):
+                value = BaseArray(self.typecode, array_value, instance, self.name)
+                instance._data[self.name] = value
+        return value
+
+    def to_python(self, value):
+        if isinstance(value, array.array) and value.typecode == self.typecode:
+            return value
+        if isinstance(value, bytes):
+            if len(value) % array.array(self.typecode).itemsize:
+                return value
+            # Binary blobs are always little-endian
+            value_array = array.array(self.typecode)
+            value_array.frombytes(value)
+            if sys.byteorder == "big":
+                value_array.byteswap()
+            return value_array
+        try:
+            return array.array(self.typecode, value)
+        except (TypeError, ValueError, OverflowError):
+            return value
+
+    def to_mongo(self, value):
+        value = self.to_python(value)
+        if not isinstance(value, array.array):
+            return value
+        if self.binary:
+            if sys.byteorder == "big":
+                value = array.array(self.typecode, value)
+                value.byteswap()
+            return Binary(value.tobytes())
+        return value.tolist()
+
+    def validate(self, value):
+        if not isinstance(value, (array.array, list, tuple)):
+            self.error("ArrayField only accepts arrays, lists and tuples")
+
+        if isinstance(value, array.array):
+            if value.typecode != self.typecode:
+                self.error(
+                    "Expected an array of type %r, got %r"
+                    % (self.typecode, value.typecode)
+                )
+        else:
+            try:
+                array.array(self.typecode, value)
+            except (TypeError, OverflowError) as e:
+                self.error(
+                    "Invalid items for an array of type %r: %s" % (self.typecode, e)
+                )
+
+        if self.required and not value:
+            self.error("Field is required and cannot be empty")
+
+        if self.max_length is not None and len(value) > self.max_length:
+            self.error("Array is too long")
+
+    def prepare_query_value(self, op, value):
+        if (
+            op in ("push", "pull", "pushAll", "pullAll", "addToSet")
+            and not self.binary
+            and not isinstance(value, (array.array, list, tuple))
+        ):
+            # A single item added to or removed from the array
+            try:
+                return array.array(self.typecode, [value])[0]
+            except (TypeError, OverflowError) as e:
+                self.error(
+                    "Invalid item for an array of type %r: %s" % (self.typecode, e)
+                )
+        if isinstance(value, array.array) or (
+            op in ("set", None) and isinstance(value, (list, tuple))
+        ):
+            return self.to_mongo(value)
+        return super().prepare_query_value(op, value)
+
+
 def key_not_string(d):
     """Helper function to recursively determine if any key in a
     dictionary is not a string.
@@ -1208,6 +1354,7 @@ class ReferenceField(BaseField):
                 cls = self.document_type
 
             instance._data[self.name] = self._lazy_load_ref(cls, ref_value)
+            instrumentation.lazy_dereference(f"{instance._class_name}.{self.name}")
 
         return super().__get__(instance, owner)
 
@@ -1310,16 +1457,34 @@ class CachedReferenceField(BaseField):
         if created:
             return None
 
-        update_kwargs = {
-            f"set__{self.name}__{key}": val
+        update = {
+            f"{self.db_field}.{key}": val
             for key, val in document._delta()[0].items()
             if key in self.fields
         }
-        if update_kwargs:
-            filter_kwargs = {}
-            filter_kwargs[self.name] = document
+        if update:
+            id_field = self.document_type._fields[self.document_type._meta["id_field"]]
+            pk = id_field.to_mongo(document.pk)
+            pending = thread_locals.cached_reference_updates
+            if pending is not None:
+                # Coalesced by a `defer_cached_reference_sync` context
+                pending.setdefault(self, {}).setdefault(pk, {}).update(update)
+            else:
+                self._sync({pk: update})
 
-            self.owner_document.objects(**filter_kwargs).update(**update_kwargs)
+    def _sync(self, updates):
+        """Update the cached copies in the owner collection with a single
+        ``bulk_write``, ``updates`` mapping the ids of the referenced
+        documents to the ``$set`` to apply.
+        """
+        query = self.owner_document.objects._query
+        requests = [
+            UpdateMany({**query, "%s._id" % self.db_field: pk}, {"$set": update})
+            for pk, update in updates.items()
+        ]
+        if requests:
+            collection = self.owner_document.objects._write_collection("update")
+            collection.bulk_write(requests, ordered=False, session=_get_session())
 
     def to_python(self, value):
         if isinstance(value, dict):
@@ -1360,6 +1525,7 @@ class CachedReferenceField(BaseField):
         # Dereference DBRefs
         if auto_dereference and isinstance(value, DBRef):
             instance._data[self.name] = self._lazy_load_ref(self.document_type, value)
+            instrumentation.lazy_dereference(f"{instance._class_name}.{self.name}")
 
         return super().__get__(instance, owner)
 
@@ -1412,21 +1578,26 @@ class CachedReferenceField(BaseField):
     def lookup_member(self, member_name):
         return self.document_type._fields.get(member_name)
 
-    def sync_all(self):
+    def sync_all(self, batch_size=1000):
         """
         Sync all cached fields on demand.
-        Caution: this operation may be slower.
-        """
-        update_key = "set__%s" % self.name
-
-        for doc in self.document_type.objects:
-            filter_kwargs = {}
-            filter_kwargs[self.name] = doc
 
-            update_kwargs = {}
-            update_kwargs[update_key] = doc
+        The cached fields of the referenced documents are streamed and the
+        documents referring to them are updated with one ``bulk_write`` per
+        ``batch_size`` referenced documents.
+        """
+        queryset = self.document_type.objects.no_cache().batch_size(batch_size)
+        if self.fields:
+            queryset = queryset.only(*self.fields)
 
-            self.owner_document.objects(**filter_kwargs).update(**update_kwargs)
+        updates = {}
+        for doc in queryset:
+            value = self.to_mongo(doc)
+            updates[value["_id"]] = {self.db_field: value}
+            if len(updates) >= batch_size:
+                self._sync(updates)
+                updates = {}
+        self._sync(updates)
 
 
 class GenericReferenceField(BaseField):
@@ -1493,6 +1664,7 @@ class GenericReferenceField(BaseField):
         if auto_dereference and isinstance(value, dict):
             doc_cls = _DocumentRegistry.get(value["_cls"])
             instance._data[self.name] = self._lazy_load_ref(doc_cls, value["_ref"])
+            instrumentation.lazy_dereference(f"{instance._class_name}.{self.name}")
 
         return super().__get__(instance, owner)
 
@@ -1571,6 +1743,119 @@ class BinaryField(BaseField):
         return super().prepare_query_value(op, self.to_mongo(value))
 
 
+class VectorField(BinaryField):
+    """A vector of numbers of the same type (e.g. an embedding), stored as a
+    packed binary value rather than an array of BSON numbers::
+
+        class Chunk(Document):
+            text = StringField()
+            embedding = VectorField("float32", dim=768)
+
+    The values are returned as a read-only :class:`memoryview` over the
+    bytes loaded from the database, without decoding them into Python
+    numbers: use ``numpy.asarray(chunk.embedding)`` to get a NumPy view of
+    the vector, or ``chunk.embedding.tolist()`` to get a list. Lists, arrays
+    and objects supporting the buffer protocol (e.g. NumPy arrays) can be
+    assigned.
+
+    The vectors are stored as little-endian raw bytes by default, or with
+    ``vector_subtype=True`` as BSON binary vectors (subtype 9, for the
+    "float32" and "int8" types only), as used by MongoDB Vector Search.
+    """
+
+    # Formats of the items of each type, as used by array and memoryview
+    DTYPES = {
+        "float32": "f",
+        "float64": "d",
+        "int8": "b",
+        "int16": "h",
+        "int32": "i",
+        "int64": "q",
+    }
+    # Headers (type and padding bytes) of the BSON binary vectors
+    VECTOR_DTYPES = {"float32": b"\x27\x00", "int8": b"\x03\x00"}
+    VECTOR_SUBTYPE = 9
+
+    def __init__(self, dtype="float32", dim=None, *, vector_subtype=False, **kwargs):
+        """
+        :param dtype: the type of the items, one of "float32", "float64",
+            "int8", "int16", "int32" and "int64"
+        :param dim: the number of dimensions the vectors must have, if any
+        :param vector_subtype: whether to store the vectors as BSON binary
+            vectors rather than raw bytes
+        :param kwargs: Keyword arguments passed into the parent :class:`~mongoengine.BinaryField`
+        """
+        if dtype not in self.DTYPES:
+            raise ValueError(
+                "Invalid dtype %r, expected one of %s" % (dtype, ", ".join(self.DTYPES))
+            )
+        if vector_subtype and dtype not in self.VECTOR_DTYPES:
+            raise ValueError(
+                "BSON binary vectors can't hold %s values, only %s"
+                % (dtype, " and ".join(self.VECTOR_DTYPES))
+            )
+        self.dtype = dtype
+        self.dim = dim
+        self.vector_subtype = vector_subtype
+        self._format = self.DTYPES[dtype]
+        super().__init__(**kwargs)
+
+    def __set__(self, instance, value):
+        return BaseField.__set__(self, instance, self.to_python(value))
+
+    def to_python(self, value):
+        if isinstance(value, bytes):
+            # Raw bytes or BSON binary vector loaded from the database
+            view = memoryview(value)
+            if isinstance(value, Binary) and value.subtype == self.VECTOR_SUBTYPE:
+                if value[:2] != self.VECTOR_DTYPES.get(self.dtype):
+                    return value
+                view = view[2:]
+            if len(view) % array.array(self._format).itemsize:
+                return value
+            if sys.byteorder == "big":
+                value_array = array.array(self._format)
+                value_array.frombytes(view)
+                value_array.byteswap()
+                return memoryview(value_array)
+            return view.cast(self._format)
+
+        try:
+            view = memoryview(value)
+        except TypeError:
+            pass
+        else:
+            if view.format == self._format and view.ndim == 1:
+                return view
+
+        try:
+            return memoryview(array.array(self._format, value))
+        except (TypeError, ValueError, OverflowError):
+            return value
+
+    def to_mongo(self, value):
+        value = self.to_python(value)
+        if not isinstance(value, memoryview):
+            return value
+        if sys.byteorder == "big":
+            value = array.array(self._format, value)
+            value.byteswap()
+        if self.vector_subtype:
+            return Binary(
+                self.VECTOR_DTYPES[self.dtype] + value.tobytes(), self.VECTOR_SUBTYPE
+            )
+        return Binary(value.tobytes())
+
+    def validate(self, value):
+        if not isinstance(value, memoryview) or value.format != self._format:
+            self.error("VectorField only accepts sequences of %s values" % self.dtype)
+
+        if self.dim is not None and len(value) != self.dim:
+            self.error(
+                "Expected a vector of %d dimensions, got %d" % (self.dim, len(value))
+            )
+
+
 class EnumField(BaseField):
     """Enumeration Field. Values are stored underneath as is,
     so it will only work with simple types (str, int, etc) that
@@ -1650,6 +1935,10 @@ class EnumField(BaseField):
         return super().prepare_query_value(op, self.to_mongo(value))
 
 
+# Size of the batches of chunks inserted at once by GridFSProxy.put(workers=N)
+GRIDFS_UPLOAD_BATCH_SIZE = 16 * 1024 * 1024
+
+
 class GridFSError(Exception):
     pass
 
@@ -1759,15 +2048,101 @@ class GridFSProxy:
         self.grid_id = self.newfile._id
         self._mark_as_changed()
 
-    def put(self, file_obj, **kwargs):
+    def put(self, file_obj, workers=None, **kwargs):
+        """Store the content of ``file_obj`` (bytes or a file-like object) as
+        the file. Keyword arguments are stored as attributes of the file.
+
+        :param workers: upload the chunks of the file in batches from that
+            many threads, rather than one at a time from the current thread
+        """
         if self.grid_id:
             raise GridFSError(
                 "This document already has a file. Either delete "
                 "it or call replace to overwrite it"
             )
-        self.grid_id = self.fs.put(file_obj, **kwargs)
+        if workers is None:
+            self.grid_id = self.fs.put(file_obj, **kwargs)
+        else:
+            self.grid_id = self._put_batched(file_obj, workers, **kwargs)
         self._mark_as_changed()
 
+    def _put_batched(self, file_obj, workers, **kwargs):
+        # Insert the chunks with insert_many() from a pool of threads, then
+        # the files document, as done by GridIn
+        if isinstance(file_obj, str):
+            if "encoding" not in kwargs:
+                raise TypeError("An encoding is required to put str values")
+            file_obj = file_obj.encode(kwargs["encoding"])
+        if isinstance(file_obj, (bytes, bytearray, memoryview)):
+            file_obj = BytesIO(file_obj)
+
+        chunk_size = kwargs.pop("chunk_size", kwargs.pop("chunkSize", None))
+        file_doc = {
+            "_id": kwargs.pop("_id", None) or ObjectId(),
+            "chunkSize": chunk_size or gridfs.DEFAULT_CHUNK_SIZE,
+        }
+        if "content_type" in kwargs:
+            kwargs["contentType"] = kwargs.pop("content_type")
+        file_doc.update(kwargs)
+
+        collection = get_db(self.db_alias)[self.collection_name]
+        session = _get_session()
+        if collection.files.find_one({}, {"_id": 1}, session=session) is None:
+            collection.files.create_index(
+                [("filename", 1), ("uploadDate", 1)], session=session
+            )
+            collection.chunks.create_index(
+                [("files_id", 1), ("n", 1)], unique=True, session=session
+            )
+
+        def insert(batch):
+            collection.chunks.insert_many(batch, ordered=False, session=session)
+
+        def batches():
+            batch, batch_size, n = [], 0, 0
+            data = file_obj.read(file_doc["chunkSize"])
+            while data:
+                batch.append(
+                    {"files_id": file_doc["_id"], "n": n, "data": Binary(data)}
+                )
+                batch_size += len(data)
+                n += 1
+                if batch_size >= GRIDFS_UPLOAD_BATCH_SIZE:
+                    yield batch
+                    batch, batch_size = [], 0
+                data = file_obj.read(file_doc["chunkSize"])
+            if batch:
+                yield batch
+
+        length = 0
+        try:
+            if session is not None:
+                # Sessions can't be shared between threads
+                for batch in batches():
+                    insert(batch)
+                    length += sum(len(chunk["data"]) for chunk in batch)
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    pending = []
+                    for batch in batches():
+                        # Bound the number of batches held in memory
+                        if len(pending) >= 2 * workers:
+                            pending.pop(0).result()
+                        pending.append(executor.submit(insert, batch))
+                        length += sum(len(chunk["data"]) for chunk in batch)
+                    for future in pending:
+                        future.result()
+
+            file_doc["length"] = length
+            file_doc["uploadDate"] = datetime.datetime.now(datetime.timezone.utc)
+            collection.files.insert_one(file_doc, session=session)
+        except BaseException:
+            collection.chunks.delete_many(
+                {"files_id": file_doc["_id"]}, session=session
+            )
+            raise
+        return file_doc["_id"]
+
     def write(self, string):
         if self.grid_id:
             if not self.newfile:
@@ -1795,6 +2170,86 @@ class GridFSProxy:
             except Exception:
                 return ""
 
+    def iter_chunks(self, chunk_size=None, start=0, end=None):
+        """Iterate over the content of the file, or over the bytes from
+        ``start`` to ``end`` (excluded), without loading it all in memory.
+
+        :param chunk_size: the size of the blocks of bytes to yield, the
+            GridFS chunks of the file are yielded as they are stored when
+            None
+        :param start: the position of the first byte to return
+        :param end: the position after the last byte to return, the end of
+            the file when None
+        """
+        gridout = self.get()
+        if gridout is None:
+            return
+        start, end = self._check_range(gridout, start, end)
+        if start >= end:
+            return
+
+        if chunk_size is None:
+            yield from self._iter_range(gridout, start, end)
+            return
+
+        buffer = bytearray()
+        for data in self._iter_range(gridout, start, end):
+            buffer += data
+            while len(buffer) >= chunk_size:
+                yield bytes(buffer[:chunk_size])
+                del buffer[:chunk_size]
+        if buffer:
+            yield bytes(buffer)
+
+    def read_range(self, start, end=None):
+        """Return the bytes of the file from ``start`` to ``end`` (excluded),
+        only fetching the GridFS chunks holding them, e.g. to answer HTTP
+        range requests.
+        """
+        if self.get() is None:
+            return None
+        return b"".join(self.iter_chunks(start=start, end=end))
+
+    def open(self):
+        """Return a :class:`~mongoengine.fields.GridFSReader` reading the
+        file, independently of the position of :meth:`read`.
+        """
+        gridout = self.get()
+        if gridout is None:
+            return None
+        return GridFSReader(self, gridout)
+
+    def _check_range(self, gridout, start, end):
+        if start < 0 or (end is not None and end < 0):
+            raise ValueError("Negative positions are not supported")
+        if end is None or end > gridout.length:
+            end = gridout.length
+        return start, end
+
+    def _iter_range(self, gridout, start, end):
+        # Fetch the chunks holding the bytes from start to end (excluded)
+        chunk_size = gridout.chunk_size
+        first, last = start // chunk_size, (end - 1) // chunk_size
+        chunks = get_db(self.db_alias)[self.collection_name].chunks.find(
+            {"files_id": gridout._id, "n": {"$gte": first, "$lte": last}},
+            sort=[("n", 1)],
+            session=_get_session(),
+        )
+        expected = first
+        for chunk in chunks:
+            if chunk["n"] != expected:
+                raise gridfs.errors.CorruptGridFile(
+                    "Missing chunk %d of file %s" % (expected, gridout._id)
+                )
+            offset = expected * chunk_size
+            begin, stop = max(start - offset, 0), end - offset
+            yield bytes(chunk["data"][begin:stop])
+            expected += 1
+        if expected <= last:
+            raise gridfs.errors.CorruptGridFile(
+                "Missing chunk %d of file %s" % (expected, gridout._id)
+            )
+
     def delete(self):
         # Delete file from GridFS, FileField still remains
         self.fs.delete(self.grid_id, session=_get_session())
@@ -1816,6 +2271,73 @@ class GridFSProxy:
             self.instance._mark_as_changed(self.key)
 
 
+class GridFSReader(RawIOBase):
+    """Read-only, seekable file-like object reading a file stored in GridFS
+    one chunk at a time, returned by :meth:`GridFSProxy.open`.
+
+    It supports :meth:`readinto` to fill a buffer provided by the caller,
+    and can be wrapped in an :class:`io.BufferedReader`.
+    """
+
+    def __init__(self, proxy, gridout):
+        super().__init__()
+        self._proxy = proxy
+        self._gridout = gridout
+        self._position = 0
+        # The last chunk fetched, and its index
+        self._chunk = None
+        self._chunk_n = None
+
+    @property
+    def length(self):
+        return self._gridout.length
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=SEEK_SET):
+        if whence == SEEK_SET:
+            position = offset
+        elif whence == SEEK_CUR:
+            position = self._position + offset
+        elif whence == SEEK_END:
+            position = self.length + offset
+        else:
+            raise ValueError("Invalid whence (%r)" % whence)
+        if position < 0:
+            raise ValueError("Negative seek position %d" % position)
+        self._position = position
+        return position
+
+    def readinto(self, buffer):
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        view = memoryview(buffer).cast("B")
+        size = min(len(view), self.length - self._position)
+        if size <= 0:
+            return 0
+
+        chunk_size = self._gridout.chunk_size
+        n, offset = divmod(self._position, chunk_size)
+        if n != self._chunk_n:
+            # Only fetch the chunk holding the current position
+            end = min((n + 1) * chunk_size, self.length)
+            (self._chunk,) = self._proxy._iter_range(self._gridout, n * chunk_size, end)
+            self._chunk_n = n
+
+        stop = offset + size
+        data = memoryview(self._chunk)[offset:stop]
+        view[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
 class FileField(BaseField):
     """A GridFS storage field."""
 
@@ -1898,6 +2420,47 @@ class FileField(BaseField):
                 self.error("Invalid GridFSProxy value")
 
 
+# Number of threads processing the images of the ImageFields with
+# processing="background"
+IMAGE_PROCESSING_WORKERS = 2
+
+logger = logging.getLogger(__name__)
+
+_image_executor = None
+_image_executor_lock = threading.Lock()
+
+
+def _get_image_executor():
+    global _image_executor
+    with _image_executor_lock:
+        if _image_executor is None:
+            _image_executor = ThreadPoolExecutor(
+                max_workers=IMAGE_PROCESSING_WORKERS,
+                thread_name_prefix="mongoengine-images",
+            )
+        return _image_executor
+
+
+def _reset_image_executor():
+    # The threads of the executor don't survive a fork
+    global _image_executor, _image_executor_lock
+    _image_executor = None
+    _image_executor_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_image_executor)
+
+
+def _log_image_processing_error(future):
+    # The callers may never wait for the processing, don't lose its errors
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(
+            "Background processing of an image failed",
+            exc_info=future.exception(),
+        )
+
+
 class ImageGridFsProxy(GridFSProxy):
     """Proxy for ImageField"""
 
@@ -1905,11 +2468,15 @@ class ImageGridFsProxy(GridFSProxy):
         """
         Insert a image in database
         applying field properties (size, thumbnail_size)
+
+        With ``processing="background"``, the image is stored as is and a
+        :class:`~concurrent.futures.Future` of its processing is returned.
+        Processing errors are also logged, whether the future is waited for
+        or not.
         """
-        field = self.instance._fields[self.key]
-        # Handle nested fields
-        if hasattr(field, "field") and isinstance(field.field, FileField):
-            field = field.field
+        field = self._field()
+        if field.processing != "eager":
+            return self._put_deferred(file_obj, field, **kwargs)
 
         try:
             img = Image.open(file_obj)
@@ -1930,6 +2497,34 @@ class ImageGridFsProxy(GridFSProxy):
         else:
             progressive = False
 
+        img, thumbnail = self._resize(img, field)
+
+        if thumbnail:
+            thumb_id = self._put_thumbnail(thumbnail, img_format, progressive)
+        else:
+            thumb_id = None
+
+        w, h = img.size
+
+        io = BytesIO()
+        img.save(io, img_format, progressive=progressive)
+        io.seek(0)
+
+        return super().put(
+            io, width=w, height=h, format=img_format, thumbnail_id=thumb_id, **kwargs
+        )
+
+    def _field(self):
+        field = self.instance._fields[self.key]
+        # Handle nested fields
+        if hasattr(field, "field") and isinstance(field.field, FileField):
+            field = field.field
+        return field
+
+    def _resize(self, img, field):
+        """Return the image capped to the size of the field, and its
+        thumbnail if the field has a thumbnail size.
+        """
         if field.size and (
             img.size[0] > field.size["width"] or img.size[1] > field.size["height"]
         ):
@@ -1950,26 +2545,109 @@ class ImageGridFsProxy(GridFSProxy):
                 thumbnail = img.copy()
                 thumbnail.thumbnail((size["width"], size["height"]), LANCZOS)
 
-        if thumbnail:
-            thumb_id = self._put_thumbnail(thumbnail, img_format, progressive)
-        else:
-            thumb_id = None
+        return img, thumbnail
+
+    def _put_deferred(self, file_obj, field, **kwargs):
+        # Store the original image right away, only reading its header
+        data = file_obj if isinstance(file_obj, bytes) else file_obj.read()
+        try:
+            img = Image.open(BytesIO(data))
+        except Exception as e:
+            raise ValidationError("Invalid image: %s" % e)
 
         w, h = img.size
+        super().put(data, width=w, height=h, format=img.format, **kwargs)
+        if field.processing == "background":
+            future = _get_image_executor().submit(self.process)
+            future.add_done_callback(_log_image_processing_error)
+            return future
+
+    def process(self):
+        """Store the image capped to the size of the field and its thumbnail,
+        for images stored by fields with deferred processing, and record them
+        on the stored image. Does nothing if the image was already processed.
+        """
+        files = get_db(self.db_alias)[self.collection_name].files
+        session = _get_session()
+
+        # Claim the image, so that it only gets processed once
+        claimed = files.find_one_and_update(
+            {"_id": self.grid_id, "processed": {"$ne": True}},
+            {"$set": {"processed": True}},
+            session=session,
+        )
+        if claimed is None:
+            return
 
-        io = BytesIO()
-        img.save(io, img_format, progressive=progressive)
-        io.seek(0)
+        try:
+            original = self.fs.get(self.grid_id, session=session)
+            img = Image.open(original)
+            img_format = img.format
+            progressive = (
+                getattr(original, "progressive", False) is True and img_format == "JPEG"
+            )
+            size = img.size
+            img, thumbnail = self._resize(img, self._field())
+
+            processed = {}
+            thumb_id = getattr(original, "thumbnail_id", None)
+            if thumbnail and not thumb_id:
+                thumb_id = self._put_thumbnail(thumbnail, img_format, progressive)
+                processed["thumbnail_id"] = thumb_id
+
+            if img.size != size:
+                io = BytesIO()
+                img.save(io, img_format, progressive=progressive)
+                io.seek(0)
+                w, h = img.size
+                processed["resized_id"] = self.fs.put(
+                    io, width=w, height=h, format=img_format, thumbnail_id=thumb_id
+                )
 
-        return super().put(
-            io, width=w, height=h, format=img_format, thumbnail_id=thumb_id, **kwargs
-        )
+            if processed:
+                files.update_one(
+                    {"_id": self.grid_id}, {"$set": processed}, session=session
+                )
+        except Exception:
+            files.update_one(
+                {"_id": self.grid_id}, {"$unset": {"processed": 1}}, session=session
+            )
+            raise
+        self.gridout = None
+
+    def get(self, grid_id=None):
+        gridout = super().get(grid_id)
+        if gridout is None or gridout._id != self.grid_id:
+            # No image, or already resolved to the resized image
+            return gridout
+
+        if (
+            self.instance
+            and not getattr(gridout, "processed", False)
+            and self._field().processing == "lazy"
+        ):
+            self.process()
+            gridout = super().get()
+
+        # Serve the image capped to the size of the field, once generated
+        resized_id = getattr(gridout, "resized_id", None)
+        if resized_id:
+            self.gridout = self.fs.get(resized_id, session=_get_session())
+        return self.gridout
 
     def delete(self, *args, **kwargs):
-        # deletes thumbnail
-        out = self.get()
-        if out and out.thumbnail_id:
-            self.fs.delete(out.thumbnail_id, session=_get_session())
+        # Deletes the thumbnail and the image capped to the size of the field,
+        # read from the stored image so that a lazy field doesn't process it
+        if self.grid_id:
+            session = _get_session()
+            stored = get_db(self.db_alias)[self.collection_name].files.find_one(
+                {"_id": self.grid_id},
+                {"thumbnail_id": 1, "resized_id": 1},
+                session=session,
+            )
+            for key in ("thumbnail_id", "resized_id"):
+                if stored and stored.get(key):
+                    self.fs.delete(stored[key], session=session)
 
         return super().delete()
 
@@ -2008,7 +2686,7 @@ class ImageGridFsProxy(GridFSProxy):
         representing a thumbnail of Image
         """
         out = self.get()
-        if out and out.thumbnail_id:
+        if out and getattr(out, "thumbnail_id", None):
             return self.fs.get(out.thumbnail_id, session=_get_session())
 
     def write(self, *args, **kwargs):
@@ -2029,15 +2707,32 @@ class ImageField(FileField):
     :param size: max size to store images, provided as (width, height, force)
         if larger, it will be automatically resized (ex: size=(800, 600, True))
     :param thumbnail_size: size to generate a thumbnail, provided as (width, height, force)
+    :param processing: when to resize the images and generate their
+        thumbnails: "eager" (when they are put), "background" (the image is
+        stored as is, then processed by a pool of threads) or "lazy" (the
+        first time the image is read, also processing the images stored
+        before the field was made lazy). Until processed, the original image
+        is served
     """
 
     proxy_class = ImageGridFsProxy
 
     def __init__(
-        self, size=None, thumbnail_size=None, collection_name="images", **kwargs
+        self,
+        size=None,
+        thumbnail_size=None,
+        collection_name="images",
+        processing="eager",
+        **kwargs,
     ):
         if not Image:
             raise ImproperlyConfigured("PIL library was not found")
+        if processing not in ("eager", "background", "lazy"):
+            raise ValueError(
+                'Invalid processing %r, expected "eager", "background" or "lazy"'
+                % processing
+            )
+        self.processing = processing
 
         params_size = ("width", "height", "force")
         extra_args = {"size": size, "thumbnail_size": thumbnail_size}
@@ -2051,6 +2746,37 @@ class ImageField(FileField):
         super().__init__(collection_name=collection_name, **kwargs)
 
 
+# The blocks of values reserved by the SequenceFields with a block_size, as
+# [next value, last value] lists by (db alias, collection, sequence id), and
+# the locks serializing the reservations of each of them
+_sequence_blocks = {}
+_sequence_locks = {}
+_sequence_locks_lock = threading.Lock()
+
+
+def _get_sequence_lock(key):
+    """Return the lock of the sequence block of ``key``, so that the
+    reservation of a block doesn't hold up the other sequences.
+    """
+    with _sequence_locks_lock:
+        lock = _sequence_locks.get(key)
+        if lock is None:
+            lock = _sequence_locks[key] = threading.Lock()
+        return lock
+
+
+def _reset_sequence_blocks():
+    # Forked processes must reserve their own blocks
+    global _sequence_locks_lock
+    _sequence_blocks.clear()
+    _sequence_locks.clear()
+    _sequence_locks_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_sequence_blocks)
+
+
 class SequenceField(BaseField):
     """Provides a sequential counter see:
      https://www.mongodb.com/docs/manual/reference/method/ObjectId/#ObjectIDs-SequenceNumbers
@@ -2066,11 +2792,22 @@ class SequenceField(BaseField):
     :param collection_name:  Name of the counter collection (default 'mongoengine.counters')
     :param sequence_name: Name of the sequence in the collection (default 'ClassName.counter')
     :param value_decorator: Any callable to use as a counter (default int)
+    :param block_size: (optional) Reserve the values by blocks of this size,
+        and hand them out from memory (see below)
 
     Use any callable as `value_decorator` to transform calculated counter into
     any value suitable for your needs, e.g. string or hexadecimal
     representation of the default integer counter value.
 
+    By default, each new value increments the counter in the database. With a
+    `block_size`, the counter is incremented by `block_size` at once and the
+    values of the block are handed out by the process, so the values are
+    still unique but no longer in the order the documents are created across
+    processes, and the unused values of a block are lost when the process
+    exits. The blocks are reserved outside of any transaction. In both modes,
+    :meth:`~mongoengine.queryset.QuerySet.insert` reserves the values of all
+    the documents it inserts with a single increment.
+
     .. note::
 
         In case the counter is defined in the abstract document, it will be
@@ -2089,38 +2826,74 @@ class SequenceField(BaseField):
         sequence_name=None,
         value_decorator=None,
         *args,
+        block_size=None,
         **kwargs,
     ):
+        if block_size is not None and (
+            not isinstance(block_size, int) or block_size < 1
+        ):
+            raise ValueError("block_size must be a positive integer")
+
         self.collection_name = collection_name or self.COLLECTION_NAME
         self.db_alias = db_alias or DEFAULT_CONNECTION_NAME
         self.sequence_name = sequence_name
         self.value_decorator = (
             value_decorator if callable(value_decorator) else self.VALUE_DECORATOR
         )
+        self.block_size = block_size
         super().__init__(*args, **kwargs)
 
-    def generate(self):
-        """
-        Generate and Increment the counter
-        """
+    def _sequence_key(self):
         sequence_name = self.get_sequence_name()
-        sequence_id = f"{sequence_name}.{self.name}"
+        return self.db_alias, self.collection_name, f"{sequence_name}.{self.name}"
+
+    def _reserve(self, count, session=None):
+        """Increment the counter by ``count`` and return the first of the
+        ``count`` values reserved.
+        """
+        _, _, sequence_id = self._sequence_key()
         collection = get_db(alias=self.db_alias)[self.collection_name]
 
         counter = collection.find_one_and_update(
             filter={"_id": sequence_id},
-            update={"$inc": {"next": 1}},
+            update={"$inc": {"next": count}},
             return_document=ReturnDocument.AFTER,
             upsert=True,
-            session=_get_session(),
+            session=session,
         )
-        return self.value_decorator(counter["next"])
+        return counter["next"] - count + 1
+
+    def generate(self):
+        """
+        Generate and Increment the counter
+        """
+        if not self.block_size:
+            return self.value_decorator(self._reserve(1, session=_get_session()))
+
+        key = self._sequence_key()
+        with _get_sequence_lock(key):
+            block = _sequence_blocks.get(key)
+            if block is None or block[0] > block[1]:
+                first = self._reserve(self.block_size)
+                block = _sequence_blocks[key] = [first, first + self.block_size - 1]
+            value = block[0]
+            block[0] += 1
+        return self.value_decorator(value)
+
+    def generate_many(self, count):
+        """Generate ``count`` values with a single increment of the counter."""
+        session = None if self.block_size else _get_session()
+        first = self._reserve(count, session=session)
+        return [self.value_decorator(value) for value in range(first, first + count)]
 
     def set_next_value(self, value):
         """Helper method to set the next sequence value"""
         sequence_name = self.get_sequence_name()
         sequence_id = f"{sequence_name}.{self.name}"
         collection = get_db(alias=self.db_alias)[self.collection_name]
+        key = self._sequence_key()
+        with _get_sequence_lock(key):
+            _sequence_blocks.pop(key, None)
         counter = collection.find_one_and_update(
             filter={"_id": sequence_id},
             update={"$set": {"next": value}},
@@ -2136,6 +2909,10 @@ class SequenceField(BaseField):
         .. warning:: There is no guarantee this will be the next value
         as it is only fixed on set.
         """
+        block = self.block_size and _sequence_blocks.get(self._sequence_key())
+        if block and block[0] <= block[1]:
+            return self.value_decorator(block[0])
+
         sequence_name = self.get_sequence_name()
         sequence_id = f"{sequence_name}.{self.name}"
         collection = get_db(alias=self.db_alias)[self.collection_name]
@@ -2463,6 +3240,7 @@ class LazyReferenceField(BaseField):
 
         value = self.build_lazyref(instance._data.get(self.name))
         if value:
+            value._path = f"{instance._class_name}.{self.name}"
             instance._data[self.name] = value
 
         return super().__get__(instance, owner)
@@ -2584,6 +3362,7 @@ class GenericLazyReferenceField(GenericReferenceField):
 
         value = self.build_lazyref(instance._data.get(self.name))
         if value:
+            value._path = f"{instance._class_name}.{self.name}"
             instance._data[self.name] = value
 
         return super().__get__(instance, owner)
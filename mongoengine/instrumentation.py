@@ -0,0 +1,217 @@
+"""Client-side instrumentation of the operations run by MongoEngine.
+
+Listeners registered with :func:`register` are called with an
+:class:`OperationEvent` after each operation of the querysets (iterating
+over the results, counting, updating, deleting...), each
+:meth:`~mongoengine.Document.save`, :meth:`~mongoengine.Document.delete` and
+:meth:`~mongoengine.Document.reload`, and each batch of references fetched
+when dereferencing. Events are published synchronously, in the thread
+running the operation, hence listeners should be cheap::
+
+    from mongoengine import instrumentation
+
+    def log_slow_operations(event):
+        if event.duration > 0.1:
+            logger.warning("Slow %s on %s: %s", event.operation,
+                           event.collection, event.query_shape)
+
+    instrumentation.register(log_slow_operations)
+
+When no listener is registered, operations are not timed at all.
+"""
+
+import logging
+import threading
+from collections import namedtuple
+from functools import wraps
+from time import perf_counter
+
+from pymongo import monitoring
+
+__all__ = ("OperationEvent", "register", "unregister", "query_shape")
+
+logger = logging.getLogger(__name__)
+
+#: An operation run by MongoEngine:
+#:
+#: - ``operation``: e.g. "find", "count", "update", "delete", "save",
+#:   "reload" or "dereference"
+#: - ``document``: the Document class the operation applies to
+#: - ``collection``: the name of the collection, if any
+#: - ``query_shape``: the filter of the operation, with its values replaced
+#:   by "?" (e.g. ``{"age": {"$gt": "?"}}``), or None
+#: - ``duration``: the time spent in the operation, in seconds
+#: - ``docs_returned``: the number of documents returned, if relevant
+#: - ``decode_time``: the part of ``duration`` spent converting the results
+#:   into Documents
+#: - ``dereferences``: the number of references resolved
+OperationEvent = namedtuple(
+    "OperationEvent",
+    (
+        "operation",
+        "document",
+        "collection",
+        "query_shape",
+        "duration",
+        "docs_returned",
+        "decode_time",
+        "dereferences",
+    ),
+)
+
+# Replaced rather than modified, so that it can be iterated over safely
+_listeners = ()
+
+# Operators whose value is a list of sub-queries
+COMBINATION_OPERATORS = ("$and", "$or", "$nor")
+
+
+def register(listener):
+    """Register a callable, called with an :class:`OperationEvent` after
+    each operation.
+    """
+    global _listeners
+    _listeners = _listeners + (listener,)
+
+
+def unregister(listener):
+    """Unregister a listener added with :func:`register`."""
+    global _listeners
+    _listeners = tuple(item for item in _listeners if item != listener)
+
+
+def query_shape(query):
+    """Return ``query`` with the values it holds replaced by "?", to group
+    the queries that only differ by their values.
+    """
+    if not isinstance(query, dict):
+        return "?"
+    shape = {}
+    for key, value in query.items():
+        if key in COMBINATION_OPERATORS and isinstance(value, (list, tuple)):
+            shape[key] = [query_shape(sub_query) for sub_query in value]
+        else:
+            shape[key] = query_shape(value)
+    return shape
+
+
+def publish(
+    operation,
+    document,
+    collection,
+    duration,
+    query=None,
+    docs_returned=None,
+    decode_time=0.0,
+    dereferences=0,
+):
+    """Notify the registered listeners of an operation."""
+    event = OperationEvent(
+        operation,
+        document,
+        collection,
+        None if query is None else query_shape(query),
+        duration,
+        docs_returned,
+        decode_time,
+        dereferences,
+    )
+    for listener in _listeners:
+        try:
+            listener(event)
+        except Exception:
+            logger.exception("Instrumentation listener %r failed", listener)
+
+
+def instrumented(operation, target, returned=None):
+    """Decorate a method so that its calls get published as ``operation``.
+
+    :param target: a function returning the Document class, the collection
+        name and the filter (or None) of the operation, given the instance
+        the method is called on
+    :param returned: an optional function returning the number of documents
+        returned by the operation, given the result of the method
+    """
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not _listeners:
+                return method(self, *args, **kwargs)
+
+            start = perf_counter()
+            result = method(self, *args, **kwargs)
+            duration = perf_counter() - start
+
+            document, collection, query = target(self)
+            publish(
+                operation,
+                document,
+                collection,
+                duration,
+                query=query,
+                docs_returned=None if returned is None else returned(result),
+            )
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+class CommandCounters(monitoring.CommandListener):
+    """PyMongo command listener, added to the clients created by MongoEngine,
+    that feeds the :class:`~mongoengine.context_managers.query_counter`
+    active in the thread the commands are sent from.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def active(self):
+        """Return the counters active in the current thread."""
+        try:
+            return self._local.counters
+        except AttributeError:
+            self._local.counters = []
+            return self._local.counters
+
+    def started(self, event):
+        counters = getattr(self._local, "counters", None)
+        if counters:
+            for counter in counters:
+                counter._command_started(event)
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+command_counters = CommandCounters()
+
+
+# The lazy_dereference_detector active in each thread
+_detectors = threading.local()
+
+
+def active_detectors():
+    """Return the lazy dereference detectors active in the current thread."""
+    try:
+        return _detectors.active
+    except AttributeError:
+        _detectors.active = []
+        return _detectors.active
+
+
+def lazy_dereference(path):
+    """Report that the references of ``path`` (e.g. "Book.author") were
+    dereferenced for a single document, to the
+    :class:`~mongoengine.context_managers.lazy_dereference_detector` active
+    in the current thread.
+    """
+    active = getattr(_detectors, "active", None)
+    if active:
+        for detector in active:
+            detector._dereferenced(path)
@@ -10,6 +10,7 @@ __all__ = (
     "QuerySet",
     "QuerySetNoCache",
     "Q",
+    "Param",
     "queryset_manager",
     "QuerySetManager",
     "QueryFieldList",
@@ -1,21 +1,24 @@
 import copy
 import itertools
 import re
+import threading
+import time
 import warnings
+import weakref
 from collections.abc import Mapping
 
 import pymongo
 import pymongo.errors
-from bson import SON, json_util
+from bson import BSON, SON, json_util
 from bson.code import Code
 from pymongo.collection import ReturnDocument
 from pymongo.common import validate_read_preference
 from pymongo.read_concern import ReadConcern
 
-from mongoengine import signals
+from mongoengine import instrumentation, signals
 from mongoengine.base import _DocumentRegistry
 from mongoengine.common import _import_class
-from mongoengine.connection import _get_session, get_db
+from mongoengine.connection import _get_session, _route, get_db
 from mongoengine.context_managers import (
     no_dereferencing_active_for_class,
     set_read_write_concern,
@@ -33,12 +36,24 @@ from mongoengine.pymongo_support import (
     LEGACY_JSON_OPTIONS,
     count_documents,
 )
-from mongoengine.queryset import transform
+from mongoengine.queryset import change_stream, pagination, transform
 from mongoengine.queryset.field_list import QueryFieldList
+from mongoengine.queryset.prepared import PreparedQuery
 from mongoengine.queryset.visitor import Q, QNode
 
 __all__ = ("BaseQuerySet", "DO_NOTHING", "NULLIFY", "CASCADE", "DENY", "PULL")
 
+# Maximum number of counts kept by the querysets using `cache_count`
+COUNT_CACHE_SIZE = 1000
+
+# Number of documents handled at once by the deletes applying delete rules,
+# unless a `batch_size` is set on the queryset
+DELETE_BATCH_SIZE = 1000
+
+# {(client id, collection name, filter, options): (time counted, count)}
+_count_cache = {}
+_count_cache_lock = threading.Lock()
+
 # Delete rules
 DO_NOTHING = 0
 NULLIFY = 1
@@ -47,11 +62,58 @@ DENY = 3
 PULL = 4
 
 
+def _query_target(queryset):
+    return queryset._document, queryset._collection.name, queryset._query
+
+
+def _insert_target(queryset):
+    return queryset._document, queryset._collection.name, None
+
+
+def _publish_find(document, collection_name, query, stats):
+    instrumentation.publish(
+        "find",
+        document,
+        collection_name,
+        stats[0],
+        query=query,
+        docs_returned=stats[1],
+        decode_time=stats[2],
+    )
+
+
+def _cache_count(key, count):
+    """Keep a count in the cache shared by the querysets using
+    `cache_count`, the oldest counts being dropped when it is full.
+    """
+    with _count_cache_lock:
+        _count_cache.pop(key, None)
+        while len(_count_cache) >= COUNT_CACHE_SIZE:
+            _count_cache.pop(next(iter(_count_cache)))
+        _count_cache[key] = (time.monotonic(), count)
+
+
+def _get_delete_rules(document):
+    """Return the ``(document_cls, field_name, rule)`` delete rules to apply
+    when deleting documents of ``document``.
+    """
+    return [
+        (document_cls, field_name, rule)
+        for (document_cls, field_name), rule in (
+            document._meta.get("delete_rules") or {}
+        ).items()
+        if rule != DO_NOTHING and not document_cls._meta.get("abstract")
+    ]
+
+
 class BaseQuerySet:
     """A set of results returned from a query. Wraps a MongoDB cursor,
     providing :class:`~mongoengine.Document` objects as the results.
     """
 
+    # Cost of the iteration over the cursor so far, when instrumented
+    _iteration_stats = None
+
     def __init__(self, document, collection):
         self._document = document
         self._collection_obj = collection
@@ -66,6 +128,7 @@ class BaseQuerySet:
         self._allow_disk_use = False
         self._read_preference = None
         self._read_concern = None
+        self._routing = True
         self._iter = False
         self._scalar = []
         self._none = False
@@ -94,6 +157,7 @@ class BaseQuerySet:
         self._batch_size = None
         self._max_time_ms = None
         self._comment = None
+        self._count_ttl = None
 
         # Hack - As people expect cursor[5:5] to return
         # an empty result set. It's hard to do that right, though, because the
@@ -144,6 +208,7 @@ class BaseQuerySet:
 
         # don't pickle cursor
         obj_dict["_cursor_obj"] = None
+        obj_dict.pop("_iteration_stats", None)
 
         return obj_dict
 
@@ -190,6 +255,9 @@ class BaseQuerySet:
 
         # Handle an index
         elif isinstance(key, int):
+            if instrumentation._listeners:
+                return queryset._instrumented_getitem(key)
+
             if queryset._scalar:
                 return queryset._get_scalar(
                     queryset._document._from_son(
@@ -208,6 +276,33 @@ class BaseQuerySet:
 
         raise TypeError("Provide a slice or an integer index")
 
+    def _instrumented_getitem(self, index):
+        """Same as __getitem__ for an index, publishing a "find" operation."""
+        start = time.perf_counter()
+        raw_doc = self._cursor[index]
+        fetched = time.perf_counter()
+        if self._as_pymongo:
+            doc = raw_doc
+        else:
+            doc = self._document._from_son(
+                raw_doc,
+                _auto_dereference=self._auto_dereference,
+            )
+            if self._scalar:
+                doc = self._get_scalar(doc)
+        end = time.perf_counter()
+
+        instrumentation.publish(
+            "find",
+            self._document,
+            self._collection.name,
+            end - start,
+            query=self._query,
+            docs_returned=1,
+            decode_time=end - fetched,
+        )
+        return doc
+
     def __iter__(self):
         raise NotImplementedError
 
@@ -230,6 +325,150 @@ class BaseQuerySet:
         """An alias of :meth:`~mongoengine.queryset.QuerySet.__call__`"""
         return self.__call__(*q_objs, **query)
 
+    def prepare(self, q_obj=None, **query):
+        """Compile a filter once so that it can be executed many times,
+        with different values, at a fraction of the cost of building the
+        query again. Values only known at execution time are given as
+        :class:`~mongoengine.queryset.Param` placeholders::
+
+            by_name = User.objects.order_by("-age").prepare(
+                name=Param("n"), age__gte=Param("a")
+            )
+            adults_named_bob = by_name.execute(n="bob", a=18)
+
+        The ordering, projection and other options of this queryset are
+        retained by the queryset returned by
+        :meth:`~mongoengine.queryset.prepared.PreparedQuery.execute`.
+
+        :param q_obj: a :class:`~mongoengine.queryset.Q` object to be used in
+            the query
+        :param query: Django-style query keyword arguments.
+        :returns: a :class:`~mongoengine.queryset.prepared.PreparedQuery`
+        """
+        queryset = self.__call__(q_obj, **query)
+        template = queryset._query_obj.to_query(queryset._document)
+        queryset._query_obj = Q()
+        return PreparedQuery(queryset, template)
+
+    def paginate_by(self, keys=None, after=None, page_size=20):
+        """Return a page of results, seeking past the documents of the
+        previous pages through a range query on the sort keys rather than
+        skipping them, so that fetching deep pages stays cheap::
+
+            page = Post.objects(author=ross).paginate_by(
+                keys=("-created", "id"), after=request_token, page_size=20
+            )
+            posts = list(page)
+            request_token = page.next_token  # None on the last page
+
+        The keys are given as for :meth:`order_by` and default to the
+        ordering of the queryset. The primary key is appended to them
+        unless they already contain it, so that the order is total. The
+        sort keys should be backed by an index, and not hold null values.
+
+        :param keys: the sort keys, e.g. ``("-created", "id")``
+        :param after: the continuation token of the previous page, or None
+            to get the first page
+        :param page_size: the maximum number of documents of the page
+        :returns: a :class:`~mongoengine.queryset.pagination.KeysetPage`
+        """
+        if self._scalar:
+            raise OperationError("Scalar querysets can't be paginated by keys")
+
+        if keys is None:
+            key_list = self._ordering
+            if key_list is None:
+                key_list = self._get_order_by(self._document._meta["ordering"])
+            key_list = list(key_list or [])
+        else:
+            key_list = self._get_order_by(keys)
+        if not any(key == "_id" for key, _ in key_list):
+            direction = key_list[-1][1] if key_list else pymongo.ASCENDING
+            key_list.append(("_id", direction))
+        for key, direction in key_list:
+            if direction not in (pymongo.ASCENDING, pymongo.DESCENDING):
+                raise OperationError("Can't paginate by %s" % key)
+
+        queryset = self.clone()
+        if after is not None:
+            values = pagination.decode_token(after, key_list)
+            queryset._query_obj &= Q(__raw__=pagination.seek_query(key_list, values))
+            queryset._mongo_query = None
+        queryset._ordering = key_list
+        queryset._cursor_obj = None
+        queryset = queryset.limit(page_size + 1)
+
+        documents = list(queryset)
+        next_token = None
+        if len(documents) > page_size:
+            documents = documents[:page_size]
+            values = pagination.key_values(documents[-1], key_list)
+            next_token = pagination.encode_token(key_list, values)
+        return pagination.KeysetPage(documents, next_token)
+
+    def watch(
+        self,
+        full_document="updateLookup",
+        resume_after=None,
+        start_after=None,
+        on_resume_token=None,
+        pipeline=None,
+        **kwargs,
+    ):
+        """Open a change stream on the collection, to iterate over the
+        changes of the documents matched by the query as they happen::
+
+            with Post.objects(author=ross).watch() as stream:
+                for operation_type, post, event in stream:
+                    invalidate_cache(post)
+
+        The filter of the queryset is applied to the full documents of the
+        change events, so that changes for which the full document isn't
+        known (deletions, or updates unless ``full_document`` is
+        "updateLookup") are only reported by unfiltered querysets.
+        Requires a replica set or a sharded cluster.
+
+        :param full_document: the ``fullDocument`` option of the change
+            stream, "updateLookup" to get the current version of the
+            updated documents
+        :param resume_after: a resume token, to start watching after the
+            event it belongs to
+        :param start_after: like ``resume_after``, but can also resume after
+            an invalidate event
+        :param on_resume_token: a callable, called with the resume token of
+            each returned event once it is processed (i.e. when the next
+            event is requested or the stream is closed), e.g. to persist it
+        :param pipeline: additional aggregation stages applied to the change
+            events
+        :param kwargs: extra keyword arguments passed to
+            :meth:`pymongo.collection.Collection.watch`
+        :returns: a :class:`~mongoengine.queryset.change_stream.DocumentChangeStream`
+        """
+        if self._where_clause or self._search_text:
+            raise InvalidQueryError(
+                "Change events can't be filtered with where() or search_text()"
+            )
+
+        watch_pipeline = []
+        query = self._query
+        if query:
+            match = change_stream.full_document_match(query)
+            watch_pipeline.append({"$match": match})
+        if pipeline:
+            watch_pipeline.extend(pipeline)
+
+        if self._collation is not None:
+            kwargs.setdefault("collation", self._collation)
+        stream = self._collection.watch(
+            pipeline=watch_pipeline,
+            full_document=full_document,
+            resume_after=resume_after,
+            start_after=start_after,
+            session=_get_session(),
+            **kwargs,
+        )
+        return change_stream.DocumentChangeStream(self, stream, on_resume_token)
+
     def search_text(self, text, language=None, text_score=True):
         """
         Start a text search, using text indexes.
@@ -303,6 +542,7 @@ class BaseQuerySet:
             result = None
         return result
 
+    @instrumentation.instrumented("insert", _insert_target)
     def insert(
         self, doc_or_docs, load_bulk=True, write_concern=None, signal_kwargs=None
     ):
@@ -341,16 +581,32 @@ class BaseQuerySet:
                     self._document
                 )
                 raise OperationError(msg)
-            if doc.pk and not doc._created:
+            # Not doc.pk, which would generate the value of a SequenceField
+            if doc._data.get(doc._meta["id_field"]) and not doc._created:
                 msg = "Some documents have ObjectIds, use doc.update() instead"
                 raise OperationError(msg)
 
+        # Reserve the values of the sequences with one increment per counter
+        SequenceField = _import_class("SequenceField")
+        for name, field in self._document._fields.items():
+            if isinstance(field, SequenceField):
+                pending = [doc for doc in docs if doc._data.get(name) is None]
+                if len(pending) > 1:
+                    values = field.generate_many(len(pending))
+                    for doc, value in zip(pending, values):
+                        doc._data[name] = value
+
         signal_kwargs = signal_kwargs or {}
-        signals.pre_bulk_insert.send(self._document, documents=docs, **signal_kwargs)
+        if signals.pre_bulk_insert.has_receivers_for(self._document):
+            signals.pre_bulk_insert.send(
+                self._document, documents=docs, **signal_kwargs
+            )
 
         raw = [doc.to_mongo() for doc in docs]
 
-        with set_write_concern(self._collection, write_concern) as collection:
+        with set_write_concern(
+            self._write_collection("insert"), write_concern
+        ) as collection:
             insert_func = collection.insert_many
             if return_one:
                 raw = raw[0]
@@ -384,19 +640,27 @@ class BaseQuerySet:
         for doc, doc_id in zip(docs, ids):
             doc.pk = doc_id
 
-        if not load_bulk:
-            signals.post_bulk_insert.send(
-                self._document, documents=docs, loaded=False, **signal_kwargs
+        if signals.post_save_bulk.has_receivers_for(self._document):
+            signals.post_save_bulk.send(
+                self._document, documents=docs, created=True, **signal_kwargs
             )
+
+        if not load_bulk:
+            if signals.post_bulk_insert.has_receivers_for(self._document):
+                signals.post_bulk_insert.send(
+                    self._document, documents=docs, loaded=False, **signal_kwargs
+                )
             return ids[0] if return_one else ids
 
         documents = self.in_bulk(ids)
         results = [documents.get(obj_id) for obj_id in ids]
-        signals.post_bulk_insert.send(
-            self._document, documents=results, loaded=True, **signal_kwargs
-        )
+        if signals.post_bulk_insert.has_receivers_for(self._document):
+            signals.post_bulk_insert.send(
+                self._document, documents=results, loaded=True, **signal_kwargs
+            )
         return results[0] if return_one else results
 
+    @instrumentation.instrumented("count", _query_target)
     def count(self, with_limit_and_skip=False):
         """Count the selected elements in the query.
 
@@ -428,18 +692,117 @@ class BaseQuerySet:
         if self._collation:
             kwargs["collation"] = self._collation
 
+        collection = self._read_collection("count")
+        cache_key = None
+        if self._count_ttl is not None and _get_session() is None:
+            cache_key = (
+                id(collection.database.client),
+                collection.full_name,
+                # Encoded as the count command would, e.g. with the UUID
+                # representation of the connection
+                BSON.encode(self._query, codec_options=collection.codec_options),
+                repr(sorted(kwargs.items())),
+            )
+            cached = _count_cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < self._count_ttl:
+                self._cursor_obj = None
+                return cached[1]
+
         count = count_documents(
-            collection=self._cursor.collection,
+            collection=collection,
             filter=self._query,
             **kwargs,
         )
 
+        if cache_key is not None:
+            _cache_count(cache_key, count)
+
         self._cursor_obj = None
         return count
 
-    def delete(self, write_concern=None, _from_doc_delete=False, cascade_refs=None):
+    def estimated_count(self):
+        """Return the number of documents in the collection, as estimated
+        from its metadata. This is much cheaper than :meth:`count` on large
+        collections, as no document (or index entry) gets scanned, but it
+        can only be used on unfiltered querysets covering the whole collection,
+        i.e. neither on the querysets of a subclass nor on those using
+        :meth:`no_sub_classes`.
+
+        Note that the estimate may be inaccurate after an unclean shutdown
+        or while orphaned documents exist in a sharded cluster.
+        """
+        if self._none or self._empty:
+            return 0
+
+        # Querysets of a subclass, or restricted to a single class of a
+        # hierarchy by no_sub_classes(), only select part of the collection
+        subclasses = self._document._subclasses
+        whole_hierarchy = (
+            {"_cls": subclasses[0]}
+            if len(subclasses) == 1
+            else {"_cls": {"$in": subclasses}}
+        )
+        query = self._query
+        filtered = query and (
+            "." in self._document._class_name
+            or query != self._cls_query
+            or self._cls_query != whole_hierarchy
+        )
+        if self._where_clause or filtered:
+            raise OperationError(
+                "estimated_count() can only be used on unfiltered querysets"
+            )
+
+        kwargs = {}
+        if self._max_time_ms is not None:
+            kwargs["maxTimeMS"] = self._max_time_ms
+        if self._comment is not None:
+            kwargs["comment"] = self._comment
+
+        return self._read_collection("count").estimated_document_count(**kwargs)
+
+    def cache_count(self, ttl):
+        """Cache the result of :meth:`count` for ``ttl`` seconds. The cached
+        count is shared by all the querysets with the same filter on the same
+        collection, such as the successive pages of a paginated list::
+
+            users = User.objects(country="uk").cache_count(60)
+            total = users.count()  # counted at most once a minute
+            page = users.skip(20).limit(10)
+
+        Writes made in the meantime are not reflected until the count
+        expires. Counts made within a session (e.g. in a transaction) are
+        never cached.
+
+        :param ttl: maximum age, in seconds, of the cached count to use, or
+            None to stop caching it
+        """
+        queryset = self.clone()
+        queryset._count_ttl = ttl
+        return queryset
+
+    @instrumentation.instrumented("delete", _query_target)
+    def delete(
+        self,
+        write_concern=None,
+        _from_doc_delete=False,
+        cascade_refs=None,
+        progress=None,
+        signal_kwargs=None,
+    ):
         """Delete the documents matched by the query.
 
+        When the document has delete rules, the matched documents are
+        handled by batches of primary keys (see :meth:`batch_size`, defaults
+        to ``DELETE_BATCH_SIZE``) so that the memory used doesn't depend on
+        the number of documents deleted, including the cascaded ones.
+
+        When skips or limits have been applied, or the delete signals have
+        receivers, the documents are loaded by batches of the same size and
+        each batch is deleted at once, the ``pre_delete`` and ``post_delete``
+        signals being sent for each document of the batch and the
+        ``pre_delete_bulk`` and ``post_delete_bulk`` signals for the batch.
+
         :param write_concern: Extra keyword arguments are passed down which
             will be used as options for the resultant
             ``getLastError`` command.  For example,
@@ -448,6 +811,12 @@ class BaseQuerySet:
             will force an fsync on the primary server.
         :param _from_doc_delete: True when called from document delete therefore
             signals will have been triggered so don't loop.
+        :param progress: (optional) callable called as
+            ``progress(document_cls, count)`` each time documents are deleted,
+            including the cascaded deletes, ``count`` being ``None`` for
+            unacknowledged writes.
+        :param signal_kwargs: (optional) kwargs dictionary to be passed to
+            the signal calls.
 
         :returns number of deleted documents
         """
@@ -457,89 +826,257 @@ class BaseQuerySet:
         if write_concern is None:
             write_concern = {}
 
+        delete_rules = _get_delete_rules(doc)
+
         # Handle deletes where skips or limits have been applied or
         # there is an untriggered delete signal
         has_delete_signal = signals.signals_available and (
             signals.pre_delete.has_receivers_for(doc)
             or signals.post_delete.has_receivers_for(doc)
+            or signals.pre_delete_bulk.has_receivers_for(doc)
+            or signals.post_delete_bulk.has_receivers_for(doc)
         )
 
         call_document_delete = (
             queryset._skip or queryset._limit or has_delete_signal
         ) and not _from_doc_delete
 
-        if call_document_delete:
-            cnt = 0
-            for doc in queryset:
-                doc.delete(**write_concern)
-                cnt += 1
-            return cnt
-
-        delete_rules = doc._meta.get("delete_rules") or {}
-        delete_rules = list(delete_rules.items())
-
-        # Check for DENY rules before actually deleting/nullifying any other
-        # references
-        for rule_entry, rule in delete_rules:
-            document_cls, field_name = rule_entry
-            if document_cls._meta.get("abstract"):
-                continue
+        kwargs = {}
+        if self._hint not in (-1, None):
+            kwargs["hint"] = self._hint
+        if self._collation:
+            kwargs["collation"] = self._collation
+        if self._comment:
+            kwargs["comment"] = self._comment
 
-            if rule == DENY:
-                refs = document_cls.objects(**{field_name + "__in": self})
-                if refs.limit(1).count() > 0:
-                    raise OperationError(
-                        "Could not delete document (%s.%s refers to it)"
-                        % (document_cls.__name__, field_name)
+        with set_write_concern(
+            queryset._write_collection("delete"), write_concern
+        ) as collection:
+            if call_document_delete:
+                return queryset._delete_documents(
+                    collection, write_concern, progress, signal_kwargs
+                )
+
+            if not delete_rules:
+                result = collection.delete_many(
+                    queryset._query,
+                    session=_get_session(),
+                    **kwargs,
+                )
+                # If we're using an unack'd write concern, we don't really
+                # know how many items have been deleted at this point, hence
+                # we only return the count for ack'd ops.
+                deleted_count = result.deleted_count if result.acknowledged else None
+                if progress is not None:
+                    progress(doc, deleted_count)
+                return deleted_count
+
+            # Check for DENY rules before actually deleting/nullifying any
+            # other references
+            if any(rule == DENY for _, _, rule in delete_rules):
+                for pks in queryset._iter_pk_batches(collection, kwargs):
+                    queryset._check_deny_rules(pks, delete_rules)
+
+            # Apply the other rules and delete the documents batch by batch
+            deleted_count = 0
+            for pks in queryset._iter_pk_batches(collection, kwargs):
+                result = queryset._delete_batch(
+                    collection,
+                    doc,
+                    pks,
+                    delete_rules,
+                    write_concern,
+                    cascade_refs,
+                    progress,
+                )
+                if not result.acknowledged:
+                    deleted_count = None
+                elif deleted_count is not None:
+                    deleted_count += result.deleted_count
+
+            return deleted_count
+
+    def _delete_documents(self, collection, write_concern, progress, signal_kwargs):
+        """Delete the matched documents by batches of loaded documents,
+        sending the delete signals.
+
+        The documents of a batch are handled class by class, as
+        :meth:`~mongoengine.Document.delete` would: the signals are sent with
+        the class of the documents as sender, and the delete rules and
+        FileFields are the ones of that class.
+        """
+        signal_kwargs = signal_kwargs or {}
+        FileField = _import_class("FileField")
+        classes = {}
+
+        cnt = 0
+        for documents in self._iter_document_batches():
+            documents_by_class = {}
+            for document in documents:
+                documents_by_class.setdefault(type(document), []).append(document)
+
+            for document_cls, class_documents in documents_by_class.items():
+                if document_cls not in classes:
+                    classes[document_cls] = (
+                        _get_delete_rules(document_cls),
+                        [
+                            name
+                            for name, field in document_cls._fields.items()
+                            if isinstance(field, FileField)
+                        ],
                     )
+                delete_rules, file_fields = classes[document_cls]
+                self._delete_class_documents(
+                    collection,
+                    document_cls,
+                    class_documents,
+                    delete_rules,
+                    file_fields,
+                    write_concern,
+                    progress,
+                    signal_kwargs,
+                )
+            cnt += len(documents)
+        return cnt
+
+    def _delete_class_documents(
+        self,
+        collection,
+        document_cls,
+        documents,
+        delete_rules,
+        file_fields,
+        write_concern,
+        progress,
+        signal_kwargs,
+    ):
+        """Delete a batch of loaded documents of ``document_cls``, sending
+        the delete signals.
+        """
+        if signals.pre_delete.has_receivers_for(document_cls):
+            for document in documents:
+                signals.pre_delete.send(
+                    document_cls, document=document, **signal_kwargs
+                )
+        if signals.pre_delete_bulk.has_receivers_for(document_cls):
+            signals.pre_delete_bulk.send(
+                document_cls, documents=documents, **signal_kwargs
+            )
 
-        # Check all the other rules
-        for rule_entry, rule in delete_rules:
-            document_cls, field_name = rule_entry
-            if document_cls._meta.get("abstract"):
+        id_field = document_cls._fields[document_cls._meta["id_field"]]
+        pks = [id_field.to_mongo(document.pk) for document in documents]
+        self._check_deny_rules(pks, delete_rules)
+
+        # Delete FileFields separately
+        for document in documents:
+            for name in file_fields:
+                getattr(document, name).delete()
+
+        try:
+            self._delete_batch(
+                collection,
+                document_cls,
+                pks,
+                delete_rules,
+                write_concern,
+                None,
+                progress,
+            )
+        except pymongo.errors.OperationFailure as err:
+            message = "Could not delete document (%s)" % err.args
+            raise OperationError(message)
+
+        if signals.post_delete.has_receivers_for(document_cls):
+            for document in documents:
+                signals.post_delete.send(
+                    document_cls, document=document, **signal_kwargs
+                )
+        if signals.post_delete_bulk.has_receivers_for(document_cls):
+            signals.post_delete_bulk.send(
+                document_cls, documents=documents, **signal_kwargs
+            )
+
+    def _check_deny_rules(self, pks, delete_rules):
+        for document_cls, field_name, rule in delete_rules:
+            if rule != DENY:
                 continue
+            refs = document_cls.objects(**{field_name + "__in": pks})
+            if refs.limit(1).count() > 0:
+                raise OperationError(
+                    "Could not delete document (%s.%s refers to it)"
+                    % (document_cls.__name__, field_name)
+                )
 
+    def _delete_batch(
+        self,
+        collection,
+        document_cls,
+        pks,
+        delete_rules,
+        write_concern,
+        cascade_refs,
+        progress,
+    ):
+        """Apply the CASCADE, NULLIFY and PULL rules to the documents
+        referring to ``pks``, then delete these documents of ``document_cls``.
+        """
+        for ref_cls, field_name, rule in delete_rules:
             if rule == CASCADE:
-                cascade_refs = set() if cascade_refs is None else cascade_refs
-                # Handle recursive reference
-                if doc._collection == document_cls._collection:
-                    for ref in queryset:
-                        cascade_refs.add(ref.id)
-                refs = document_cls.objects(
-                    **{field_name + "__in": self, "pk__nin": cascade_refs}
+                refs = ref_cls.objects(**{field_name + "__in": pks})
+                # Handle recursive reference: the documents being
+                # deleted on this path must not be cascaded again
+                excluded = set(cascade_refs or ())
+                if document_cls._collection == ref_cls._collection:
+                    excluded.update(pks)
+                if excluded:
+                    refs = refs.filter(pk__nin=list(excluded))
+                refs.delete(
+                    write_concern=write_concern,
+                    cascade_refs=excluded,
+                    progress=progress,
                 )
-                if refs.count() > 0:
-                    refs.delete(write_concern=write_concern, cascade_refs=cascade_refs)
             elif rule == NULLIFY:
-                document_cls.objects(**{field_name + "__in": self}).update(
-                    write_concern=write_concern, **{"unset__%s" % field_name: 1}
+                ref_cls.objects(**{field_name + "__in": pks}).update(
+                    write_concern=write_concern,
+                    **{"unset__%s" % field_name: 1},
                 )
             elif rule == PULL:
-                document_cls.objects(**{field_name + "__in": self}).update(
-                    write_concern=write_concern, **{"pull_all__%s" % field_name: self}
+                ref_cls.objects(**{field_name + "__in": pks}).update(
+                    write_concern=write_concern,
+                    **{"pull_all__%s" % field_name: pks},
                 )
 
-        kwargs = {}
-        if self._hint not in (-1, None):
-            kwargs["hint"] = self._hint
-        if self._collation:
-            kwargs["collation"] = self._collation
-        if self._comment:
-            kwargs["comment"] = self._comment
-
-        with set_write_concern(queryset._collection, write_concern) as collection:
-            result = collection.delete_many(
-                queryset._query,
-                session=_get_session(),
-                **kwargs,
+        result = collection.delete_many({"_id": {"$in": pks}}, session=_get_session())
+        if progress is not None:
+            progress(
+                document_cls, result.deleted_count if result.acknowledged else None
             )
+        return result
 
-            # If we're using an unack'd write concern, we don't really know how
-            # many items have been deleted at this point, hence we only return
-            # the count for ack'd ops.
-            if result.acknowledged:
-                return result.deleted_count
+    def _iter_document_batches(self):
+        """Iterate over the matched documents, by lists of at most the batch
+        size of the queryset, without caching them.
+        """
+        batch_size = self._batch_size or DELETE_BATCH_SIZE
+        queryset = self.clone()
+        documents = iter(queryset.__next__, None)
+        return iter(lambda: list(itertools.islice(documents, batch_size)), [])
 
+    def _iter_pk_batches(self, collection, kwargs):
+        """Iterate over the primary keys of the documents matched by the
+        query, by lists of at most the batch size of the queryset.
+
+        Only the ``_id`` of the documents is fetched, with a single cursor
+        that is consumed as the batches are processed.
+        """
+        batch_size = self._batch_size or DELETE_BATCH_SIZE
+        cursor = collection.find(
+            self._query, {"_id": 1}, session=_get_session(), **kwargs
+        ).batch_size(batch_size)
+        pks = (son["_id"] for son in cursor)
+        return iter(lambda: list(itertools.islice(pks, batch_size)), [])
+
+    @instrumentation.instrumented("update", _query_target)
     def update(
         self,
         upsert=False,
@@ -605,7 +1142,7 @@ class BaseQuerySet:
 
         try:
             with set_read_write_concern(
-                queryset._collection, write_concern, read_concern
+                queryset._write_collection("update"), write_concern, read_concern
             ) as collection:
                 update_func = collection.update_one
                 if multi:
@@ -693,6 +1230,7 @@ class BaseQuerySet:
             **update,
         )
 
+    @instrumentation.instrumented("modify", _query_target)
     def modify(
         self,
         upsert=False,
@@ -737,7 +1275,7 @@ class BaseQuerySet:
 
         try:
             if remove:
-                result = queryset._collection.find_one_and_delete(
+                result = queryset._write_collection("delete").find_one_and_delete(
                     query, sort=sort, session=_get_session(), **self._cursor_args
                 )
             else:
@@ -745,7 +1283,7 @@ class BaseQuerySet:
                     return_doc = ReturnDocument.AFTER
                 else:
                     return_doc = ReturnDocument.BEFORE
-                result = queryset._collection.find_one_and_update(
+                result = queryset._write_collection("update").find_one_and_update(
                     query,
                     update,
                     upsert=upsert,
@@ -778,6 +1316,7 @@ class BaseQuerySet:
             raise InvalidQueryError(msg)
         return queryset.filter(pk=object_id).first()
 
+    @instrumentation.instrumented("in_bulk", _query_target, returned=len)
     def in_bulk(self, object_ids):
         """Retrieve a set of documents by their ids.
 
@@ -787,7 +1326,7 @@ class BaseQuerySet:
         """
         doc_map = {}
 
-        docs = self._collection.find(
+        docs = self._read_collection("find").find(
             {"_id": {"$in": object_ids}}, session=_get_session(), **self._cursor_args
         )
         if self._scalar:
@@ -802,6 +1341,10 @@ class BaseQuerySet:
                     doc,
                     _auto_dereference=self._auto_dereference,
                 )
+            if doc_map and signals.post_init_bulk.has_receivers_for(self._document):
+                signals.post_init_bulk.send(
+                    self._document, documents=list(doc_map.values())
+                )
 
         return doc_map
 
@@ -833,11 +1376,64 @@ class BaseQuerySet:
         with switch_db(self._document, alias) as cls:
             collection = cls._get_collection()
 
-        return self._clone_into(self.__class__(self._document, collection))
+        queryset = self._clone_into(self.__class__(self._document, collection))
+        # The database was picked explicitly, bypass the router
+        queryset._routing = False
+        return queryset
+
+    # Properties describing the query, carried over to clones. Their values
+    # are never modified in place, only replaced (the `QueryFieldList` is
+    # copied before being extended, see `fields`), so a queryset and its
+    # clones can share them until one of them sets a new value.
+    _clone_props = (
+        "_mongo_query",
+        "_cls_query",
+        "_none",
+        "_query_obj",
+        "_where_clause",
+        "_loaded_fields",
+        "_ordering",
+        "_snapshot",
+        "_timeout",
+        "_allow_disk_use",
+        "_read_preference",
+        "_read_concern",
+        "_routing",
+        "_iter",
+        "_scalar",
+        "_as_pymongo",
+        "_limit",
+        "_skip",
+        "_empty",
+        "_hint",
+        "_collation",
+        "_search_text",
+        "_search_text_score",
+        "_max_time_ms",
+        "_comment",
+        "_batch_size",
+        "_count_ttl",
+        "_BaseQuerySet__auto_dereference",
+    )
 
     def clone(self):
         """Create a copy of the current queryset."""
-        return self._clone_into(self.__class__(self._document, self._collection_obj))
+        if type(self).__init__ is not BaseQuerySet.__init__:
+            # A custom constructor may set up some state of its own
+            return self._clone_into(
+                self.__class__(self._document, self._collection_obj)
+            )
+
+        # The state of the clone is either shared with this queryset or
+        # reset below, so there is no need to go through __init__
+        new_qs = self.__class__.__new__(self.__class__)
+        state = self.__dict__
+        new_qs.__dict__.update({prop: state[prop] for prop in self._clone_props})
+        new_qs._document = self._document
+        new_qs._collection_obj = self._collection_obj
+        new_qs.__dereference = False
+        new_qs._cursor_obj = self._cursor_obj.clone() if self._cursor_obj else None
+        return new_qs
 
     def _clone_into(self, new_qs):
         """Copy all the relevant properties of this queryset to
@@ -849,39 +1445,8 @@ class BaseQuerySet:
                 "%s is not a subclass of BaseQuerySet" % new_qs.__name__
             )
 
-        copy_props = (
-            "_mongo_query",
-            "_cls_query",
-            "_none",
-            "_query_obj",
-            "_where_clause",
-            "_loaded_fields",
-            "_ordering",
-            "_snapshot",
-            "_timeout",
-            "_allow_disk_use",
-            "_read_preference",
-            "_read_concern",
-            "_iter",
-            "_scalar",
-            "_as_pymongo",
-            "_limit",
-            "_skip",
-            "_empty",
-            "_hint",
-            "_collation",
-            "_search_text",
-            "_search_text_score",
-            "_max_time_ms",
-            "_comment",
-            "_batch_size",
-        )
-
-        for prop in copy_props:
-            val = getattr(self, prop)
-            setattr(new_qs, prop, copy.copy(val))
-
-        new_qs.__auto_dereference = self._BaseQuerySet__auto_dereference
+        for prop in self._clone_props:
+            setattr(new_qs, prop, getattr(self, prop))
 
         if self._cursor_obj:
             new_qs._cursor_obj = self._cursor_obj.clone()
@@ -997,6 +1562,7 @@ class BaseQuerySet:
 
         return queryset
 
+    @instrumentation.instrumented("distinct", _query_target, returned=len)
     def distinct(self, field):
         """Return a list of distinct values for a given field.
 
@@ -1140,6 +1706,7 @@ class BaseQuerySet:
         # Clone the queryset, group all fields by their value, convert
         # each of them to db_fields, and set the queryset's _loaded_fields
         queryset = self.clone()
+        queryset._loaded_fields = copy.copy(queryset._loaded_fields)
         for value, group in itertools.groupby(fields, lambda x: x[1]):
             fields = [field for field, value in group]
             fields = queryset._fields_to_dbfields(fields)
@@ -1354,6 +1921,7 @@ class BaseQuerySet:
         son_data = json_util.loads(json_data)
         return [self._document._from_son(data) for data in son_data]
 
+    @instrumentation.instrumented("aggregate", _query_target)
     def aggregate(self, pipeline, **kwargs):
         """Perform an aggregate function based on your queryset params
 
@@ -1409,11 +1977,7 @@ class BaseQuerySet:
 
         final_pipeline = first_step + initial_pipeline + new_user_pipeline
 
-        collection = self._collection
-        if self._read_preference is not None or self._read_concern is not None:
-            collection = self._collection.with_options(
-                read_preference=self._read_preference, read_concern=self._read_concern
-            )
+        collection = self._read_collection("aggregate")
 
         if self._hint not in (-1, None):
             kwargs.setdefault("hint", self._hint)
@@ -1525,15 +2089,23 @@ class BaseQuerySet:
 
                 mr_args["out"] = SON(ordered_output)
 
-        db = queryset._document._get_db()
+        if inline:
+            collection = queryset._read_collection("map_reduce")
+        else:
+            collection = queryset._write_collection("map_reduce")
+        command_kwargs = {}
+        if inline and collection is not queryset._collection:
+            command_kwargs["read_preference"] = collection.read_preference
+        db = collection.database
         result = db.command(
             {
-                "mapReduce": queryset._document._get_collection_name(),
+                "mapReduce": collection.name,
                 "map": map_f,
                 "reduce": reduce_f,
                 **mr_args,
             },
             session=_get_session(),
+            **command_kwargs,
         )
 
         if inline:
@@ -1550,7 +2122,7 @@ class BaseQuerySet:
 
         for doc in docs:
             yield MapReduceDocument(
-                queryset._document, queryset._collection, doc["_id"], doc["value"]
+                queryset._document, collection, doc["_id"], doc["value"]
             )
 
     def exec_js(self, code, *fields, **options):
@@ -1694,8 +2266,48 @@ class BaseQuerySet:
         if self._none or self._empty:
             raise StopIteration
 
-        raw_doc = next(self._cursor)
+        if not instrumentation._listeners:
+            return self._from_raw_doc(next(self._cursor))
+
+        # Measure the cost of iterating over the cursor, published as a
+        # "find" operation once it is exhausted, rewound or garbage collected
+        cursor = self._cursor
+        if self._iteration_stats is None or self._iteration_stats[0] is not cursor:
+            self._publish_iteration()
+            # [duration, number of documents, decode time]
+            stats = [0.0, 0, 0.0]
+            publisher = weakref.finalize(
+                cursor,
+                _publish_find,
+                self._document,
+                self._collection.name,
+                self._query,
+                stats,
+            )
+            publisher.atexit = False
+            self._iteration_stats = (cursor, stats, publisher)
+        stats = self._iteration_stats[1]
+
+        start = time.perf_counter()
+        try:
+            raw_doc = next(cursor)
+        except StopIteration:
+            stats[0] += time.perf_counter() - start
+            self._publish_iteration()
+            raise
+        fetched = time.perf_counter()
+        doc = self._from_raw_doc(raw_doc)
+        end = time.perf_counter()
+
+        stats[0] += end - start
+        stats[1] += 1
+        stats[2] += end - fetched
+        return doc
 
+    def _from_raw_doc(self, raw_doc):
+        """Convert a document returned by the cursor into the result of the
+        queryset.
+        """
         if self._as_pymongo:
             return raw_doc
 
@@ -1709,9 +2321,17 @@ class BaseQuerySet:
 
         return doc
 
+    def _publish_iteration(self):
+        """Publish the "find" operation of the iteration in progress, if any."""
+        if self._iteration_stats is not None:
+            publisher = self._iteration_stats[2]
+            self._iteration_stats = None
+            publisher()
+
     def rewind(self):
         """Rewind the cursor to its unevaluated state."""
         self._iter = False
+        self._publish_iteration()
         self._cursor.rewind()
 
     # Properties
@@ -1723,6 +2343,31 @@ class BaseQuerySet:
         """
         return self._collection_obj
 
+    def _read_collection(self, operation):
+        """Return the collection to run a read operation against, routed by
+        the router of the document unless the database or the read preference
+        were set explicitly on the queryset.
+        """
+        collection = self._collection
+        if self._routing and self._read_preference is None:
+            collection = _route(self._document, collection, operation)
+        # XXX In PyMongo 3+, we define the read preference on a collection
+        # level, not a cursor level. Thus, we need to get a cloned collection
+        # object using `with_options` first.
+        if self._read_preference is not None or self._read_concern is not None:
+            collection = collection.with_options(
+                read_preference=self._read_preference, read_concern=self._read_concern
+            )
+        return collection
+
+    def _write_collection(self, operation):
+        """Return the collection to run a write operation against, routed by
+        the router of the document unless the database was set explicitly.
+        """
+        if self._routing:
+            return _route(self._document, self._collection, operation, write=True)
+        return self._collection
+
     @property
     def _cursor_args(self):
         fields_name = "projection"
@@ -1760,17 +2405,9 @@ class BaseQuerySet:
             return self._cursor_obj
 
         # Create a new PyMongo cursor.
-        # XXX In PyMongo 3+, we define the read preference on a collection
-        # level, not a cursor level. Thus, we need to get a cloned collection
-        # object using `with_options` first.
-        if self._read_preference is not None or self._read_concern is not None:
-            self._cursor_obj = self._collection.with_options(
-                read_preference=self._read_preference, read_concern=self._read_concern
-            ).find(self._query, session=_get_session(), **self._cursor_args)
-        else:
-            self._cursor_obj = self._collection.find(
-                self._query, session=_get_session(), **self._cursor_args
-            )
+        self._cursor_obj = self._read_collection("find").find(
+            self._query, session=_get_session(), **self._cursor_args
+        )
 
         # Apply "where" clauses to cursor
         if self._where_clause:
@@ -1819,14 +2456,20 @@ class BaseQuerySet:
     @property
     def _query(self):
         if self._mongo_query is None:
-            self._mongo_query = self._query_obj.to_query(self._document)
-            if self._cls_query:
-                if "_cls" in self._mongo_query:
-                    self._mongo_query = {"$and": [self._cls_query, self._mongo_query]}
-                else:
-                    self._mongo_query.update(self._cls_query)
+            self._mongo_query = self._with_cls_query(
+                self._query_obj.to_query(self._document)
+            )
         return self._mongo_query
 
+    def _with_cls_query(self, mongo_query):
+        """Combine the given MongoDB filter with the default "_cls" query."""
+        if self._cls_query:
+            if "_cls" in mongo_query:
+                mongo_query = {"$and": [self._cls_query, mongo_query]}
+            else:
+                mongo_query.update(self._cls_query)
+        return mongo_query
+
     @property
     def _dereference(self):
         if not self.__dereference:
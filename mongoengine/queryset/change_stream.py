@@ -0,0 +1,111 @@
+from collections import namedtuple
+
+from mongoengine.errors import InvalidQueryError
+
+__all__ = ("ChangeEvent", "DocumentChangeStream")
+
+#: A change of a document, as yielded by a
+#: :class:`~mongoengine.queryset.change_stream.DocumentChangeStream`:
+#: ``operation_type`` is e.g. "insert", "update", "replace" or "delete",
+#: ``document`` is the changed document (None when the event holds no full
+#: document, e.g. for deletions) and ``event`` the raw change event.
+ChangeEvent = namedtuple("ChangeEvent", ("operation_type", "document", "event"))
+
+# Operators combining sub-queries, whose field paths have to be prefixed too
+COMBINATION_OPERATORS = ("$and", "$or", "$nor")
+
+
+def full_document_match(query, prefix="fullDocument."):
+    """Translate a query on the documents of a collection into a query on
+    the full documents of its change events, e.g.
+    ``{"name": "Ross", "$or": [{"age": 42}, ...]}`` becomes
+    ``{"fullDocument.name": "Ross", "$or": [{"fullDocument.age": 42}, ...]}``.
+    """
+    match = {}
+    for key, value in query.items():
+        if key in COMBINATION_OPERATORS:
+            match[key] = [full_document_match(sub_query, prefix) for sub_query in value]
+        elif key.startswith("$"):
+            raise InvalidQueryError(
+                "The %s operator can't be used to filter change events" % key
+            )
+        else:
+            match[prefix + key] = value
+    return match
+
+
+class DocumentChangeStream:
+    """Iterate over the changes of the documents selected by a queryset,
+    opened with :meth:`~mongoengine.queryset.QuerySet.watch`.
+
+    Each change is returned as a
+    :class:`~mongoengine.queryset.change_stream.ChangeEvent`. The stream
+    can be closed explicitly or used as a context manager.
+    """
+
+    def __init__(self, queryset, change_stream, on_resume_token=None):
+        self._queryset = queryset
+        self._change_stream = change_stream
+        self._on_resume_token = on_resume_token
+        self._processed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        self._notify_processed()
+        return self._to_event(next(self._change_stream))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def alive(self):
+        """Whether the change stream may return more events."""
+        return self._change_stream.alive
+
+    @property
+    def resume_token(self):
+        """The token to resume watching after the last returned event,
+        through ``watch(resume_after=...)``.
+        """
+        return self._change_stream.resume_token
+
+    def try_next(self):
+        """Return the next change if one is available, None otherwise,
+        without waiting for changes to happen. This allows polling several
+        streams from one loop.
+        """
+        self._notify_processed()
+        change = self._change_stream.try_next()
+        if change is None:
+            return None
+        return self._to_event(change)
+
+    def close(self):
+        """Close the change stream, notifying the ``on_resume_token`` hook
+        that the last returned event was processed.
+        """
+        self._notify_processed()
+        self._change_stream.close()
+
+    def _notify_processed(self):
+        # An event is deemed processed once the next one is requested, only
+        # then is its resume token handed to the hook, so that persisting
+        # it never skips an event that was not fully processed
+        if self._processed and self._on_resume_token is not None:
+            self._on_resume_token(self._change_stream.resume_token)
+        self._processed = False
+
+    def _to_event(self, change):
+        self._processed = True
+        queryset = self._queryset
+        document = change.get("fullDocument")
+        if document is not None and not queryset._as_pymongo:
+            document = queryset._document._from_son(
+                document, _auto_dereference=queryset._auto_dereference
+            )
+        return ChangeEvent(change["operationType"], document, change)
@@ -25,6 +25,14 @@ class QueryFieldList:
         self._only_called = _only_called
         self.slice = {}
 
+    def __copy__(self):
+        field_list = self.__class__.__new__(self.__class__)
+        field_list.__dict__.update(self.__dict__)
+        field_list.fields = set(self.fields)
+        field_list.always_include = set(self.always_include)
+        field_list.slice = dict(self.slice)
+        return field_list
+
     def __add__(self, f):
         if isinstance(f.value, dict):
             for field in f.fields:
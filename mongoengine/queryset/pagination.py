@@ -0,0 +1,115 @@
+import base64
+
+import pymongo
+from bson import json_util
+
+from mongoengine.errors import InvalidQueryError, OperationError
+
+__all__ = ("KeysetPage",)
+
+
+def encode_token(keys, values):
+    """Return an opaque continuation token holding the sort ``keys`` (as
+    ``(db_field, direction)`` tuples) and the ``values`` they have in the
+    last document of a page.
+    """
+    data = json_util.dumps(
+        [[list(key) for key in keys], values],
+        json_options=json_util.CANONICAL_JSON_OPTIONS,
+    )
+    return base64.urlsafe_b64encode(data.encode()).decode()
+
+
+def decode_token(token, keys):
+    """Return the values held by a continuation token, checking that it was
+    issued for the same sort ``keys``.
+
+    The tokens come from the clients and aren't signed: the values which
+    aren't plain values (i.e. documents, which could hold query operators)
+    are rejected.
+    """
+    try:
+        data = base64.urlsafe_b64decode(token.encode())
+        token_keys, values = json_util.loads(
+            data, json_options=json_util.CANONICAL_JSON_OPTIONS
+        )
+        token_keys = [tuple(key) for key in token_keys]
+    except (AttributeError, TypeError, ValueError):
+        raise InvalidQueryError("Invalid pagination token %r" % token)
+
+    if not isinstance(values, list) or any(isinstance(v, dict) for v in values):
+        raise InvalidQueryError("Invalid pagination token %r" % token)
+    if token_keys != list(keys) or len(values) != len(keys):
+        raise InvalidQueryError(
+            "The pagination token was not issued for the keys %s" % (keys,)
+        )
+    return values
+
+
+def seek_query(keys, values):
+    """Return the filter selecting the documents located after ``values``
+    in the order given by ``keys``, e.g. for keys (a, ASC), (b, DESC)::
+
+        {"$or": [{"a": {"$gt": va}}, {"a": {"$eq": va}, "b": {"$lt": vb}}]}
+
+    The values are always compared with operators, so that they are never
+    interpreted as operators themselves.
+    """
+    clauses = []
+    for idx, (key, direction) in enumerate(keys):
+        clause = {
+            prev_key: {"$eq": values[prev_idx]}
+            for prev_idx, (prev_key, _) in enumerate(keys[:idx])
+        }
+        operator = "$gt" if direction == pymongo.ASCENDING else "$lt"
+        clause[key] = {operator: values[idx]}
+        clauses.append(clause)
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+
+def key_values(doc, keys):
+    """Return the values of the sort ``keys`` in a document (or a raw
+    document when the queryset was made with ``as_pymongo()``).
+    """
+    son = doc if isinstance(doc, dict) else doc.to_mongo()
+    values = []
+    for key, _ in keys:
+        value = son
+        for part in key.split("."):
+            try:
+                value = value[part]
+            except (KeyError, TypeError):
+                raise OperationError(
+                    "Can't paginate by %s, it isn't loaded in the documents" % key
+                )
+        values.append(value)
+    return values
+
+
+class KeysetPage:
+    """A page of results returned by
+    :meth:`~mongoengine.queryset.QuerySet.paginate_by`.
+
+    Iterating over the page yields its documents, and :attr:`next_token`
+    gives the continuation token to pass to ``paginate_by(after=...)`` to
+    fetch the following page, or None if this page is the last one.
+    """
+
+    def __init__(self, documents, next_token):
+        self.documents = documents
+        self.next_token = next_token
+
+    def __iter__(self):
+        return iter(self.documents)
+
+    def __len__(self):
+        return len(self.documents)
+
+    def __getitem__(self, key):
+        return self.documents[key]
+
+    def __repr__(self):
+        return "<KeysetPage: %d documents, next_token=%r>" % (
+            len(self.documents),
+            self.next_token,
+        )
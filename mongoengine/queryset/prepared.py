@@ -0,0 +1,107 @@
+from mongoengine.errors import InvalidQueryError
+from mongoengine.queryset.transform import Param
+from mongoengine.queryset.visitor import Q
+
+__all__ = ("PreparedQuery",)
+
+
+def _compile_template(node, param_names):
+    """Return a function that builds a copy of ``node`` where the
+    :class:`~mongoengine.queryset.Param` placeholders are replaced with
+    their converted values, or None if ``node`` holds no placeholder (in
+    which case it can be shared as is).
+
+    The names of the placeholders found are added to ``param_names``.
+    """
+    if isinstance(node, Param):
+        param_names.add(node.name)
+        return lambda values: node.resolve(values[node.name])
+
+    if isinstance(node, dict):
+        builders = {}
+        for key, value in node.items():
+            builder = _compile_template(value, param_names)
+            if builder is not None:
+                builders[key] = builder
+        if not builders:
+            return None
+
+        def build_dict(values):
+            result = node.copy()
+            for key, builder in builders.items():
+                result[key] = builder(values)
+            return result
+
+        return build_dict
+
+    if isinstance(node, (list, tuple)):
+        builders = [
+            (idx, builder)
+            for idx, builder in (
+                (idx, _compile_template(value, param_names))
+                for idx, value in enumerate(node)
+            )
+            if builder is not None
+        ]
+        if not builders:
+            return None
+
+        def build_list(values):
+            result = list(node)
+            for idx, builder in builders:
+                result[idx] = builder(values)
+            return type(node)(result) if isinstance(node, tuple) else result
+
+        return build_list
+
+    return None
+
+
+class PreparedQuery:
+    """A query compiled once through
+    :meth:`~mongoengine.queryset.QuerySet.prepare`, that can be executed
+    many times with different values for its
+    :class:`~mongoengine.queryset.Param` placeholders.
+
+    Executing a prepared query only substitutes the converted values in the
+    pre-built MongoDB filter, the ordering, projection and cursor options of
+    the queryset it was prepared from being reused as is.
+    """
+
+    def __init__(self, queryset, template):
+        self._queryset = queryset
+        self._template = template
+        param_names = set()
+        self._build = _compile_template(template, param_names)
+        self.params = frozenset(param_names)
+
+    def __repr__(self):
+        return f"<PreparedQuery: {self._template!r}>"
+
+    def execute(self, **values):
+        """Return a queryset matching the prepared filter, given the values
+        of its parameters.
+
+        :param values: the value of each :class:`~mongoengine.queryset.Param`,
+            keyed by name
+        """
+        if values.keys() != self.params:
+            missing = self.params.difference(values)
+            if missing:
+                msg = "Missing value for parameter(s): %s" % ", ".join(sorted(missing))
+            else:
+                unknown = set(values).difference(self.params)
+                msg = "Unknown parameter(s): %s" % ", ".join(sorted(unknown))
+            raise InvalidQueryError(msg)
+
+        if self._build is None:
+            query = self._template.copy()
+        else:
+            query = self._build(values)
+
+        queryset = self._queryset.clone()
+        # Keep a raw version of the filter so that the queryset can still be
+        # refined (e.g. with .filter()) after execution
+        queryset._query_obj = Q(__raw__=query)
+        queryset._mongo_query = queryset._with_cls_query(query.copy())
+        return queryset
@@ -1,3 +1,4 @@
+from mongoengine import signals
 from mongoengine.errors import OperationError
 from mongoengine.queryset.base import (
     CASCADE,
@@ -123,6 +124,7 @@ class QuerySet(BaseQuerySet):
 
         # Pull in ITER_CHUNK_SIZE docs from the database and store them in
         # the result cache.
+        start = len(self._result_cache)
         try:
             for _ in range(ITER_CHUNK_SIZE):
                 self._result_cache.append(next(self))
@@ -132,6 +134,15 @@ class QuerySet(BaseQuerySet):
             # information in other places.
             self._has_more = False
 
+        if (
+            not (self._scalar or self._as_pymongo)
+            and len(self._result_cache) > start
+            and signals.post_init_bulk.has_receivers_for(self._document)
+        ):
+            signals.post_init_bulk.send(
+                self._document, documents=self._result_cache[start:]
+            )
+
     def count(self, with_limit_and_skip=False):
         """Count the selected elements in the query.
 
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from functools import partial
 
 import pymongo
 from bson import SON, ObjectId
@@ -8,7 +9,7 @@ from mongoengine.base import UPDATE_OPERATORS
 from mongoengine.common import _import_class
 from mongoengine.errors import InvalidQueryError
 
-__all__ = ("query", "update", "STRING_OPERATORS")
+__all__ = ("query", "update", "Param", "STRING_OPERATORS")
 
 COMPARISON_OPERATORS = (
     "ne",
@@ -60,6 +61,44 @@ CUSTOM_OPERATORS = ("match",)
 MATCH_OPERATORS = (
     COMPARISON_OPERATORS + GEO_OPERATORS + STRING_OPERATORS + CUSTOM_OPERATORS
 )
+SINGULAR_OPERATORS = (None, "ne", "gt", "gte", "lt", "lte", "not") + STRING_OPERATORS
+
+
+class Param:
+    """A placeholder for a query value that is only known when executing a
+    prepared query (see :meth:`~mongoengine.queryset.QuerySet.prepare`).
+
+    :param name: the name of the keyword argument providing the value
+    """
+
+    def __init__(self, name):
+        if not isinstance(name, str):
+            raise TypeError("Param name must be a string")
+        self.name = name
+        self._convert = None
+
+    def __repr__(self):
+        return "Param(%r)" % self.name
+
+    def __eq__(self, other):
+        return isinstance(other, Param) and self.name == other.name
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def _bind(self, convert):
+        """Return a copy of the placeholder that converts the provided value
+        with ``convert``.
+        """
+        param = Param(self.name)
+        param._convert = convert
+        return param
+
+    def resolve(self, value):
+        """Convert the provided value like a regular query value would be."""
+        if self._convert is None:
+            return value
+        return self._convert(value)
 
 
 def handle_raw_query(value, mongo_query):
@@ -127,19 +166,22 @@ def query(_doc_cls=None, **kwargs):
             # Convert value to proper value
             field = cleaned_fields[-1]
 
-            singular_ops = [None, "ne", "gt", "gte", "lt", "lte", "not"]
-            singular_ops += STRING_OPERATORS
-            is_iterable = False
-            if op in singular_ops:
-                value = field.prepare_query_value(op, value)
-
-                if isinstance(field, CachedReferenceField) and value:
-                    value = value["_id"]
-
-            elif op in ("in", "nin", "all", "near") and not isinstance(value, dict):
-                is_iterable = True
-                # Raise an error if the in/nin/all/near param is not iterable.
-                value = _prepare_query_for_iterable(field, op, value)
+            is_iterable = op in ("in", "nin", "all", "near") and not isinstance(
+                value, dict
+            )
+            if isinstance(value, Param):
+                # The conversion is deferred until the value is known
+                if (
+                    op in GEO_OPERATORS
+                    or op in ("match", "elemMatch")
+                    or isinstance(field, GenericReferenceField)
+                ):
+                    raise InvalidQueryError(
+                        "A Param can't be used in the `%s` query" % key
+                    )
+                value = value._bind(partial(_prepare_query_value, field, op))
+            else:
+                value = _prepare_query_value(field, op, value)
 
             # If we're querying a GenericReferenceField, we need to alter the
             # key depending on the value:
@@ -520,6 +562,24 @@ def _infer_geometry(value):
     )
 
 
+def _prepare_query_value(field, op, value):
+    """Convert a query value to its MongoDB representation given the field
+    and the operator it is used with.
+    """
+    if op in SINGULAR_OPERATORS:
+        value = field.prepare_query_value(op, value)
+
+        CachedReferenceField = _import_class("CachedReferenceField")
+        if isinstance(field, CachedReferenceField) and value:
+            value = value["_id"]
+
+    elif op in ("in", "nin", "all", "near") and not isinstance(value, dict):
+        # Raise an error if the in/nin/all/near param is not iterable.
+        value = _prepare_query_for_iterable(field, op, value)
+
+    return value
+
+
 def _prepare_query_for_iterable(field, op, value):
     # We need a special check for BaseDocument, because - although it's iterable - using
     # it as such in the context of this method is most definitely a mistake.
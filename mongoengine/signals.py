@@ -1,18 +1,79 @@
+import threading
+import weakref
+
 __all__ = (
     "pre_init",
     "post_init",
+    "post_init_bulk",
     "pre_save",
     "pre_save_post_validation",
     "post_save",
+    "post_save_bulk",
     "pre_delete",
+    "pre_delete_bulk",
     "post_delete",
+    "post_delete_bulk",
 )
 
 signals_available = False
 try:
-    from blinker import Namespace
+    from blinker import NamedSignal, Namespace as _BlinkerNamespace
 
     signals_available = True
+
+    class _Signal(NamedSignal):
+        """Signal remembering, per sender, whether it has any receiver, so
+        that MongoEngine can skip sending it altogether when it doesn't.
+        """
+
+        def __init__(self, name, doc=None):
+            super().__init__(name, doc)
+            # Weakly keyed so that the cache doesn't keep the senders alive
+            self._has_receivers = weakref.WeakKeyDictionary()
+            self._has_receivers_lock = threading.Lock()
+            self._has_receivers_version = 0
+
+        def _clear_has_receivers(self):
+            with self._has_receivers_lock:
+                self._has_receivers_version += 1
+                self._has_receivers.clear()
+
+        def connect(self, *args, **kwargs):
+            receiver = super().connect(*args, **kwargs)
+            self._clear_has_receivers()
+            return receiver
+
+        def disconnect(self, *args, **kwargs):
+            super().disconnect(*args, **kwargs)
+            self._clear_has_receivers()
+
+        def has_receivers_for(self, sender):
+            # Receivers garbage collected since the last connect/disconnect
+            # only make this return True needlessly.
+            try:
+                return self._has_receivers[sender]
+            except (KeyError, TypeError):
+                pass
+
+            version = self._has_receivers_version
+            has_receivers = any(True for _ in self.receivers_for(sender))
+            with self._has_receivers_lock:
+                # Don't cache a result computed while receivers were being
+                # connected or disconnected
+                if version == self._has_receivers_version:
+                    try:
+                        self._has_receivers[sender] = has_receivers
+                    except TypeError:
+                        # Senders which can't be weakly referenced aren't cached
+                        pass
+            return has_receivers
+
+    class Namespace(_BlinkerNamespace):
+        def signal(self, name, doc=None):
+            if name not in self:
+                self[name] = _Signal(name, doc)
+            return self[name]
+
 except ImportError:
 
     class Namespace:
@@ -38,9 +99,8 @@ except ImportError:
             )
 
         send = lambda *a, **kw: None  # noqa
-        connect = disconnect = has_receivers_for = receivers_for = (
-            temporarily_connected_to
-        ) = _fail
+        has_receivers_for = lambda *a, **kw: False  # noqa
+        connect = disconnect = receivers_for = temporarily_connected_to = _fail
         del _fail
 
 
@@ -50,10 +110,14 @@ _signals = Namespace()
 
 pre_init = _signals.signal("pre_init")
 post_init = _signals.signal("post_init")
+post_init_bulk = _signals.signal("post_init_bulk")
 pre_save = _signals.signal("pre_save")
 pre_save_post_validation = _signals.signal("pre_save_post_validation")
 post_save = _signals.signal("post_save")
+post_save_bulk = _signals.signal("post_save_bulk")
 pre_delete = _signals.signal("pre_delete")
+pre_delete_bulk = _signals.signal("pre_delete_bulk")
 post_delete = _signals.signal("post_delete")
+post_delete_bulk = _signals.signal("post_delete_bulk")
 pre_bulk_insert = _signals.signal("pre_bulk_insert")
 post_bulk_insert = _signals.signal("post_bulk_insert")
@@ -344,6 +344,42 @@ class TestClassMethods(unittest.TestCase):
 
         Person.drop_collection()
 
+    def test_lookup_field_is_memoized(self):
+        """Ensure that resolved field paths are cached per class."""
+
+        class Comment(EmbeddedDocument):
+            text = StringField(db_field="t")
+
+        class BlogPost(Document):
+            comments = ListField(EmbeddedDocumentField(Comment))
+
+        fields = BlogPost._lookup_field(["comments", "text"])
+        assert [f.db_field for f in fields] == ["comments", "t"]
+        assert ("comments", "text") in BlogPost._lookup_field_cache[1]
+
+        # The cached chain is reused but callers get their own list
+        fields.append("junk")
+        again = BlogPost._lookup_field(["comments", "text"])
+        assert [f.db_field for f in again] == ["comments", "t"]
+
+        # The cache is not shared with other classes
+        assert ("comments", "text") not in (self.Person._lookup_field_cache or (0, {}))[
+            1
+        ]
+
+    def test_lookup_field_cache_invalidated_by_registry_changes(self):
+        """Ensure that fields defined on subclasses registered after a
+        lookup are found.
+        """
+        self.Person._lookup_field("name")
+        generation = self.Person._lookup_field_cache[0]
+
+        class Employee(self.Person):
+            salary = IntField()
+
+        assert self.Person._lookup_field("salary")[0] is Employee._fields["salary"]
+        assert self.Person._lookup_field_cache[0] != generation
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from datetime import datetime
+from unittest import mock
 
 import pytest
 from pymongo.collation import Collation
@@ -1160,6 +1161,95 @@ class TestIndexes(unittest.TestCase):
         assert Sample1.compare_indexes() == {"missing": [], "extra": []}
         assert Sample2.compare_indexes() == {"missing": [], "extra": []}
 
+    def test_index_specs_built_on_first_use(self):
+        """Ensure the index specs are built on first use, for each class."""
+
+        class Place(Document):
+            name = StringField()
+            location = PointField()
+            meta = {"allow_inheritance": True, "indexes": ["name"]}
+
+        assert "index_specs" not in Place._meta
+        assert Place._meta["index_specs"] == [
+            {"fields": [("_cls", 1), ("name", 1)]},
+            {"fields": [("location", "2dsphere")]},
+        ]
+
+        class Restaurant(Place):
+            chef = StringField()
+            meta = {"indexes": ["chef"]}
+
+        assert "index_specs" not in Restaurant._meta
+        assert Restaurant._meta["index_specs"] == [
+            {"fields": [("_cls", 1), ("name", 1)]},
+            {"fields": [("_cls", 1), ("chef", 1)]},
+            {"fields": [("location", "2dsphere")]},
+        ]
+
+        # The fields of the indexes are still checked at class creation
+        with pytest.raises(LookUpError):
+
+            class Bar(Place):
+                meta = {"indexes": ["-menu"]}
+
+    def test_sync_indexes(self):
+        """Ensure sync_indexes() creates the missing indexes of the
+        collections of the given documents.
+        """
+
+        class Animal(Document):
+            name = StringField()
+            meta = {
+                "allow_inheritance": True,
+                "auto_create_index": False,
+                "indexes": ["name"],
+            }
+
+        class Dog(Animal):
+            owner = StringField()
+            meta = {"indexes": [{"fields": ["owner"], "unique": True}]}
+
+        class Note(Document):
+            text = StringField()
+            meta = {"auto_create_index": False, "indexes": ["$text"]}
+
+        Animal.drop_collection()
+        Note.drop_collection()
+        Animal._get_collection().create_index([("_cls", 1), ("name", 1)])
+
+        assert sync_indexes([Animal, Dog, Note], dry_run=True) == {
+            "mongoenginetest.animal": ["_cls_1_owner_1"],
+            "mongoenginetest.note": ["text_text"],
+        }
+        assert sorted(Animal._get_collection().index_information()) == [
+            "_cls_1_name_1",
+            "_id_",
+        ]
+
+        created = sync_indexes([Animal, Dog, Note], workers=2)
+        assert created["mongoenginetest.animal"] == ["_cls_1_owner_1"]
+        info = Animal._get_collection().index_information()
+        assert sorted(info) == ["_cls_1_name_1", "_cls_1_owner_1", "_id_"]
+        assert info["_cls_1_owner_1"]["unique"]
+        assert Animal.compare_indexes() == {"missing": [], "extra": []}
+        assert Note.compare_indexes() == {"missing": [], "extra": []}
+
+        assert sync_indexes([Animal, Dog, Note]) == {
+            "mongoenginetest.animal": [],
+            "mongoenginetest.note": [],
+        }
+
+        # The indexes of the documents using auto_create_index aren't
+        # created one by one beforehand
+        class Tag(Document):
+            name = StringField()
+            meta = {"indexes": ["name"]}
+
+        Tag.drop_collection()
+        with mock.patch.object(Tag, "ensure_indexes") as ensure_indexes:
+            assert sync_indexes([Tag]) == {"mongoenginetest.tag": ["name_1"]}
+        ensure_indexes.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
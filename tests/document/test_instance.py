@@ -485,7 +485,7 @@ class TestDocumentInstance(MongoDBTestCase):
 
         mongo_db = get_mongodb_version()
         CMD_QUERY_KEY = "command" if mongo_db >= MONGODB_36 else "query"
-        with query_counter() as q:
+        with db_ops_tracker() as q:
             doc.reload()
             query_op = q.db.system.profile.find({"ns": "mongoenginetest.animal"})[0]
             assert set(query_op[CMD_QUERY_KEY]["filter"].keys()) == {
@@ -503,7 +503,7 @@ class TestDocumentInstance(MongoDBTestCase):
 
         mongo_db = get_mongodb_version()
         CMD_QUERY_KEY = "command" if mongo_db >= MONGODB_36 else "query"
-        with query_counter() as q:
+        with db_ops_tracker() as q:
             doc.reload()
             query_op = q.db.system.profile.find({"ns": "mongoenginetest.person"})[0]
             assert set(query_op[CMD_QUERY_KEY]["filter"].keys()) == {"_id", "country"}
@@ -536,7 +536,7 @@ class TestDocumentInstance(MongoDBTestCase):
         doc = Animal(is_mammal=True, name="Dog")
         doc.save()
 
-        with query_counter() as q:
+        with db_ops_tracker() as q:
             doc.name = "Cat"
             doc.save()
             query_op = q.db.system.profile.find({"ns": "mongoenginetest.animal"})[0]
@@ -559,7 +559,7 @@ class TestDocumentInstance(MongoDBTestCase):
         Animal.drop_collection()
         doc = Animal(is_mammal=True, name="Dog")
 
-        with query_counter() as q:
+        with db_ops_tracker() as q:
             doc.save()
             query_op = q.db.system.profile.find({"ns": "mongoenginetest.animal"})[0]
             assert query_op["op"] == "command"
@@ -3372,6 +3372,63 @@ class TestDocumentInstance(MongoDBTestCase):
         )
         assert str(exc_info.value) == expected_msg
 
+    def test_specialised_init(self):
+        class Tag(EmbeddedDocument):
+            name = StringField(default="new")
+
+        class Post(Document):
+            title = StringField()
+            rating = IntField(default=3)
+            created = DateTimeField(default=datetime.now)
+            tag = EmbeddedDocumentField(Tag, default=Tag)
+            tags = ListField(StringField())
+            state = StringField(choices=(("d", "Draft"), ("p", "Published")))
+            meta = {"allow_inheritance": True}
+
+        class DatedPost(Post):
+            date = StringField(default="today")
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.title = self.title or "Untitled"
+
+        class TrackedPost(Post):
+            def __setattr__(self, name, value):
+                super().__setattr__(name, value)
+
+        post = Post(title="Test", state="p")
+        # The constructor is generated on first use
+        assert Post.__init__.__qualname__.endswith("Post.__init__")
+        assert post._data["rating"] == 3
+        assert isinstance(post.created, datetime)
+        assert post.tag == Tag(name="new")
+        assert post.tag._instance == post
+        assert post.tags == []
+        assert post._cls == "Post"
+        assert post.get_state_display() == "Published"
+        assert "get_state_display" not in post.__dict__
+        with pytest.raises(FieldDoesNotExist):
+            Post(title="Test", body="Body")
+
+        # Subclasses with their own __init__ or __setattr__ are kept as is
+        post = DatedPost(rating=4)
+        assert DatedPost.__init__.__qualname__.endswith("DatedPost.__init__")
+        assert post.to_mongo().to_dict() == {
+            "_cls": "Post.DatedPost",
+            "rating": 4,
+            "created": post.created,
+            "tag": {"name": "new"},
+            "tags": [],
+            "date": "today",
+            "title": "Untitled",
+        }
+        assert post.get_state_display() is None
+        assert TrackedPost(rating=1).rating == 1
+        assert "__init__" not in vars(TrackedPost)
+
+        assert Tag(name="x").name == "x"
+        assert Tag().name == "new"
+
     def test_data_contains_id_field(self):
         """Ensure that asking for _data returns 'id'."""
 
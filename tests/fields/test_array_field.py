@@ -0,0 +1,138 @@
+import array
+import pickle
+
+import pytest
+from bson import Binary
+
+from mongoengine import *
+from mongoengine.base import BaseArray
+from tests.utils import MongoDBTestCase, get_as_pymongo
+
+
+class TestArrayField(MongoDBTestCase):
+    def test_storage(self):
+        class Series(Document):
+            samples = ArrayField("d")
+            counts = ArrayField("q", binary=True)
+
+        Series.drop_collection()
+
+        series = Series(samples=[1, 2.5, 3], counts=array.array("q", [1, -2, 3])).save()
+        assert get_as_pymongo(series) == {
+            "_id": series.id,
+            "samples": [1.0, 2.5, 3.0],
+            "counts": Binary(array.array("q", [1, -2, 3]).tobytes()),
+        }
+
+        series = Series.objects.get()
+        assert isinstance(series.samples, BaseArray)
+        assert series.samples == array.array("d", [1.0, 2.5, 3.0])
+        assert series.counts == array.array("q", [1, -2, 3])
+        assert Series.objects(samples__gt=2).count() == 1
+        assert Series.objects(samples=[1.0, 2.5, 3.0]).count() == 1
+        assert Series.objects(counts=[1, -2, 3]).count() == 1
+
+    def test_default(self):
+        class Series(Document):
+            samples = ArrayField("i")
+
+        series = Series()
+        assert series.samples == array.array("i")
+        series.samples.append(1)
+        assert Series().samples == array.array("i")
+
+    def test_change_tracking(self):
+        class Series(Document):
+            samples = ArrayField("d")
+
+        Series.drop_collection()
+        series = Series(samples=[1, 2, 3]).save()
+        assert series._get_changed_fields() == []
+
+        series.samples[1] = 4
+        series.samples.append(5)
+        assert series._get_changed_fields() == ["samples"]
+        assert series._delta() == ({"samples": [1.0, 4.0, 3.0, 5.0]}, {})
+        series.save()
+
+        series.reload()
+        series.samples += array.array("d", [6])
+        assert series._get_changed_fields() == ["samples"]
+        series.save()
+        assert Series.objects.get().samples.tolist() == [1, 4, 3, 5, 6]
+
+    def test_validation(self):
+        class Series(Document):
+            samples = ArrayField("B", max_length=3)
+
+        Series(samples=[1, 255]).validate()
+        with pytest.raises(ValidationError, match="Invalid items"):
+            Series(samples=[256]).validate()
+        with pytest.raises(ValidationError, match="Invalid items"):
+            Series(samples=["a"]).validate()
+        with pytest.raises(ValidationError, match="Expected an array of type 'B'"):
+            Series(samples=array.array("d", [1])).validate()
+        with pytest.raises(ValidationError, match="Array is too long"):
+            Series(samples=[1, 2, 3, 4]).validate()
+        with pytest.raises(ValidationError):
+            Series(samples="123").validate()
+
+        with pytest.raises(ValueError, match="Invalid typecode"):
+            ArrayField("u")
+
+    def test_invalid_values(self):
+        class Series(Document):
+            samples = ArrayField("B")
+            counts = ArrayField("q", binary=True)
+
+        # Values which can't be converted are kept as is for validate()
+        for samples in ([256], ["a"], array.array("d", [1.5])):
+            series = Series(samples=samples)
+            assert series.samples == samples
+            assert not isinstance(series.samples, BaseArray)
+            with pytest.raises(ValidationError):
+                series.validate()
+
+        Series.drop_collection()
+        Series._get_collection().insert_one({"counts": Binary(b"\x01\x02\x03")})
+        series = Series.objects.get()
+        assert bytes(series.counts) == b"\x01\x02\x03"
+        with pytest.raises(ValidationError):
+            series.validate()
+
+    def test_update(self):
+        class Series(Document):
+            samples = ArrayField("d")
+            counts = ArrayField("B")
+
+        Series.drop_collection()
+        series = Series(samples=[1, 2], counts=[1]).save()
+
+        Series.objects.update(push__samples=3, add_to_set__counts=2)
+        series.reload()
+        assert series.samples == array.array("d", [1, 2, 3])
+        assert series.counts == array.array("B", [1, 2])
+
+        Series.objects.update(pull__samples=1, push_all__counts=[3, 4])
+        series.reload()
+        assert series.samples == array.array("d", [2, 3])
+        assert series.counts == array.array("B", [1, 2, 3, 4])
+
+        Series.objects.update(set__samples=array.array("d", [5]))
+        assert Series.objects.get().samples == array.array("d", [5])
+
+        with pytest.raises(ValidationError, match="Invalid item"):
+            Series.objects.update(push__counts=256)
+        with pytest.raises(ValidationError, match="Invalid item"):
+            Series.objects.update(push__samples="a")
+
+    def test_pickle(self):
+        class Series(Document):
+            samples = ArrayField("d")
+
+        series = Series(samples=[1, 2])
+        assert isinstance(series.samples, BaseArray)
+        # Pickled without the reference to the document
+        loaded = pickle.loads(pickle.dumps(series.samples))
+        assert type(loaded) is array.array
+        assert loaded == array.array("d", [1, 2])
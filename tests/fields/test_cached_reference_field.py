@@ -1,4 +1,5 @@
 from decimal import Decimal
+from unittest import mock
 
 import pytest
 
@@ -14,6 +15,7 @@ from mongoengine import (
     StringField,
     ValidationError,
 )
+from mongoengine.context_managers import defer_cached_reference_sync
 from tests.utils import MongoDBTestCase
 
 
@@ -291,6 +293,80 @@ class TestCachedReferenceField(MongoDBTestCase):
             "father": {"_id": a1.pk, "tp": "pj"},
         }
 
+    def test_cached_reference_sync_all_by_batches(self):
+        class Category(Document):
+            name = StringField()
+
+        class Product(Document):
+            category = CachedReferenceField(Category, fields=("name",), auto_sync=False)
+
+        Category.drop_collection()
+        Product.drop_collection()
+
+        categories = [Category(name="Category %d" % i).save() for i in range(5)]
+        for category in categories:
+            Product(category=category).save()
+            Product(category=category).save()
+
+        Category.objects.update(set__name="Renamed")
+        with mock.patch.object(
+            CachedReferenceField,
+            "_sync",
+            autospec=True,
+            side_effect=CachedReferenceField._sync,
+        ) as sync:
+            Product.category.sync_all(batch_size=2)
+
+        assert [len(call.args[1]) for call in sync.call_args_list] == [2, 2, 1]
+        assert {
+            product["category"]["name"] for product in Product.objects.as_pymongo()
+        } == {"Renamed"}
+
+    def test_defer_cached_reference_sync(self):
+        class Person(Document):
+            name = StringField()
+            tp = StringField()
+            father = CachedReferenceField("self", fields=("tp",))
+
+        Person.drop_collection()
+
+        a1 = Person(name="Wilson Father", tp="pj").save()
+        a2 = Person(name="Wilson Junior", tp="pf", father=a1).save()
+
+        with mock.patch.object(
+            CachedReferenceField,
+            "_sync",
+            autospec=True,
+            side_effect=CachedReferenceField._sync,
+        ) as sync:
+            with defer_cached_reference_sync():
+                a1.tp = "pf"
+                a1.save()
+                a1.tp = "px"
+                a1.save()
+                with defer_cached_reference_sync():
+                    a2.name = "Wilson"
+                    a2.save()
+                father = Person.objects.as_pymongo().get(pk=a2.pk)["father"]
+                assert father["tp"] == "pj"
+                assert sync.call_count == 0
+
+        # Both saves of a1 are coalesced into a single update
+        assert sync.call_count == 1
+        assert sync.call_args.args[1] == {a1.pk: {"father.tp": "px"}}
+        assert Person.objects.as_pymongo().get(pk=a2.pk)["father"] == {
+            "_id": a1.pk,
+            "tp": "px",
+        }
+
+        # The pending updates are dropped when the context exits on an error
+        with pytest.raises(ZeroDivisionError):
+            with defer_cached_reference_sync():
+                a1.tp = "pz"
+                a1.save()
+                1 / 0
+        assert Person.objects.as_pymongo().get(pk=a2.pk)["father"]["tp"] == "px"
+
     def test_cached_reference_embedded_fields(self):
         class Owner(EmbeddedDocument):
             TPS = (("n", "Normal"), ("u", "Urgent"))
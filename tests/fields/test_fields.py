@@ -2212,6 +2212,60 @@ class TestEmbeddedDocumentListField(MongoDBTestCase):
         with pytest.raises(DoesNotExist):
             self.post1.comments.get(author="user3")
 
+    def test_indexed_lookups(self):
+        class Item(EmbeddedDocument):
+            sku = StringField()
+            ref = ObjectIdField()
+            qty = IntField()
+
+            @property
+            def label(self):
+                return self.sku.upper()
+
+        class Order(Document):
+            items = EmbeddedDocumentListField(Item)
+
+        ref = ObjectId()
+        order = Order(
+            items=[Item(sku="sku%d" % i, qty=i % 3) for i in range(100)]
+            + [Item(sku="other", ref=ref, qty=1)]
+        )
+        items = order.items
+
+        assert items.get(sku="sku42").qty == 0
+        assert items.get(ref=str(ref)).sku == "other"
+        assert [item.sku for item in items.filter(qty=1.0, sku="other")] == ["other"]
+        assert items.filter(qty=2).count() == 33
+        assert items.exclude(qty=2).count() == 68
+        with pytest.raises(MultipleObjectsReturned) as exc_info:
+            items.get(qty=1)
+        assert str(exc_info.value) == "2 or more items returned, instead of 1"
+
+        # The indexes are dropped when the list or its items change
+        items[42].sku = "renamed"
+        assert items.filter(sku="sku42").count() == 0
+        assert items.get(sku="renamed") is items[42]
+        items.append(Item(sku="sku42"))
+        assert items.get(sku="sku42") is items[-1]
+        items.filter(qty=2).update(qty=3)
+        assert items.filter(qty=3).count() == 33
+        del items[:50]
+        assert items.filter(qty=3).count() == 17
+
+        # Only the indexes on the changed field are dropped
+        assert items.get(sku="sku50").qty == 3
+        sku_index = items._indexes["sku"]
+        items[0].qty = 4
+        assert items.get(sku="sku50").qty == 4
+        assert items._indexes["sku"] is sku_index
+        assert items.filter(qty=4).count() == 1
+
+        # Keys which aren't fields, e.g. properties, aren't indexed
+        assert items.get(label="SKU51").sku == "sku51"
+        items[1].sku = "sku151"
+        assert items.filter(label="SKU51").count() == 0
+        assert items.get(label="SKU151") is items[1]
+
     def test_first(self):
         """
         Tests the first method of a List of Embedded Documents to
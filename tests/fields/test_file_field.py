@@ -1,14 +1,18 @@
 import copy
+import io
 import os
 import tempfile
+import threading
 import unittest
 from io import BytesIO
+from unittest import mock
 
 import gridfs
 import pytest
 
 from mongoengine import *
 from mongoengine.connection import get_db
+from mongoengine.fields import ImageGridFsProxy
 
 try:
     from PIL import Image  # noqa: F401
@@ -39,6 +43,8 @@ class TestFileField(MongoDBTestCase):
     def tearDown(self):
         self.db.drop_collection("fs.files")
         self.db.drop_collection("fs.chunks")
+        self.db.drop_collection("images.files")
+        self.db.drop_collection("images.chunks")
 
     def test_file_field_optional(self):
         # Make sure FileField is optional and not required
@@ -123,6 +129,111 @@ class TestFileField(MongoDBTestCase):
         # Ensure deleted file returns None
         assert result.the_file.read() is None
 
+    def test_file_fields_iter_chunks_and_ranges(self):
+        class StreamFile(Document):
+            the_file = FileField()
+
+        StreamFile.drop_collection()
+
+        data = bytes(range(256)) * 10
+        streamfile = StreamFile()
+        streamfile.the_file.put(data, chunkSize=1000)
+        streamfile.save()
+
+        the_file = StreamFile.objects.get().the_file
+        assert [len(chunk) for chunk in the_file.iter_chunks()] == [1000, 1000, 560]
+        assert b"".join(the_file.iter_chunks(300)) == data
+        assert [len(chunk) for chunk in the_file.iter_chunks(300, 100, 800)] == [
+            300,
+            300,
+            100,
+        ]
+        for start, end in ((0, None), (10, 20), (990, 1010), (999, 2001), (2500, 9000)):
+            assert the_file.read_range(start, end) == data[start:end]
+        assert the_file.read_range(3000) == b""
+        with pytest.raises(ValueError):
+            the_file.read_range(-10)
+
+        # Only the chunks holding the range are fetched
+        self.db.fs.chunks.delete_one({"n": 0})
+        assert the_file.read_range(1000, 1010) == data[1000:1010]
+        with pytest.raises(gridfs.errors.CorruptGridFile):
+            the_file.read_range(990, 1010)
+
+        the_file.delete()
+        assert the_file.read_range(0, 10) is None
+        assert list(the_file.iter_chunks()) == []
+
+    def test_file_fields_reader(self):
+        class StreamFile(Document):
+            the_file = FileField()
+
+        StreamFile.drop_collection()
+
+        data = bytes(range(256)) * 10
+        streamfile = StreamFile()
+        streamfile.the_file.put(data, chunkSize=1000)
+        streamfile.save()
+
+        the_file = StreamFile.objects.get().the_file
+        reader = the_file.open()
+        buffer = bytearray(700)
+        content = b""
+        size = reader.readinto(buffer)
+        while size:
+            content += buffer[:size]
+            size = reader.readinto(buffer)
+        assert content == data
+        reader.seek(-10, os.SEEK_END)
+        assert reader.read() == data[-10:]
+
+        with io.BufferedReader(the_file.open(), buffer_size=512) as buffered:
+            buffered.seek(1500)
+            assert buffered.read(700) == data[1500:2200]
+        # Readers are independent of read()
+        assert the_file.read(5) == data[:5]
+
+    def test_file_fields_put_workers(self):
+        class PutFile(Document):
+            the_file = FileField()
+
+        PutFile.drop_collection()
+
+        data = os.urandom(10500)
+        putfile = PutFile()
+        putfile.the_file.put(
+            data, workers=3, chunkSize=1000, filename="data.bin", content_type="x/y"
+        )
+        putfile.save()
+
+        the_file = PutFile.objects.get().the_file
+        assert the_file.read() == data
+        assert the_file.length == len(data)
+        assert the_file.chunk_size == 1000
+        assert the_file.filename == "data.bin"
+        assert the_file.content_type == "x/y"
+        assert self.db.fs.chunks.count_documents({}) == 11
+
+    def test_file_fields_put_workers_failure(self):
+        class PutFile(Document):
+            the_file = FileField()
+
+        class FailingFile:
+            reads = 0
+
+            def read(self, size):
+                self.reads += 1
+                if self.reads > 5:
+                    raise OSError("Read failure")
+                return b"x" * size
+
+        putfile = PutFile()
+        with pytest.raises(OSError, match="Read failure"):
+            putfile.the_file.put(FailingFile(), workers=2, chunkSize=1000)
+        assert not putfile.the_file
+        assert self.db.fs.chunks.count_documents({}) == 0
+        assert self.db.fs.files.count_documents({}) == 0
+
     def test_file_fields_stream_after_none(self):
         """Ensure that a file field can be written to after it has been saved as
         None
@@ -481,6 +592,92 @@ class TestFileField(MongoDBTestCase):
 
         t.image.delete()
 
+    @require_pil
+    def test_image_field_background_processing(self):
+        class TestImage(Document):
+            image = ImageField(
+                size=(185, 37, True),
+                thumbnail_size=(92, 18, True),
+                processing="background",
+            )
+
+        TestImage.drop_collection()
+
+        t = TestImage()
+        processing = t.image.put(get_file(TEST_IMAGE_PATH))
+        t.save()
+        processing.result()
+
+        t = TestImage.objects.first()
+        assert t.image.size == (185, 37)
+        assert t.image.thumbnail.width == 92
+        assert self.db.images.files.count_documents({}) == 3
+
+        t.image.delete()
+        assert self.db.images.files.count_documents({}) == 0
+
+        # Errors are logged even if the processing is never waited for
+        t = TestImage()
+        with mock.patch.object(
+            ImageGridFsProxy, "process", side_effect=OSError("broken")
+        ):
+            with self.assertLogs("mongoengine.fields", "ERROR") as logs:
+                processing = t.image.put(get_file(TEST_IMAGE_PATH))
+                # Called after the callbacks added before it
+                processed = threading.Event()
+                processing.add_done_callback(lambda future: processed.set())
+                assert processed.wait(10)
+        assert "Background processing of an image failed" in logs.output[0]
+
+    @require_pil
+    def test_image_field_lazy_processing(self):
+        class TestImage(Document):
+            image = ImageField(thumbnail_size=(92, 18, True))
+            meta = {"collection": "test_image"}
+
+        class LazyTestImage(Document):
+            image = ImageField(
+                size=(185, 37, True),
+                thumbnail_size=(92, 18, True),
+                processing="lazy",
+            )
+            meta = {"collection": "test_image"}
+
+        TestImage.drop_collection()
+
+        t = LazyTestImage()
+        t.image.put(get_file(TEST_IMAGE_PATH))
+        t.save()
+        # Stored as is
+        assert self.db.images.files.find_one()["width"] == 371
+
+        t = LazyTestImage.objects.first()
+        assert t.image.size == (185, 37)
+        assert t.image.thumbnail.height == 18
+        assert self.db.images.files.count_documents({}) == 3
+
+        # Images stored before the field was lazy are processed too
+        TestImage(image=get_file(TEST_IMAGE_PATH)).save()
+        t = LazyTestImage.objects[1]
+        assert t.image.size == (185, 37)
+        assert self.db.images.files.count_documents({}) == 6
+
+        # Deleting an image deletes the generated ones, without processing it
+        t.image.delete()
+        assert self.db.images.files.count_documents({}) == 3
+        t = LazyTestImage()
+        t.image.put(get_file(TEST_IMAGE_PATH))
+        t.save()
+        with mock.patch.object(ImageGridFsProxy, "process") as process:
+            LazyTestImage.objects.get(id=t.id).image.delete()
+        process.assert_not_called()
+        assert self.db.images.files.count_documents({}) == 3
+
+    @require_pil
+    def test_image_field_invalid_processing(self):
+        with pytest.raises(ValueError, match="Invalid processing"):
+            ImageField(processing="later")
+
     def test_file_multidb(self):
         register_connection("test_files", "test_files")
 
@@ -1,4 +1,10 @@
+import threading
+from unittest import mock
+
+import pytest
+
 from mongoengine import *
+from mongoengine.context_managers import query_counter
 from tests.utils import MongoDBTestCase
 
 
@@ -295,3 +301,87 @@ class TestSequenceField(MongoDBTestCase):
         # Counter should still be at 10
         c = self.db["mongoengine.counters"].find_one({"_id": "person.id"})
         assert c["next"] == 10
+
+    def test_sequence_field_block_size(self):
+        class Person(Document):
+            id = SequenceField(primary_key=True, block_size=5)
+            name = StringField()
+
+        self.db["mongoengine.counters"].drop()
+        Person.drop_collection()
+        Person.id.set_next_value(0)
+
+        Person(name="Person 0").save()
+        c = self.db["mongoengine.counters"].find_one({"_id": "person.id"})
+        assert c["next"] == 5
+        assert Person.id.get_next_value() == 2
+
+        for x in range(1, 7):
+            Person(name="Person %s" % x).save()
+        c = self.db["mongoengine.counters"].find_one({"_id": "person.id"})
+        assert c["next"] == 10
+        assert [p.id for p in Person.objects.order_by("id")] == list(range(1, 8))
+
+        Person.id.set_next_value(100)
+        assert Person(name="Person 7").save().id == 101
+
+        with pytest.raises(ValueError):
+            SequenceField(block_size=0)
+
+    def test_sequence_field_block_reservations_are_per_sequence(self):
+        class Person(Document):
+            id = SequenceField(primary_key=True, block_size=5)
+            counter = SequenceField(block_size=5)
+
+        self.db["mongoengine.counters"].drop()
+        reserving = threading.Event()
+        release = threading.Event()
+        reserve = SequenceField._reserve
+
+        def slow_reserve(field, count, session=None):
+            if field.name == "id":
+                reserving.set()
+                assert release.wait(10)
+            return reserve(field, count, session=session)
+
+        with mock.patch.object(
+            SequenceField, "_reserve", autospec=True, side_effect=slow_reserve
+        ):
+            generated = []
+            thread = threading.Thread(target=Person.id.generate)
+            other = threading.Thread(
+                target=lambda: generated.append(Person.counter.generate())
+            )
+            thread.start()
+            try:
+                assert reserving.wait(10)
+                # Another sequence isn't held up by the pending reservation
+                other.start()
+                other.join(5)
+                assert generated == [1]
+            finally:
+                release.set()
+                thread.join()
+            other.join()
+
+    def test_sequence_field_insert(self):
+        class Person(Document):
+            id = SequenceField(primary_key=True)
+            counter = SequenceField()
+            name = StringField()
+
+        self.db["mongoengine.counters"].drop()
+        Person.drop_collection()
+
+        people = [Person(name="Person %s" % x) for x in range(10)]
+        people[3].counter = 100
+        with query_counter() as q:
+            Person.objects.insert(people, load_bulk=False)
+            # One increment per counter and the insert
+            assert q == 3
+
+        assert [p.id for p in people] == list(range(1, 11))
+        assert people[3].counter == 100
+        assert [p.counter for p in people if p.id != 4] == list(range(1, 10))
+        c = self.db["mongoengine.counters"].find_one({"_id": "person.id"})
+        assert c["next"] == 10
@@ -0,0 +1,62 @@
+import array
+
+import pytest
+from bson import Binary
+
+from mongoengine import *
+from tests.utils import MongoDBTestCase, get_as_pymongo
+
+
+class TestVectorField(MongoDBTestCase):
+    def test_storage(self):
+        class Chunk(Document):
+            embedding = VectorField("float32", dim=3)
+            codes = VectorField("int8", vector_subtype=True)
+
+        Chunk.drop_collection()
+
+        chunk = Chunk(embedding=[1, 2.5, -3], codes=array.array("b", [1, -2])).save()
+        assert get_as_pymongo(chunk) == {
+            "_id": chunk.id,
+            "embedding": Binary(array.array("f", [1, 2.5, -3]).tobytes()),
+            "codes": Binary(b"\x03\x00\x01\xfe", 9),
+        }
+
+        chunk = Chunk.objects.get()
+        assert isinstance(chunk.embedding, memoryview)
+        assert chunk.embedding.format == "f"
+        assert chunk.embedding.tolist() == [1.0, 2.5, -3.0]
+        assert chunk.codes.tolist() == [1, -2]
+        assert Chunk.objects(embedding=[1, 2.5, -3]).count() == 1
+
+        chunk.embedding = [4, 5, 6]
+        assert chunk._get_changed_fields() == ["embedding"]
+        chunk.save()
+        assert Chunk.objects.get().embedding.tolist() == [4.0, 5.0, 6.0]
+
+    def test_buffer_assignment(self):
+        class Chunk(Document):
+            embedding = VectorField("float64")
+
+        values = array.array("d", [1.5, 2.5])
+        chunk = Chunk(embedding=values)
+        # Buffers of the right type are not copied
+        assert chunk.embedding.obj is values
+        assert Chunk(embedding=array.array("f", [1.5])).embedding.tolist() == [1.5]
+
+    def test_validation(self):
+        class Chunk(Document):
+            embedding = VectorField("int8", dim=2)
+
+        Chunk(embedding=[1, -1]).validate()
+        with pytest.raises(ValidationError, match="Expected a vector of 2 dimensions"):
+            Chunk(embedding=[1, 2, 3]).validate()
+        with pytest.raises(ValidationError, match="sequences of int8 values"):
+            Chunk(embedding=[1000, 1]).validate()
+        with pytest.raises(ValidationError, match="sequences of int8 values"):
+            Chunk(embedding="ab").validate()
+
+        with pytest.raises(ValueError, match="Invalid dtype"):
+            VectorField("float16")
+        with pytest.raises(ValueError, match="can't hold float64 values"):
+            VectorField("float64", vector_subtype=True)
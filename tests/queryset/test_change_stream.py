@@ -0,0 +1,158 @@
+import unittest
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import OperationFailure
+
+from mongoengine import *
+from mongoengine.queryset.change_stream import (
+    ChangeEvent,
+    DocumentChangeStream,
+    full_document_match,
+)
+from tests.utils import MongoDBTestCase
+
+
+class FakeChangeStream:
+    """Stand-in for a pymongo change stream, replaying a list of events."""
+
+    def __init__(self, events):
+        self.events = list(events)
+        self.resume_token = None
+        self.alive = True
+
+    def __next__(self):
+        if not self.events:
+            raise StopIteration
+        change = self.events.pop(0)
+        self.resume_token = change["_id"]
+        return change
+
+    def try_next(self):
+        return next(self) if self.events else None
+
+    def close(self):
+        self.alive = False
+
+
+class TestDocumentChangeStream(MongoDBTestCase):
+    def setUp(self):
+        class Person(Document):
+            name = StringField(db_field="n")
+            age = IntField()
+            meta = {"allow_inheritance": True}
+
+        class Employee(Person):
+            salary = IntField()
+
+        self.Person = Person
+        self.Employee = Employee
+
+    def test_full_document_match(self):
+        query = self.Employee.objects(
+            Q(name="Ross") | Q(age__gt=40), salary__gte=10
+        )._query
+        assert full_document_match(query) == {
+            "$and": [
+                {"fullDocument.salary": {"$gte": 10}},
+                {
+                    "$or": [
+                        {"fullDocument.n": "Ross"},
+                        {"fullDocument.age": {"$gt": 40}},
+                    ]
+                },
+            ],
+            "fullDocument._cls": "Person.Employee",
+        }
+
+        with pytest.raises(InvalidQueryError):
+            full_document_match({"$text": {"$search": "Ross"}})
+
+    def test_events_are_hydrated(self):
+        events = [
+            {
+                "_id": {"_data": "1"},
+                "operationType": "insert",
+                "fullDocument": {
+                    "_id": ObjectId(),
+                    "_cls": "Person.Employee",
+                    "n": "Ross",
+                    "salary": 10,
+                },
+            },
+            {
+                "_id": {"_data": "2"},
+                "operationType": "delete",
+                "documentKey": {"_id": ObjectId()},
+            },
+        ]
+        stream = DocumentChangeStream(self.Person.objects, FakeChangeStream(events))
+
+        operation_type, employee, event = next(stream)
+        assert operation_type == "insert"
+        assert isinstance(employee, self.Employee)
+        assert (employee.name, employee.salary) == ("Ross", 10)
+        assert event is events[0]
+
+        assert next(stream) == ChangeEvent("delete", None, events[1])
+        with pytest.raises(StopIteration):
+            next(stream)
+
+    def test_resume_token_hook(self):
+        events = [
+            {"_id": {"_data": str(idx)}, "operationType": "delete"} for idx in range(3)
+        ]
+        tokens = []
+        with DocumentChangeStream(
+            self.Person.objects, FakeChangeStream(events), tokens.append
+        ) as stream:
+            next(stream)
+            # Tokens are handed to the hook once their event is processed
+            assert tokens == []
+            assert stream.try_next().event is events[1]
+            assert tokens == [{"_data": "0"}]
+
+        assert tokens == [{"_data": "0"}, {"_data": "1"}]
+        assert not stream.alive
+
+
+class TestWatch(MongoDBTestCase):
+    def setUp(self):
+        class Person(Document):
+            name = StringField()
+            age = IntField()
+
+        Person.drop_collection()
+        self.Person = Person
+        try:
+            Person._get_collection().watch().close()
+        except OperationFailure:
+            pytest.skip("Change streams require a replica set")
+
+    def test_watch(self):
+        with self.Person.objects(age__gte=18).watch() as stream:
+            self.Person(name="Kid", age=10).save()
+            adult = self.Person(name="Adult", age=30).save()
+            adult.update(age=31)
+
+            operation_type, person, _ = next(stream)
+            assert operation_type == "insert"
+            assert person.name == "Adult"
+
+            operation_type, person, _ = next(stream)
+            assert operation_type == "update"
+            assert person.age == 31
+
+    def test_watch_resume_after(self):
+        with self.Person.objects.watch() as stream:
+            self.Person(name="First").save()
+            self.Person(name="Second").save()
+            next(stream)
+            token = stream.resume_token
+
+        with self.Person.objects.watch(resume_after=token) as stream:
+            assert next(stream).document.name == "Second"
+
+
+if __name__ == "__main__":
+    unittest.main()
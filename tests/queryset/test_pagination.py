@@ -0,0 +1,111 @@
+import base64
+import datetime
+import json
+import unittest
+
+import pytest
+
+from mongoengine import *
+from tests.utils import MongoDBTestCase
+
+
+class TestKeysetPagination(MongoDBTestCase):
+    def setUp(self):
+        class Post(Document):
+            title = StringField()
+            created = DateTimeField()
+            rank = IntField()
+            meta = {"allow_inheritance": True}
+
+        class Article(Post):
+            pass
+
+        Post.drop_collection()
+        self.Post = Post
+        self.Article = Article
+
+        start = datetime.datetime(2020, 1, 1)
+        for idx in range(10):
+            # Pairs of documents share the same date
+            cls = Article if idx % 3 else Post
+            cls(
+                title="post %d" % idx,
+                created=start + datetime.timedelta(days=idx // 2),
+                rank=idx % 4,
+            ).save()
+
+    def _all_pages(self, queryset, **kwargs):
+        pages = []
+        token = None
+        while True:
+            page = queryset.paginate_by(after=token, **kwargs)
+            pages.append([post.title for post in page])
+            token = page.next_token
+            if token is None:
+                return pages
+
+    def test_paginate_by_keys(self):
+        pages = self._all_pages(self.Post.objects, keys=("-created", "id"), page_size=3)
+        expected = [post.title for post in self.Post.objects.order_by("-created", "id")]
+        assert [len(page) for page in pages] == [3, 3, 3, 1]
+        assert sum(pages, []) == expected
+
+    def test_paginate_by_mixed_directions(self):
+        pages = self._all_pages(
+            self.Post.objects, keys=("rank", "-created"), page_size=4
+        )
+        expected = [
+            post.title for post in self.Post.objects.order_by("rank", "-created", "-id")
+        ]
+        assert sum(pages, []) == expected
+
+    def test_paginate_by_defaults_to_ordering(self):
+        qs = self.Post.objects.order_by("-created")
+        assert sum(self._all_pages(qs, page_size=4), []) == [
+            post.title for post in qs.order_by("-created", "-id")
+        ]
+
+    def test_paginate_by_composes_with_filters(self):
+        qs = self.Article.objects(Q(rank__gte=1) | Q(title="post 0"))
+        pages = self._all_pages(qs, keys=("created",), page_size=2)
+        expected = [post.title for post in qs.order_by("created", "id")]
+        assert len(expected) == 4
+        assert sum(pages, []) == expected
+        assert all(isinstance(post, self.Article) for post in qs.paginate_by())
+
+    def test_paginate_by_as_pymongo(self):
+        page = self.Post.objects.as_pymongo().paginate_by(keys=("rank",), page_size=5)
+        assert len(page) == 5
+        page = self.Post.objects.as_pymongo().paginate_by(
+            keys=("rank",), page_size=5, after=page.next_token
+        )
+        assert [doc["rank"] for doc in page] == [1, 2, 2, 3, 3]
+        assert page.next_token is None
+
+    def test_paginate_by_invalid_tokens(self):
+        page = self.Post.objects.paginate_by(keys=("created",), page_size=2)
+
+        with pytest.raises(InvalidQueryError):
+            self.Post.objects.paginate_by(keys=("-created",), after=page.next_token)
+
+        with pytest.raises(InvalidQueryError):
+            self.Post.objects.paginate_by(keys=("created",), after="not a token")
+
+        # Crafted tokens can't inject query operators, nor malformed keys
+        for keys, values in (
+            ([["created", 1]], [{"$ne": None}]),
+            ([["rank", 1], ["_id", 1]], [{"$ne": None}, 1]),
+            ([1], [None]),
+            ([["created", 1]], {"created": None}),
+        ):
+            token = base64.urlsafe_b64encode(json.dumps([keys, values]).encode())
+            with pytest.raises(InvalidQueryError, match="Invalid pagination token"):
+                self.Post.objects.paginate_by(keys=("created",), after=token.decode())
+
+    def test_paginate_by_unloaded_key(self):
+        with pytest.raises(OperationError):
+            self.Post.objects.only("title").paginate_by(keys=("rank",), page_size=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+import pytest
+
+from mongoengine import *
+from mongoengine.queryset import Param
+from tests.utils import MongoDBTestCase
+
+
+class TestPreparedQuery(MongoDBTestCase):
+    def setUp(self):
+        class Person(Document):
+            name = StringField(db_field="n")
+            age = IntField()
+            tags = ListField(StringField())
+            meta = {"allow_inheritance": True}
+
+        Person.drop_collection()
+        self.Person = Person
+
+        for idx, name in enumerate(("alice", "bob", "carol", "bob")):
+            Person(name=name, age=20 + 10 * idx, tags=[name[0]]).save()
+
+    def test_execute_substitutes_converted_values(self):
+        prepared = self.Person.objects.prepare(name=Param("n"), age__gte=Param("a"))
+        assert prepared.params == {"n", "a"}
+
+        qs = prepared.execute(n="bob", a="30")
+        assert qs._query == {"n": "bob", "age": {"$gte": 30}, "_cls": "Person"}
+        assert [p.age for p in qs.order_by("age")] == [30, 50]
+
+        qs = prepared.execute(n="alice", a=0)
+        assert [p.name for p in qs] == ["alice"]
+
+    def test_execute_keeps_queryset_options(self):
+        prepared = (
+            self.Person.objects.order_by("-age")
+            .only("name")
+            .prepare(name__in=Param("names"))
+        )
+        people = list(prepared.execute(names=["bob", "alice"]))
+        assert [p.name for p in people] == ["bob", "bob", "alice"]
+        assert all(p.age is None for p in people)
+
+    def test_prepare_with_q_objects(self):
+        prepared = self.Person.objects.prepare(Q(name=Param("n")) | Q(tags=Param("t")))
+        qs = prepared.execute(n="alice", t="c")
+        assert sorted(p.name for p in qs) == ["alice", "carol"]
+
+    def test_executed_queryset_can_be_refined(self):
+        prepared = self.Person.objects.prepare(name=Param("n"))
+        qs = prepared.execute(n="bob").filter(age__gt=30)
+        assert [p.age for p in qs] == [50]
+
+    def test_execute_validates_params(self):
+        prepared = self.Person.objects.prepare(name=Param("n"), age=Param("a"))
+
+        with pytest.raises(InvalidQueryError, match="Missing value"):
+            prepared.execute(n="bob")
+
+        with pytest.raises(InvalidQueryError, match="Unknown parameter"):
+            prepared.execute(n="bob", a=30, x=1)
+
+    def test_param_not_supported_with_geo_and_match(self):
+        with pytest.raises(InvalidQueryError):
+            self.Person.objects.prepare(tags__match=Param("t"))
+
+    def test_raw_params_are_not_converted(self):
+        prepared = self.Person.objects.prepare(__raw__={"age": Param("a")})
+        assert prepared.execute(a=20).count() == 1
+        assert prepared.execute(a="20").count() == 0
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,7 @@ from pymongo.read_preferences import ReadPreference
 from pymongo.results import UpdateResult
 
 from mongoengine import *
+from mongoengine import signals
 from mongoengine.connection import get_db
 from mongoengine.context_managers import query_counter, switch_db
 from mongoengine.errors import InvalidQueryError
@@ -2069,6 +2070,76 @@ class TestQueryset(unittest.TestCase):
         self.Person.objects()[:1].delete()
         assert 1 == BlogPost.objects.count()
 
+    def test_delete_rules_applied_by_batches(self):
+        class BlogPost(Document):
+            author = ReferenceField(self.Person, reverse_delete_rule=CASCADE)
+            reviewer = ReferenceField(self.Person, reverse_delete_rule=NULLIFY)
+
+        class Comment(Document):
+            post = ReferenceField(BlogPost, reverse_delete_rule=CASCADE)
+
+        BlogPost.drop_collection()
+        Comment.drop_collection()
+
+        people = [self.Person(name="Person %d" % i).save() for i in range(5)]
+        keep = self.Person(name="Keep").save()
+        for person in people:
+            post = BlogPost(author=person, reviewer=keep).save()
+            Comment(post=post).save()
+        reviewed = BlogPost(author=keep, reviewer=people[0]).save()
+
+        progress = []
+        deleted = (
+            self.Person.objects(name__startswith="Person ")
+            .batch_size(2)
+            .delete(progress=lambda cls, count: progress.append((cls, count)))
+        )
+
+        assert deleted == 5
+        assert list(self.Person.objects) == [keep]
+        assert list(BlogPost.objects) == [reviewed]
+        assert reviewed.reload().reviewer is None
+        assert Comment.objects.count() == 0
+        # Each batch of people cascades to its posts, then to their comments
+        assert [count for cls, count in progress if cls is self.Person] == [2, 2, 1]
+        assert sum(count for cls, count in progress if cls is BlogPost) == 5
+        assert sum(count for cls, count in progress if cls is Comment) == 5
+
+    def test_delete_progress_with_subclasses(self):
+        """Ensure the progress of a delete sending signals is reported with
+        the class of the deleted documents.
+        """
+
+        class Animal(Document):
+            name = StringField()
+            meta = {"allow_inheritance": True}
+
+        class Dog(Animal):
+            pass
+
+        def pre_delete(sender, document, **kwargs):
+            pass
+
+        Animal.drop_collection()
+        Animal(name="Kitty").save()
+        Dog(name="Rex").save()
+        Dog(name="Fido").save()
+
+        progress = []
+        signals.pre_delete.connect(pre_delete, sender=Animal)
+        try:
+            Animal.objects.order_by("name").delete(
+                progress=lambda cls, count: progress.append((cls, count))
+            )
+        finally:
+            signals.pre_delete.disconnect(pre_delete, sender=Animal)
+
+        assert sorted(progress, key=lambda item: item[0].__name__) == [
+            (Animal, 1),
+            (Dog, 2),
+        ]
+        assert Animal.objects.count() == 0
+
     def test_delete_edge_case_with_write_concern_0_return_None(self):
         """Return None if the delete operation is unacknowledged.
 
@@ -4283,6 +4354,67 @@ class TestQueryset(unittest.TestCase):
 
         assert A.objects(b=[{"c": "c"}]).count() == 0
 
+    def test_estimated_count(self):
+        class Animal(Document):
+            name = StringField()
+            meta = {"allow_inheritance": True}
+
+        class Dog(Animal):
+            pass
+
+        Animal.drop_collection()
+        Animal(name="cat").save()
+        Dog(name="rex").save()
+
+        assert Animal.objects.estimated_count() == 2
+        assert Animal.objects.none().estimated_count() == 0
+
+        with pytest.raises(OperationError):
+            Animal.objects(name="cat").estimated_count()
+
+        # Subclasses only select part of the collection
+        with pytest.raises(OperationError):
+            Dog.objects.estimated_count()
+        with pytest.raises(OperationError):
+            Animal.objects.no_sub_classes().estimated_count()
+        assert Animal.objects.clear_cls_query().estimated_count() == 2
+
+    def test_cache_count(self):
+        class Post(Document):
+            title = StringField()
+
+        Post.drop_collection()
+        Post(title="a").save()
+        Post(title="b").save()
+
+        qs = Post.objects(title="a").cache_count(60)
+        assert qs.count() == 1
+
+        # The count is shared by querysets with the same filter, whatever
+        # their limit and skip
+        Post(title="a").save()
+        assert qs.count() == 1
+        assert Post.objects(title="a").cache_count(60).skip(1).count() == 1
+        assert qs.count(with_limit_and_skip=True) == 2
+        assert Post.objects(title="a").count() == 2
+        assert Post.objects(title="a").cache_count(60).cache_count(None).count() == 2
+
+        # Other filters are counted separately
+        assert Post.objects(title="b").cache_count(60).count() == 1
+
+        # Expired counts are refreshed
+        assert Post.objects(title="a").cache_count(0).count() == 2
+
+    def test_cache_count_uuid_filter(self):
+        # The filters are encoded with the codec options of the collection
+        class Token(Document):
+            uid = UUIDField()
+
+        Token.drop_collection()
+        Token(uid=uuid.uuid4()).save()
+        uid = Token.objects.get().uid
+        assert Token.objects(uid=uid).cache_count(60).count() == 1
+
     def test_call_after_limits_set(self):
         """Ensure that re-filtering after slicing works"""
 
@@ -4370,6 +4502,46 @@ class TestQueryset(unittest.TestCase):
 
         Number.drop_collection()
 
+    def test_clone_shares_state_until_modified(self):
+        """Ensure that clones share the query state with the queryset they
+        originate from, without being affected by its later refinements.
+        """
+
+        class Number(Document):
+            n = IntField()
+            m = IntField()
+            s = StringField()
+
+        qs = Number.objects.filter(n__gt=1).order_by("-n").only("n", "m")
+        qs_clone = qs.clone()
+        assert qs_clone._query_obj is qs._query_obj
+        assert qs_clone._ordering is qs._ordering
+        assert qs_clone._loaded_fields is qs._loaded_fields
+
+        qs_clone = qs_clone.exclude("m").filter(s="a").order_by("n")
+        assert qs._loaded_fields.as_dict() == {"n": 1, "m": 1}
+        assert qs_clone._loaded_fields.as_dict() == {"n": 1}
+        assert qs._query == {"n": {"$gt": 1}}
+        assert qs_clone._query == {"n": {"$gt": 1}, "s": "a"}
+        assert qs._ordering == [("n", -1)]
+
+    def test_clone_custom_queryset_init(self):
+        """Ensure that cloning a queryset with a custom constructor runs it."""
+
+        class CustomQuerySet(QuerySet):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.initialised = True
+
+        class Number(Document):
+            n = IntField()
+            meta = {"queryset_class": CustomQuerySet}
+
+        qs = Number.objects.filter(n=1).clone()
+        assert isinstance(qs, CustomQuerySet)
+        assert qs.initialised
+        assert qs._query == {"n": 1}
+
     def test_using(self):
         """Ensure that switching databases for a queryset is possible"""
 
@@ -5820,7 +5992,7 @@ class TestQueryset(unittest.TestCase):
         persons = [Person(name="No: %s" % i) for i in range(100)]
         Person.objects.insert(persons, load_bulk=True)
 
-        with query_counter() as q:
+        with db_ops_tracker() as q:
             if Person.objects:
                 pass
 
@@ -5843,7 +6015,7 @@ class TestQueryset(unittest.TestCase):
 
         # Check that bool(queryset) does not uses the orderby
         qs = Person.objects.order_by("name")
-        with query_counter() as q:
+        with db_ops_tracker() as q:
             if bool(qs):
                 pass
 
@@ -5855,7 +6027,7 @@ class TestQueryset(unittest.TestCase):
 
         # Check that normal query uses orderby
         qs2 = Person.objects.order_by("name")
-        with query_counter() as q:
+        with db_ops_tracker() as q:
             for x in qs2:
                 pass
 
@@ -5878,7 +6050,7 @@ class TestQueryset(unittest.TestCase):
         Person(name="C").save()
         Person(name="A").save()
 
-        with query_counter() as q:
+        with db_ops_tracker() as q:
             if Person.objects:
                 pass
 
@@ -1,4 +1,5 @@
 import datetime
+import os
 import unittest
 import uuid
 
@@ -13,12 +14,15 @@ from pymongo.errors import (
     InvalidOperation,
     OperationFailure,
 )
-from pymongo.read_preferences import Secondary
+from pymongo.read_preferences import Secondary, SecondaryPreferred
 
 import mongoengine.connection
 from mongoengine import (
     DateTimeField,
     Document,
+    IntField,
+    ReadReplicaRouter,
+    Router,
     StringField,
     connect,
     disconnect_all,
@@ -26,12 +30,17 @@ from mongoengine import (
 )
 from mongoengine.connection import (
     DEFAULT_DATABASE_NAME,
+    READ_PREFERENCE,
     ConnectionFailure,
     _get_connection_settings,
     disconnect,
     get_connection,
     get_db,
+    get_router,
+    set_router,
+    warm_up,
 )
+from mongoengine.context_managers import switch_db
 from mongoengine.pymongo_support import PYMONGO_VERSION
 
 
@@ -727,6 +736,212 @@ class ConnectionTest(unittest.TestCase):
         )
         disconnect(rand)
 
+    def test_router(self):
+        """Ensure the router of a document picks the database of each
+        operation, unless one is set explicitly.
+        """
+        connect("mongoenginetest")
+        register_connection("testdb-reports", "mongoenginetest2")
+
+        class ReportsRouter(Router):
+            def db_for_read(self, document, operation):
+                if operation == "aggregate":
+                    return "testdb-reports"
+
+            def db_for_write(self, document, operation):
+                if operation == "delete":
+                    return "testdb-reports"
+
+        class Sale(Document):
+            amount = IntField()
+            meta = {"db_router": ReportsRouter}
+
+        reports = get_db("testdb-reports").sale
+        Sale.drop_collection()
+        reports.drop()
+        reports.insert_one({"amount": 5})
+
+        Sale(amount=1).save()
+        Sale.objects.update(inc__amount=1)
+        assert [sale.amount for sale in Sale.objects] == [2]
+        assert Sale.objects.count() == 1
+        assert [doc["amount"] for doc in Sale.objects.aggregate([])] == [5]
+        assert isinstance(Sale._meta["db_router"], ReportsRouter)
+
+        # using() and switch_db bypass the router
+        assert Sale.objects.using("testdb-reports").count() == 1
+        Sale.objects.using("default").delete()
+        assert Sale.objects.count() == 0
+        assert reports.count_documents({}) == 1
+        with switch_db(Sale, "default") as Sale:
+            Sale(amount=3).save()
+            Sale.objects.delete()
+        assert reports.count_documents({}) == 1
+
+        Sale.objects.delete()
+        assert reports.count_documents({}) == 0
+        assert isinstance(Sale._meta["db_router"], ReportsRouter)
+
+    def test_router_in_bulk(self):
+        """Ensure in_bulk() is routed like the other reads."""
+        connect("mongoenginetest")
+        register_connection("testdb-reports", "mongoenginetest2")
+
+        class ReportsRouter(Router):
+            def db_for_read(self, document, operation):
+                if operation == "find":
+                    return "testdb-reports"
+
+        class Sale(Document):
+            amount = IntField()
+            meta = {"db_router": ReportsRouter}
+
+        reports = get_db("testdb-reports").sale
+        Sale.drop_collection()
+        reports.drop()
+        sale_id = reports.insert_one({"amount": 5}).inserted_id
+
+        sales = Sale.objects.in_bulk([sale_id])
+        assert [sale.amount for sale in sales.values()] == [5]
+        assert Sale.objects.using("default").in_bulk([sale_id]) == {}
+        reports.drop()
+
+    def test_set_router_class(self):
+        """Ensure a router class set globally is instantiated once, without
+        being stored in the meta of the documents it routes.
+        """
+        connect("mongoenginetest")
+
+        class Sale(Document):
+            amount = IntField()
+
+        set_router(ReadReplicaRouter)
+        try:
+            assert isinstance(get_router(Sale), ReadReplicaRouter)
+            assert get_router(Sale) is get_router(Sale)
+            assert "db_router" not in Sale._meta
+            qs = Sale.objects
+            assert (
+                qs._read_collection("find").read_preference
+                == ReadPreference.SECONDARY_PREFERRED
+            )
+        finally:
+            set_router(None)
+
+        assert get_router(Sale) is None
+        qs = Sale.objects
+        assert qs._read_collection("find").read_preference == READ_PREFERENCE
+
+    def test_read_replica_router(self):
+        """Ensure the global router routes the reads to the secondaries,
+        unless a read preference is set on the queryset.
+        """
+        connect("mongoenginetest")
+
+        class Sale(Document):
+            amount = IntField()
+
+        class Invoice(Document):
+            amount = IntField()
+            meta = {"db_router": None}
+
+        set_router(ReadReplicaRouter(max_staleness=120, operations=("find",)))
+        try:
+            qs = Sale.objects
+            assert qs._read_collection("find").read_preference == SecondaryPreferred(
+                max_staleness=120
+            )
+            assert qs._read_collection("count").read_preference == READ_PREFERENCE
+            assert qs._write_collection("update") is qs._collection
+            assert (
+                qs.read_preference(ReadPreference.PRIMARY)
+                ._read_collection("find")
+                .read_preference
+                == ReadPreference.PRIMARY
+            )
+            qs = Invoice.objects
+            assert qs._read_collection("find").read_preference == READ_PREFERENCE
+        finally:
+            set_router(None)
+
+        with pytest.raises(ValueError):
+            ReadReplicaRouter(
+                read_preference=ReadPreference.SECONDARY, max_staleness=120
+            )
+
+    def test_warm_up(self):
+        """Ensure warm_up() connects the aliases and creates the indexes of
+        their documents.
+        """
+        register_connection("default", "mongoenginetest")
+        register_connection("testdb-warm", "mongoenginetest2")
+
+        class Customer(Document):
+            email = StringField()
+            meta = {"indexes": ["email"], "db_alias": "testdb-warm"}
+
+        Customer._collection = None
+        Customer._get_db().customer.drop()
+        Customer._collection = None
+
+        warm_up("testdb-warm", min_pool_size=2)
+        assert "testdb-warm" in mongoengine.connection._connections
+        assert "default" not in mongoengine.connection._connections
+        assert Customer._collection is not None
+        assert "email_1" in Customer._get_db().customer.index_information()
+        client = get_connection("testdb-warm")
+        assert client.options.pool_options.min_pool_size == 2
+
+        warm_up()
+        assert "default" in mongoengine.connection._connections
+
+    def test_warm_up_without_auto_create_index(self):
+        """Ensure warm_up() creates the indexes of the documents which don't
+        create them automatically, and warns when the pool size can't apply.
+        """
+        register_connection("testdb-warm", "mongoenginetest2")
+
+        class Customer(Document):
+            email = StringField()
+            meta = {
+                "indexes": ["email"],
+                "db_alias": "testdb-warm",
+                "auto_create_index": False,
+            }
+
+        Customer.drop_collection()
+        warm_up("testdb-warm")
+        assert "email_1" in Customer._get_collection().index_information()
+
+        # A client shared with an alias of the same settings keeps its options
+        register_connection("testdb-warm-bis", "mongoenginetest2")
+        with pytest.warns(UserWarning, match="minPoolSize are ignored"):
+            warm_up("testdb-warm-bis", min_pool_size=2)
+        assert get_connection("testdb-warm-bis") is get_connection("testdb-warm")
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_connections_reset_after_fork(self):
+        """Ensure the clients and the cached collections aren't inherited by
+        forked processes.
+        """
+        connect("mongoenginetest")
+
+        class Customer(Document):
+            email = StringField()
+
+        Customer._get_collection()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            reset = (
+                not mongoengine.connection._connections
+                and Customer._collection is None
+                and "default" in mongoengine.connection._connection_settings
+            )
+            os._exit(0 if reset else 1)
+        _, status = os.waitpid(pid, 0)
+        assert os.WEXITSTATUS(status) == 0
+        assert Customer._collection is not None
+
 
 if __name__ == "__main__":
     unittest.main()
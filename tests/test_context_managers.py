@@ -11,6 +11,7 @@ from bson import DBRef
 from mongoengine import *
 from mongoengine.connection import _get_session, get_db
 from mongoengine.context_managers import (
+    lazy_dereference_detector,
     no_dereference,
     no_sub_classes,
     query_counter,
@@ -363,34 +364,73 @@ class TestContextManagers(MongoDBTestCase):
             with no_sub_classes(User):
                 raise TypeError()
 
+    def test_lazy_dereference_detector(self):
+        class Author(Document):
+            name = StringField()
+
+        class Book(Document):
+            author = ReferenceField(Author)
+            reviewers = ListField(ReferenceField(Author))
+            lazy_author = LazyReferenceField(Author)
+
+        Author.drop_collection()
+        Book.drop_collection()
+        for idx in range(3):
+            author = Author(name=str(idx)).save()
+            Book(author=author, reviewers=[author], lazy_author=author).save()
+
+        with lazy_dereference_detector(threshold=3) as detector:
+            for book in Book.objects:
+                assert book.author.name
+                assert book.reviewers[0].name
+                assert book.lazy_author.fetch().name
+        assert detector.counts == {
+            "Book.author": 3,
+            "Book.reviewers": 3,
+            "Book.lazy_author": 3,
+        }
+
+        with lazy_dereference_detector(threshold=2, raise_error=True):
+            books = Book.objects.select_related()
+            assert [book.reviewers[0].name for book in books] == ["0", "1", "2"]
+            with pytest.raises(OperationError, match="Book.author"):
+                for book in Book.objects:
+                    assert book.author.name
+
+        with self.assertLogs(level="WARNING") as logs:
+            with lazy_dereference_detector(threshold=2):
+                for book in Book.objects:
+                    assert book.reviewers[0].name
+        assert "Book.reviewers" in logs.output[0]
+
     def test_query_counter_does_not_swallow_exception(self):
         with pytest.raises(TypeError):
             with query_counter():
                 raise TypeError()
 
-    def test_query_counter_temporarily_modifies_profiling_level(self):
+    def test_query_counter_does_not_modify_profiling_level(self):
         db = get_db()
 
         def _current_profiling_level():
             return db.command({"profile": -1})["was"]
 
-        def _set_profiling_level(lvl):
-            db.command({"profile": lvl})
-
         initial_profiling_level = _current_profiling_level()
+        with query_counter():
+            assert _current_profiling_level() == initial_profiling_level
 
-        try:
-            new_level = 1
-            _set_profiling_level(new_level)
-            assert _current_profiling_level() == new_level
-            with query_counter():
-                assert _current_profiling_level() == 2
-            assert _current_profiling_level() == new_level
-        except Exception:
-            _set_profiling_level(
-                initial_profiling_level
-            )  # Ensures it gets reseted no matter the outcome of the test
-            raise
+    def test_query_counter_ignores_other_threads(self):
+        collection = get_db().query_counter
+        collection.drop()
+
+        with query_counter() as q:
+            thread = Thread(target=collection.find_one)
+            thread.start()
+            thread.join()
+            assert q == 0
+
+            collection.find_one()
+            assert q == 1
+            assert next(iter(q.commands[0])) == "find"
 
     def test_query_counter(self):
         db = get_db()
@@ -534,6 +574,28 @@ class TestContextManagers(MongoDBTestCase):
         assert A.objects.count() == 1
         assert A.objects.get(id=a_doc.id).name == "b"
 
+    @requires_mongodb_gte_40
+    def test_routed_document_within_a_transaction(self):
+        class A(Document):
+            name = StringField()
+            meta = {"db_router": ReadReplicaRouter}
+
+        A.drop_collection()
+
+        a_doc = A.objects.create(name="a")
+
+        with run_in_transaction():
+            qs = A.objects
+            assert qs._read_collection("find") is qs._collection
+            a_doc.update(name="b")
+            A(name="c").save()
+            assert A.objects.get(id=a_doc.id).name == "b"
+            assert A.objects.in_bulk([a_doc.id])[a_doc.id].name == "b"
+            assert A.objects.count() == 2
+
+        assert A.objects.count() == 2
+        assert A.objects.get(id=a_doc.id).name == "b"
+
     @requires_mongodb_gte_40
     def test_updating_a_document_within_a_transaction_that_fails(self):
         class A(Document):
@@ -0,0 +1,144 @@
+import unittest
+
+from mongoengine import *
+from mongoengine import instrumentation
+from tests.utils import MongoDBTestCase
+
+
+class TestInstrumentation(MongoDBTestCase):
+    def setUp(self):
+        class Author(Document):
+            name = StringField()
+
+        class Book(Document):
+            title = StringField(db_field="t")
+            pages = IntField()
+            author = ReferenceField(Author)
+            authors = ListField(ReferenceField(Author))
+
+        Author.drop_collection()
+        Book.drop_collection()
+        self.Author = Author
+        self.Book = Book
+
+        self.events = []
+        instrumentation.register(self.events.append)
+
+    def tearDown(self):
+        instrumentation.unregister(self.events.append)
+        super().tearDown()
+
+    def _events(self, operation):
+        return [event for event in self.events if event.operation == operation]
+
+    def test_query_shape(self):
+        assert instrumentation.query_shape(
+            {"a": 1, "b": {"$in": [1, 2]}, "$or": [{"c": "x"}, {"d": {"$gt": 3}}]}
+        ) == {"a": "?", "b": {"$in": "?"}, "$or": [{"c": "?"}, {"d": {"$gt": "?"}}]}
+
+    def test_find_events(self):
+        for idx in range(3):
+            self.Book(title="Book %d" % idx, pages=idx * 100).save()
+        del self.events[:]
+
+        assert len(list(self.Book.objects(pages__gte=100))) == 2
+        (event,) = self._events("find")
+        assert event.document is self.Book
+        assert event.collection == "book"
+        assert event.query_shape == {"pages": {"$gte": "?"}}
+        assert event.docs_returned == 2
+        assert 0 <= event.decode_time <= event.duration
+
+        assert self.Book.objects(title="Book 0").first().pages == 0
+        event = self._events("find")[-1]
+        assert event.query_shape == {"t": "?"}
+        assert event.docs_returned == 1
+
+    def test_find_events_partial_iteration(self):
+        for idx in range(3):
+            self.Book(title="Book %d" % idx, pages=idx * 100).save()
+        del self.events[:]
+
+        books = self.Book.objects.order_by("pages")
+        assert next(books).title == "Book 0"
+        assert self._events("find") == []
+
+        # Published when the cursor is rewound or discarded
+        books.rewind()
+        (event,) = self._events("find")
+        assert event.docs_returned == 1
+        assert [next(books).title, next(books).title] == ["Book 0", "Book 1"]
+        del books
+        event = self._events("find")[-1]
+        assert len(self._events("find")) == 2
+        assert event.query_shape == {}
+        assert event.docs_returned == 2
+        assert 0 <= event.decode_time <= event.duration
+
+    def test_queryset_operations(self):
+        self.Book(title="A", pages=10).save()
+        del self.events[:]
+
+        assert self.Book.objects(pages=10).count() == 1
+        self.Book.objects(pages=10).update(inc__pages=1)
+        assert self.Book.objects.distinct("pages") == [11]
+        self.Book.objects(pages=11).delete()
+
+        # distinct() goes through the dereferencing of the values
+        events = [event for event in self.events if event.operation != "dereference"]
+        assert [event.operation for event in events] == [
+            "count",
+            "update",
+            "distinct",
+            "delete",
+        ]
+        assert events[0].query_shape == {"pages": "?"}
+        assert events[2].docs_returned == 1
+        assert all(event.collection == "book" for event in events)
+
+    def test_document_operations(self):
+        book = self.Book(title="A").save()
+        book.reload()
+        book.delete()
+
+        for operation in ("save", "reload", "delete"):
+            # The queries run by the document come first
+            event = self._events(operation)[-1]
+            assert event.document is self.Book
+            assert event.query_shape is None
+            assert event.duration >= 0
+
+    def test_dereference_events(self):
+        authors = [self.Author(name=str(idx)).save() for idx in range(3)]
+        self.Book(title="A", authors=authors).save()
+        del self.events[:]
+
+        book = self.Book.objects.first()
+        assert [author.name for author in book.authors] == ["0", "1", "2"]
+
+        (event,) = self._events("dereference")
+        assert event.document is self.Book
+        assert event.dereferences == 3
+        assert event.docs_returned == 3
+
+    def test_no_listener(self):
+        instrumentation.unregister(self.events.append)
+        self.Book(title="A").save()
+        list(self.Book.objects)
+        assert self.events == []
+
+    def test_failing_listener_is_logged(self):
+        def failing_listener(event):
+            raise ValueError()
+
+        instrumentation.register(failing_listener)
+        try:
+            with self.assertLogs("mongoengine.instrumentation", level="ERROR"):
+                self.Book(title="A").save()
+        finally:
+            instrumentation.unregister(failing_listener)
+        assert self._events("save")
+
+
+if __name__ == "__main__":
+    unittest.main()
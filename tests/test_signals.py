@@ -1,7 +1,10 @@
+import gc
 import unittest
+import weakref
 
 from mongoengine import *
 from mongoengine import signals
+from mongoengine.connection import get_db
 
 signal_output = []
 
@@ -394,6 +397,88 @@ class TestSignal(unittest.TestCase):
             {},
         ]
 
+    def test_queryset_delete_signals_by_batches(self):
+        def pre_delete_bulk(sender, documents, **kwargs):
+            signal_output.append(("pre_delete_bulk", [doc.name for doc in documents]))
+
+        def post_delete_bulk(sender, documents, **kwargs):
+            signal_output.append(
+                ("post_delete_bulk", sender.objects.count(), kwargs["reason"])
+            )
+
+        for name in ("Bill", "Will", "Jill"):
+            self.Another(name=name).save()
+
+        signals.pre_delete_bulk.connect(pre_delete_bulk, sender=self.Another)
+        signals.post_delete_bulk.connect(post_delete_bulk, sender=self.Another)
+        try:
+            output = self.get_signal_output(
+                self.Another.objects.order_by("name").batch_size(2).delete,
+                signal_kwargs={"reason": "purge"},
+            )
+        finally:
+            signals.pre_delete_bulk.disconnect(pre_delete_bulk, sender=self.Another)
+            signals.post_delete_bulk.disconnect(post_delete_bulk, sender=self.Another)
+
+        # The per document signals are sent around each batch deleted at once
+        assert output == [
+            "pre_delete signal, Bill",
+            {"reason": "purge"},
+            "pre_delete signal, Jill",
+            {"reason": "purge"},
+            ("pre_delete_bulk", ["Bill", "Jill"]),
+            "post_delete signal, Bill",
+            {"reason": "purge"},
+            "post_delete signal, Jill",
+            {"reason": "purge"},
+            ("post_delete_bulk", 1, "purge"),
+            "pre_delete signal, Will",
+            {"reason": "purge"},
+            ("pre_delete_bulk", ["Will"]),
+            "post_delete signal, Will",
+            {"reason": "purge"},
+            ("post_delete_bulk", 0, "purge"),
+        ]
+
+    def test_queryset_delete_signals_with_subclasses(self):
+        class Animal(Document):
+            name = StringField()
+            meta = {"allow_inheritance": True}
+
+        class Dog(Animal):
+            photo = FileField()
+
+        def animal_pre_delete(sender, document, **kwargs):
+            signal_output.append(("Animal pre_delete", sender, document.name))
+
+        def dog_post_delete(sender, document, **kwargs):
+            signal_output.append(("Dog post_delete", sender, document.name))
+
+        Animal.drop_collection()
+        Animal(name="Kitty").save()
+        dog = Dog(name="Rex")
+        dog.photo.put(b"woof", content_type="image/jpeg")
+        dog.save()
+        fs = get_db()["fs.files"]
+        assert fs.count_documents({"_id": dog.photo.grid_id}) == 1
+
+        signals.pre_delete.connect(animal_pre_delete, sender=Animal)
+        signals.post_delete.connect(dog_post_delete, sender=Dog)
+        try:
+            output = self.get_signal_output(Animal.objects.order_by("name").delete)
+        finally:
+            signals.pre_delete.disconnect(animal_pre_delete, sender=Animal)
+            signals.post_delete.disconnect(dog_post_delete, sender=Dog)
+
+        # The signals are sent with the class of each document as sender, as
+        # Document.delete would, and the FileFields of the subclass are deleted
+        assert output == [
+            ("Animal pre_delete", Animal, "Kitty"),
+            ("Dog post_delete", Dog, "Rex"),
+        ]
+        assert Animal.objects.count() == 0
+        assert fs.count_documents({"_id": dog.photo.grid_id}) == 0
+
     def test_signals_with_explicit_doc_ids(self):
         """Model saves must have a created flag the first time."""
         ei = self.ExplicitId(id=123)
@@ -448,6 +533,86 @@ class TestSignal(unittest.TestCase):
             {},
         ]
 
+    def test_has_receivers_for(self):
+        class Comment(Document):
+            text = StringField()
+
+        def receiver(sender, documents, **kwargs):
+            pass
+
+        assert not signals.post_save_bulk.has_receivers_for(Comment)
+        signals.post_save_bulk.connect(receiver, sender=Comment)
+        assert signals.post_save_bulk.has_receivers_for(Comment)
+        assert not signals.post_save_bulk.has_receivers_for(self.Another)
+        signals.post_save_bulk.disconnect(receiver, sender=Comment)
+        assert not signals.post_save_bulk.has_receivers_for(Comment)
+
+        signals.post_save_bulk.connect(receiver)
+        assert signals.post_save_bulk.has_receivers_for(Comment)
+        signals.post_save_bulk.disconnect(receiver)
+        assert not signals.post_save_bulk.has_receivers_for(Comment)
+
+    def test_has_receivers_for_cache(self):
+        class Sender:
+            pass
+
+        def receiver(sender, documents, **kwargs):
+            pass
+
+        # A receiver connected while the receivers are being looked up is
+        # not hidden by a stale cached result
+        receivers_for = signals.post_save_bulk.receivers_for
+
+        def connect_while_looking_up(sender):
+            receivers = list(receivers_for(sender))
+            signals.post_save_bulk.connect(receiver, sender=Sender)
+            return receivers
+
+        signals.post_save_bulk.receivers_for = connect_while_looking_up
+        try:
+            signals.post_save_bulk.has_receivers_for(Sender)
+        finally:
+            del signals.post_save_bulk.receivers_for
+        try:
+            assert signals.post_save_bulk.has_receivers_for(Sender)
+        finally:
+            signals.post_save_bulk.disconnect(receiver, sender=Sender)
+        assert not signals.post_save_bulk.has_receivers_for(Sender)
+
+        # The cache doesn't keep the senders alive
+        sender_ref = weakref.ref(Sender)
+        del Sender
+        gc.collect()
+        assert sender_ref() is None
+
+    def test_bulk_signals(self):
+        def post_init_bulk(sender, documents, **kwargs):
+            signal_output.append(("post_init_bulk", [doc.title for doc in documents]))
+
+        def post_save_bulk(sender, documents, created, **kwargs):
+            signal_output.append(
+                ("post_save_bulk", [doc.title for doc in documents], created)
+            )
+
+        signals.post_init_bulk.connect(post_init_bulk, sender=self.Post)
+        signals.post_save_bulk.connect(post_save_bulk, sender=self.Post)
+        try:
+            posts = [self.Post(title="Post %d" % idx) for idx in range(3)]
+            output = self.get_signal_output(
+                self.Post.objects.insert, posts, load_bulk=False
+            )
+            assert ("post_save_bulk", ["Post 0", "Post 1", "Post 2"], True) in output
+            assert all(doc.pk for doc in posts)
+
+            output = self.get_signal_output(list, self.Post.objects.order_by("title"))
+            assert output == [("post_init_bulk", ["Post 0", "Post 1", "Post 2"])]
+
+            # No signal for the results which aren't documents
+            assert self.get_signal_output(list, self.Post.objects.scalar("title")) == []
+        finally:
+            signals.post_init_bulk.disconnect(post_init_bulk, sender=self.Post)
+            signals.post_save_bulk.disconnect(post_save_bulk, sender=self.Post)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,9 +6,13 @@ import pymongo
 import pytest
 
 from mongoengine import connect
-from mongoengine.connection import disconnect_all, get_db
-from mongoengine.context_managers import query_counter
+from mongoengine.connection import (
+    DEFAULT_CONNECTION_NAME,
+    disconnect_all,
+    get_db,
+)
 from mongoengine.mongodb_support import get_mongodb_version
+from mongoengine.pymongo_support import count_documents
 
 PYMONGO_VERSION = tuple(pymongo.version_tuple[:2])
 
@@ -98,10 +102,53 @@ def _decorated_with_ver_requirement(func, mongo_version_req, oper):
     return _inner
 
 
-class db_ops_tracker(query_counter):
+class db_ops_tracker:
+    """Context manager giving access to the operations run against the
+    database, recorded by its profiler (which it enables while active).
+
+    Like `query_counter` it compares to the number of operations, but it
+    also counts the operations of other clients, threads and processes.
+    """
+
+    def __init__(self, alias=DEFAULT_CONNECTION_NAME):
+        self.db = get_db(alias=alias)
+        self.initial_profiling_level = None
+        self._ctx_query_counter = 0  # number of queries issued by the context
+
+        self._ignored_query = {
+            "ns": {"$ne": "%s.system.indexes" % self.db.name},
+            "op": {"$ne": "killcursors"},  # MONGODB < 3.2
+            "command.killCursors": {"$exists": False},  # MONGODB >= 3.2
+        }
+
+    def __enter__(self):
+        profile_update_res = self.db.command({"profile": 0})
+        self.initial_profiling_level = profile_update_res["was"]
+
+        self.db.system.profile.drop()
+        self.db.command({"profile": 2})
+        return self
+
+    def __exit__(self, t, value, traceback):
+        self.db.command({"profile": self.initial_profiling_level})
+
+    def __eq__(self, value):
+        return value == self._get_count()
+
+    def _get_count(self):
+        """Count the new entries of db.system.profile, leaving out the
+        queries issued by this context to count them.
+        """
+        count = (
+            count_documents(self.db.system.profile, self._ignored_query)
+            - self._ctx_query_counter
+        )
+        self._ctx_query_counter += 1
+        return count
+
     def get_ops(self):
         ignore_query = dict(self._ignored_query)
         ignore_query["command.count"] = {
             "$ne": "system.profile"
-        }  # Ignore the query issued by query_counter
+        }  # Ignore the query issued by the tracker
         return list(self.db.system.profile.find(ignore_query))